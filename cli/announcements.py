@@ -1,30 +1,50 @@
 import getpass
-import requests
 from rich.console import Console
 from rich.panel import Panel
 
 from cli.config import CLI_CONFIG
+from tradingagents.dataflows import http_transport
 
 
 def fetch_announcements(url: str = None, timeout: float = None) -> dict:
     """Fetch announcements from endpoint. Returns dict with announcements and settings."""
     endpoint = url or CLI_CONFIG["announcements_url"]
     timeout = timeout or CLI_CONFIG["announcements_timeout"]
-    fallback = CLI_CONFIG["announcements_fallback"]
 
     try:
-        response = requests.get(endpoint, timeout=timeout)
+        # No retries: a slow endpoint must not delay CLI startup
+        response = http_transport.get(endpoint, timeout=timeout, retries=0)
         response.raise_for_status()
-        data = response.json()
-        return {
-            "announcements": data.get("announcements", [fallback]),
-            "require_attention": data.get("require_attention", False),
-        }
+        return _parse_announcements(response.json())
     except Exception:
+        return _parse_announcements(None)
+
+
+async def afetch_announcements(url: str = None, timeout: float = None) -> dict:
+    """Async ``fetch_announcements``."""
+    endpoint = url or CLI_CONFIG["announcements_url"]
+    timeout = timeout or CLI_CONFIG["announcements_timeout"]
+
+    try:
+        async with http_transport.client_scope():
+            response = await http_transport.aget(endpoint, timeout=timeout, retries=0)
+            response.raise_for_status()
+            return _parse_announcements(response.json())
+    except Exception:
+        return _parse_announcements(None)
+
+
+def _parse_announcements(data) -> dict:
+    fallback = CLI_CONFIG["announcements_fallback"]
+    if data is None:
         return {
             "announcements": [fallback],
             "require_attention": False,
         }
+    return {
+        "announcements": data.get("announcements", [fallback]),
+        "require_attention": data.get("require_attention", False),
+    }
 
 
 def display_announcements(console: Console, data: dict) -> None:
@@ -1,8 +1,6 @@
 from datetime import datetime
 import os
 import httpx
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ==============================================================================
 # 1. 从 GitHub Secrets 动态加载密钥 (绝不暴露明文)
@@ -16,6 +14,8 @@ os.environ["BRAVE_API_KEY"] = brave_key
 
 av_keys_raw = os.getenv("AV_KEYS", "")
 alpha_vantage_keys = [k.strip() for k in av_keys_raw.split(",") if k.strip()]
+# 所有 Key 交给 Alpha Vantage Key 池统一调度（按剩余额度自动选择）
+os.environ["ALPHA_VANTAGE_API_KEYS"] = ",".join(alpha_vantage_keys)
 
 # 【修改】安全检查：确保三种 Key 都有配置
 if not alpha_vantage_keys or not openai_key or not brave_key:
@@ -52,6 +52,8 @@ openai.OpenAI.__init__ = patched_sync_init
 # ==============================================================================
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.dataflows.price_store import prefetch_universe
+from tradingagents.dataflows.alpha_vantage_common import get_quota_report
 
 config = DEFAULT_CONFIG.copy()
 config["llm_provider"] = "openai"        
@@ -66,30 +68,14 @@ if not os.path.exists(reports_dir):
 
 stock_list = ["AMZN","VTI","TSM","NOW","NVDA","MSFT","AMD"]
 
-# 增加一个线程锁，专门用来防止初始化时 API Key 被覆盖
-init_lock = threading.Lock()
+# 同时运行的分析任务数
+MAX_CONCURRENCY = 3
 
 # ==============================================================================
 # 核心执行函数：提取 State 并完美保存
 # ==============================================================================
-def process_stock(stock, current_key):
-    # 自动获取今天日期，格式为 YYYY-MM-DD
-    today_str = datetime.today().strftime('%Y-%m-%d')
-    
-    # 使用锁来确保：修改环境变量 -> 初始化 Agent 这一步是安全的
-    with init_lock:
-        os.environ["ALPHA_VANTAGE_API_KEY"] = current_key
-        print(f"\n=============================================")
-        print(f"🔍 正在启动分析: {stock} ... (当前使用数据 Key: {current_key[:4]}****)")
-        print(f"=============================================")
-        
-        # ⚠️ 必须在锁内初始化！
-        ta = TradingAgentsGraph(debug=True, config=config)
-
+def save_report(stock, today_str, final_state, decision):
     try:
-        # 接收返回的 state（包含了所有历史对话记录）
-        final_state, decision = ta.propagate(stock, today_str)
-        
         print(f"\n📊 【{stock}】分析完成！正在保存全量对话报告...")
         
         # 将最终的内容保存为 txt 文件
@@ -155,22 +141,36 @@ def process_stock(stock, current_key):
         return f"✅ 【{stock}】全量深度报告已成功保存至: {file_path}"
         
     except Exception as e:
-        return f"❌ 【{stock}】分析失败，错误信息: {e}"
+        return f"❌ 【{stock}】报告保存失败，错误信息: {e}"
 
 # ==============================================================================
-# 主入口：用 ThreadPoolExecutor 并发执行
+# 主入口：一个共享的 TradingAgentsGraph 并发执行所有任务
+# （LLM 客户端、编译好的图和数据缓存只创建一次）
 # ==============================================================================
 if __name__ == "__main__":
-    print(f"🚀 开始批量运行测试并启用 API Key 自动轮询机制 (并发数: 3)...")
+    print(f"🚀 开始批量运行测试并启用 API Key 池 (并发数: {MAX_CONCURRENCY})...")
     print(f"✅ 成功加载 {len(alpha_vantage_keys)} 个 Alpha Vantage API Keys")
-    
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        futures = []
-        for i, stock in enumerate(stock_list):
-            key = alpha_vantage_keys[i % len(alpha_vantage_keys)]
-            futures.append(executor.submit(process_stock, stock, key))
-            
-        for future in as_completed(futures):
-            print(future.result())
+
+    # 批量预取整个股票池的历史行情，后续各个分析任务直接命中本地缓存
+    prefetch_status = prefetch_universe(stock_list)
+    for stock, status in prefetch_status.items():
+        print(f"📦 行情预取 {stock}: {status}")
+
+    # 自动获取今天日期，格式为 YYYY-MM-DD
+    today_str = datetime.today().strftime('%Y-%m-%d')
+    ta = TradingAgentsGraph(debug=True, config=config)
+    jobs = [(stock, today_str) for stock in stock_list]
+
+    # 每个任务完成后立即返回结果（含耗时与错误信息）
+    for result in ta.propagate_many(jobs, max_concurrency=MAX_CONCURRENCY):
+        stock = result["ticker"]
+        if result["error"] is not None:
+            print(f"❌ 【{stock}】分析失败 (耗时 {result['seconds']:.0f} 秒)，错误信息: {result['error']}")
+            continue
+        print(f"⏱️ 【{stock}】分析耗时 {result['seconds']:.0f} 秒")
+        print(save_report(stock, today_str, result["final_state"], result["decision"]))
+
+    for quota in get_quota_report():
+        print(f"🔑 Alpha Vantage Key {quota['key']}: 今日剩余 {quota['day_remaining']} 次, 本分钟剩余 {quota['minute_remaining']} 次")
             
     print("\n🎉 所有股票分析任务已全部结束！请在 Artifacts 中下载深度研报。")
@@ -0,0 +1,141 @@
+"""Shared fixtures: stored price bars, an offline chat model and a graph built on it."""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+
+@pytest.fixture
+def store_prices(tmp_path):
+    """Write random-walk daily bars into a price store under ``tmp_path``.
+
+    The store is marked as refreshed today, so reads never hit the network.
+    """
+    pytest.importorskip("pyarrow")
+    from tradingagents.dataflows import price_store
+    from tradingagents.dataflows.config import use_config
+
+    today = pd.Timestamp.today().strftime("%Y-%m-%d")
+
+    def write(symbol, start="2023-01-02", periods=300, fetched_at="2024-01-01 18:00:00"):
+        rng = np.random.default_rng(0)
+        close = 100 + np.cumsum(rng.normal(0, 1, periods))
+        data = pd.DataFrame(
+            {
+                "Open": close,
+                "High": close + 1,
+                "Low": close - 1,
+                "Close": close,
+                "Volume": rng.integers(1_000, 5_000, periods),
+            },
+            index=pd.DatetimeIndex(pd.bdate_range(start, periods=periods), name="Date"),
+        )
+        data = price_store.normalize_prices(data)
+        price_store.write_prices(symbol, data, fetched_on=today, fetched_at=fetched_at)
+        return data
+
+    with use_config({"data_cache_dir": str(tmp_path)}):
+        yield write
+
+
+class FakeChatModel(BaseChatModel):
+    """Answers every prompt with ``REPORT: <first human message>`` and never calls tools.
+
+    Each call sleeps ``delay`` seconds, so concurrent runs overlap; the
+    highest number of calls in flight at once is kept in ``peak``.
+    """
+
+    delay: float = 0.02
+    calls: int = 0
+    active: int = 0
+    peak: int = 0
+    lock: object = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = threading.Lock()
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _answer(self, messages) -> ChatResult:
+        human = next((m for m in messages if isinstance(m, HumanMessage)), messages[-1])
+        message = AIMessage(content=f"REPORT: {str(human.content)[:80]}")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _enter(self):
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def _exit(self):
+        with self.lock:
+            self.active -= 1
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self._enter()
+        try:
+            time.sleep(self.delay)
+            return self._answer(messages)
+        finally:
+            self._exit()
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        self._enter()
+        try:
+            await asyncio.sleep(self.delay)
+            return self._answer(messages)
+        finally:
+            self._exit()
+
+
+@pytest.fixture
+def fake_llm():
+    return FakeChatModel()
+
+
+@pytest.fixture
+def make_graph(fake_llm, tmp_path, monkeypatch):
+    """Build a ``TradingAgentsGraph`` on ``fake_llm`` that only writes under ``tmp_path``."""
+    pytest.importorskip("rank_bm25")
+    pytest.importorskip("langchain_anthropic")
+    pytest.importorskip("langchain_google_genai")
+    from tradingagents.dataflows import config as dataflows_config
+    from tradingagents.default_config import DEFAULT_CONFIG
+    from tradingagents.graph import trading_graph
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            pass
+
+        def get_llm(self):
+            return fake_llm
+
+    monkeypatch.setattr(trading_graph, "create_llm_client", FakeClient)
+    # The graph sets the process-wide default config; restore it afterwards
+    monkeypatch.setattr(dataflows_config, "_config", None)
+    monkeypatch.setattr(dataflows_config, "_default_snapshot", None)
+    monkeypatch.chdir(tmp_path)
+
+    def build(selected_analysts=("market", "news", "fundamentals"), **config):
+        config = {
+            **DEFAULT_CONFIG,
+            "project_dir": str(tmp_path),
+            "data_cache_dir": str(tmp_path / "data_cache"),
+            **config,
+        }
+        return trading_graph.TradingAgentsGraph(list(selected_analysts), config=config)
+
+    return build
@@ -0,0 +1,167 @@
+"""Shared Alpha Vantage requests for sibling indicators."""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from tradingagents.dataflows import alpha_vantage_indicator as avi
+from tradingagents.dataflows import vendor_cache
+from tradingagents.dataflows.config import use_config
+
+MACD_CSV = (
+    "time,MACD,MACD_Hist,MACD_Signal\n"
+    "2024-05-07,1.5,0.25,1.25\n"
+    "2024-05-06,1.0,0.5,0.5\n"
+    "2024-05-03,0.5,0.25,0.25\n"
+    "2024-04-01,0.1,0.1,0.0\n"
+)
+BBANDS_CSV = (
+    "time,Real Upper Band,Real Middle Band,Real Lower Band\n"
+    "2024-05-07,12.0,10.0,8.0\n"
+    "2024-05-06,11.0,9.5,8.0\n"
+)
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    calls = []
+
+    def make_api_request(function, params):
+        calls.append((function, params["symbol"]))
+        time.sleep(0.05)
+        return BBANDS_CSV if function == "BBANDS" else MACD_CSV
+
+    monkeypatch.setattr(avi, "_make_api_request", make_api_request)
+    monkeypatch.setattr(avi, "_frames", avi.OrderedDict())
+    with use_config({"data_cache_dir": str(tmp_path)}):
+        yield calls
+
+
+def test_macd_siblings_share_one_request(api):
+    reports = {
+        name: avi.get_indicator("aapl", name, "2024-05-07", 5)
+        for name in ("macd", "macds", "macdh")
+    }
+
+    assert api == [("MACD", "AAPL")]
+    assert "2024-05-03: 0.5\n2024-05-06: 1.0\n2024-05-07: 1.5\n" in reports["macd"]
+    assert "2024-05-07: 1.25\n" in reports["macds"]
+    assert "2024-05-07: 0.25\n" in reports["macdh"]
+    # Rows outside the look-back window are dropped
+    assert "2024-04-01" not in reports["macd"]
+
+
+def test_raw_csv_is_kept_in_the_vendor_cache(api, monkeypatch):
+    first = avi.get_indicator_frame("MACD", "AAPL", {"interval": "daily", "series_type": "close"})
+    monkeypatch.setattr(avi, "_frames", avi.OrderedDict())
+    second = avi.get_indicator_frame("MACD", "AAPL", {"interval": "daily", "series_type": "close"})
+
+    assert second is not first
+    assert second.equals(first)
+    assert api == [("MACD", "AAPL")]
+    assert list(first.index.strftime("%Y-%m-%d")) == [
+        "2024-04-01",
+        "2024-05-03",
+        "2024-05-06",
+        "2024-05-07",
+    ]
+
+
+def test_concurrent_callers_share_one_request(api):
+    barrier = threading.Barrier(4)
+    frames = []
+
+    def read():
+        barrier.wait()
+        frames.append(avi.get_indicator_frame("MACD", "MSFT", {"interval": "daily"}))
+
+    # Each thread runs in the test's config context, like prefetch workers do
+    threads = [
+        threading.Thread(target=contextvars.copy_context().run, args=(read,))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert api == [("MACD", "MSFT")]
+    assert all(frame is frames[0] for frame in frames)
+
+
+def test_parameters_are_part_of_the_key(api):
+    assert avi._indicator_request("close_50_sma", "daily", 14, "close")[1]["time_period"] == "50"
+    avi.get_indicator("AAPL", "close_50_sma", "2024-05-07", 5)
+    avi.get_indicator("AAPL", "close_200_sma", "2024-05-07", 5)
+
+    assert api == [("SMA", "AAPL"), ("SMA", "AAPL")]
+
+
+def test_empty_responses_are_reported():
+    with pytest.raises(ValueError, match="No data returned"):
+        avi._parse_indicator_csv("time,RSI\n")
+
+
+def test_batch_table_shares_sibling_requests(api):
+    report = avi.get_indicator_batch(
+        "AAPL", ["macd", "macds", "boll_ub", "boll_lb", "vwma", "macd"], "2024-05-07", 5
+    )
+
+    assert sorted(api) == [("BBANDS", "AAPL"), ("MACD", "AAPL")]
+    table = report.split("\n\n")[1].splitlines()
+    assert table == [
+        "Date,macd,macds,boll_ub,boll_lb",
+        "2024-05-07,1.5000,1.2500,12.0000,8.0000",
+        "2024-05-06,1.0000,0.5000,11.0000,8.0000",
+        "2024-05-03,0.5000,0.2500,N/A,N/A",
+    ]
+    assert "Note: vwma is not directly available" in report
+
+
+def test_async_batch_matches_sync(api, monkeypatch):
+    indicators = ["macd", "macdh", "boll", "vwma"]
+    sync = avi.get_indicator_batch("AAPL", indicators, "2024-05-07", 5)
+
+    async def amake_api_request(function, params):
+        return avi._make_api_request(function, params)
+
+    monkeypatch.setattr(avi, "_amake_api_request", amake_api_request)
+    monkeypatch.setattr(avi, "_frames", avi.OrderedDict())
+    vendor_cache.clear_cache()
+    assert asyncio.run(avi.aget_indicator_batch("AAPL", indicators, "2024-05-07", 5)) == sync
+    # One request per function on each path
+    assert sorted(api) == [("BBANDS", "AAPL")] * 2 + [("MACD", "AAPL")] * 2
+
+
+def test_async_reports_render_the_awaited_frames(tmp_path, monkeypatch):
+    requests = []
+
+    async def amake_api_request(function, params):
+        requests.append(function)
+        return BBANDS_CSV if function == "BBANDS" else MACD_CSV
+
+    def blocking_fetch(*args):
+        raise AssertionError("blocking request on the event loop")
+
+    monkeypatch.setattr(avi, "_amake_api_request", amake_api_request)
+    monkeypatch.setattr(avi, "get_indicator_frame", blocking_fetch)
+    monkeypatch.setattr(avi, "_make_api_request", blocking_fetch)
+    # Nothing in the vendor cache or the frame LRU to fall back on
+    monkeypatch.setattr(avi, "_MAX_FRAMES", 0)
+    monkeypatch.setattr(avi, "_frames", avi.OrderedDict())
+
+    async def run():
+        single = await avi.aget_indicator("AAPL", "macdh", "2024-05-07", 5)
+        batch = await avi.aget_indicator_batch("AAPL", ["macd", "boll_ub"], "2024-05-07", 5)
+        return single, batch
+
+    config = {"data_cache_dir": str(tmp_path), "vendor_cache": {"enabled": False}}
+    with use_config(config):
+        single, batch = asyncio.run(run())
+
+    assert "2024-05-07: 0.25\n" in single
+    assert "2024-05-07,1.5000,12.0000" in batch
+    assert requests == ["MACD", "MACD", "BBANDS"]
@@ -0,0 +1,154 @@
+"""Token-bucket quota accounting of the Alpha Vantage key pool."""
+
+import threading
+from collections import Counter
+
+import pytest
+
+from tradingagents.dataflows import alpha_vantage_common as av
+from tradingagents.dataflows.alpha_vantage_common import (
+    AlphaVantageKeyPool,
+    AlphaVantageRateLimitError,
+)
+from tradingagents.dataflows.config import use_config
+
+
+class FakeClock:
+    """Stands in for the ``time`` module; ``sleep`` advances the clock."""
+
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(av, "time", clock)
+    return clock
+
+
+def make_pool(tmp_path, keys=("key-one", "key-two"), per_minute=5, per_day=25):
+    return AlphaVantageKeyPool(list(keys), str(tmp_path / "quota.db"), per_minute, per_day)
+
+
+def test_api_keys_come_from_both_variables(monkeypatch):
+    monkeypatch.setenv("ALPHA_VANTAGE_API_KEYS", " a, b ,,a")
+    monkeypatch.setenv("ALPHA_VANTAGE_API_KEY", "c")
+    assert av.get_api_keys() == ["a", "b", "c"]
+
+    monkeypatch.delenv("ALPHA_VANTAGE_API_KEYS")
+    monkeypatch.delenv("ALPHA_VANTAGE_API_KEY")
+    with pytest.raises(ValueError):
+        av.get_api_keys()
+
+
+def test_requests_spread_over_keys(tmp_path, clock):
+    pool = make_pool(tmp_path)
+    used = Counter(pool.acquire() for _ in range(10))
+
+    assert used == {"key-one": 5, "key-two": 5}
+    assert clock.slept == []
+
+
+def test_drained_buckets_wait_for_a_refill(tmp_path, clock):
+    pool = make_pool(tmp_path, keys=("key-one",))
+    for _ in range(5):
+        pool.acquire()
+
+    assert pool.acquire() == "key-one"
+    # One token refills in 60 / per_minute seconds
+    assert sum(clock.slept) == pytest.approx(12.0)
+
+
+def test_minute_wait_is_bounded(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(av, "MAX_QUOTA_WAIT_SECONDS", 5)
+    pool = make_pool(tmp_path, keys=("key-one",))
+    for _ in range(5):
+        pool.acquire()
+
+    with pytest.raises(AlphaVantageRateLimitError, match="per-minute"):
+        pool.acquire()
+
+
+def test_daily_quota_is_shared_through_the_database(tmp_path, clock):
+    pool = make_pool(tmp_path, per_day=3)
+    for _ in range(4):
+        pool.acquire()
+
+    # Another process opening the same file sees the same usage
+    other = make_pool(tmp_path, per_day=3)
+    assert [q["day_remaining"] for q in other.quota()] == [1, 1]
+    other.acquire()
+    other.acquire()
+    with pytest.raises(AlphaVantageRateLimitError, match="daily"):
+        pool.acquire()
+
+
+def test_daily_quota_resets_next_utc_day(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(AlphaVantageKeyPool, "_today", staticmethod(lambda: "2024-05-01"))
+    pool = make_pool(tmp_path, keys=("key-one",), per_day=2)
+    pool.acquire()
+    pool.acquire()
+    with pytest.raises(AlphaVantageRateLimitError):
+        pool.acquire()
+
+    monkeypatch.setattr(AlphaVantageKeyPool, "_today", staticmethod(lambda: "2024-05-02"))
+    assert pool.acquire() == "key-one"
+
+
+def test_rejected_key_is_parked(tmp_path, clock):
+    pool = make_pool(tmp_path)
+    pool.mark_exhausted("key-one", daily=True)
+
+    assert {pool.acquire() for _ in range(5)} == {"key-two"}
+    assert pool.quota()[0] == {"key": "key-****", "minute_remaining": 0, "day_remaining": 0}
+
+
+def test_concurrent_acquires_never_overdraw(tmp_path, monkeypatch):
+    monkeypatch.setattr(av, "MAX_QUOTA_WAIT_SECONDS", 0)
+    pool = make_pool(tmp_path, per_minute=5, per_day=100)
+    granted = []
+
+    def worker():
+        while True:
+            try:
+                granted.append(pool.acquire())
+            except AlphaVantageRateLimitError:
+                return
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Tokens refill continuously, so allow for the few that refilled meanwhile
+    assert 10 <= len(granted) <= 11
+
+
+def test_request_moves_to_next_key_on_rate_limit(tmp_path, clock, monkeypatch):
+    monkeypatch.setenv("ALPHA_VANTAGE_API_KEYS", "key-one,key-two")
+    monkeypatch.delenv("ALPHA_VANTAGE_API_KEY", raising=False)
+    sent = []
+
+    def request_with_key(function_name, params, api_key):
+        sent.append(api_key)
+        if api_key == "key-one":
+            raise AlphaVantageRateLimitError("standard API rate limit is 25 requests per day")
+        return "csv"
+
+    monkeypatch.setattr(av, "_request_with_key", request_with_key)
+    with use_config({"data_cache_dir": str(tmp_path)}):
+        assert av._make_api_request("TIME_SERIES_DAILY", {"symbol": "IBM"}) == "csv"
+        # The daily rejection parks the first key for the rest of the day
+        assert av.get_quota_report()[0]["day_remaining"] == 0
+
+    assert sent == ["key-one", "key-two"]
@@ -0,0 +1,129 @@
+"""The async dataflow layer: aroute_to_vendor, the yfinance executor and async HTTP."""
+
+import asyncio
+import inspect
+import threading
+
+import httpx
+import pytest
+
+from tradingagents.dataflows import http_transport, interface, vendor_cache, vendor_health
+from tradingagents.dataflows.alpha_vantage_common import AlphaVantageRateLimitError
+from tradingagents.dataflows.blocking_executor import run_blocking, to_async
+from tradingagents.dataflows.config import get_config, use_config
+
+
+@pytest.fixture(autouse=True)
+def fresh_health():
+    vendor_health.reset_health()
+    yield
+    vendor_health.reset_health()
+
+
+@pytest.fixture
+def run_config(tmp_path):
+    config = {"data_cache_dir": str(tmp_path), "tool_vendors": {"get_fundamentals": "yfinance"}}
+    with use_config(config):
+        yield config
+
+
+def fundamentals(calls):
+    def get_fundamentals(ticker, curr_date=None):
+        calls.append(threading.current_thread().name)
+        return f"Fundamentals for {ticker}"
+
+    return get_fundamentals
+
+
+def test_to_async_keeps_the_signature_and_context(run_config):
+    def read(name, suffix=""):
+        return threading.current_thread().name, get_config()["data_cache_dir"] + suffix
+
+    wrapped = to_async(read)
+    assert inspect.signature(wrapped) == inspect.signature(read)
+
+    thread, cache_dir = asyncio.run(wrapped("x", suffix="/news"))
+    assert thread.startswith("yfinance")
+    assert cache_dir == run_config["data_cache_dir"] + "/news"
+    assert asyncio.run(run_blocking(len, "abc")) == 3
+
+
+def test_sync_and_async_calls_share_cache_entries(run_config, monkeypatch):
+    calls = []
+    fetch = fundamentals(calls)
+    vendor_cache.reset_cache_stats()
+    monkeypatch.setitem(interface.VENDOR_METHODS, "get_fundamentals", {"yfinance": fetch})
+    monkeypatch.setitem(
+        interface.ASYNC_VENDOR_METHODS, "get_fundamentals", {"yfinance": to_async(fetch)}
+    )
+
+    first = asyncio.run(interface.aroute_to_vendor("get_fundamentals", "aapl", "2024-05-07"))
+    assert calls[0].startswith("yfinance")
+
+    assert interface.route_to_vendor("get_fundamentals", "AAPL", "2024-05-07") == first
+    assert len(calls) == 1
+    assert vendor_cache.cache_stats()["hits"] == 1
+
+
+def test_async_routing_falls_back_to_the_next_vendor(run_config, monkeypatch):
+    async def rate_limited(ticker, curr_date=None):
+        raise AlphaVantageRateLimitError("quota exhausted")
+
+    async def served(ticker, curr_date=None):
+        return f"yfinance fundamentals for {ticker}"
+
+    monkeypatch.setitem(
+        interface.ASYNC_VENDOR_METHODS,
+        "get_fundamentals",
+        {"alpha_vantage": rate_limited, "yfinance": served},
+    )
+
+    with use_config({**run_config, "tool_vendors": {"get_fundamentals": "alpha_vantage"}}):
+        result = asyncio.run(interface.aroute_to_vendor("get_fundamentals", "MSFT"))
+    assert result == "yfinance fundamentals for MSFT"
+
+
+def test_async_requests_retry_transient_statuses(monkeypatch):
+    statuses = [503, 200]
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.params["symbol"])
+        return httpx.Response(statuses.pop(0), text="ok")
+
+    monkeypatch.setattr(http_transport, "_backoff", lambda attempt, response=None: 0)
+
+    async def fetch():
+        # A client on a mock transport stands in for the pooled client of this loop
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        http_transport._async_clients[asyncio.get_running_loop()] = {
+            "api.example.com": (client, asyncio.Semaphore(1))
+        }
+        try:
+            return await http_transport.aget(
+                "https://api.example.com/query", params={"symbol": "AAPL"}
+            )
+        finally:
+            await http_transport.aclose()
+
+    response = asyncio.run(fetch())
+    assert response.status_code == 200
+    assert seen == ["AAPL", "AAPL"]
+
+
+def test_client_scope_closes_clients_after_the_last_run():
+    async def run(hold):
+        async with http_transport.client_scope():
+            client, _ = http_transport.get_async_client("api.example.com")
+            await asyncio.sleep(hold)
+            return client
+
+    async def main():
+        fast, slow = asyncio.create_task(run(0)), asyncio.create_task(run(0.05))
+        client = await fast
+        # The slower run still uses the shared client
+        assert not client.is_closed
+        assert await slow is client
+        return client
+
+    assert asyncio.run(main()).is_closed
@@ -0,0 +1,178 @@
+"""Single-flight coalescing, cross-process file locks and atomic writes."""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from tradingagents.dataflows.cache_sync import (
+    AsyncSingleFlight,
+    SingleFlight,
+    atomic_write,
+    file_lock,
+)
+
+
+def run_threads(count, target):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    calls = []
+    results = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return "bars"
+
+    def caller():
+        results.append(flight.do("AAPL", fetch))
+
+    threads = [threading.Thread(target=caller) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["bars"] * 8
+
+
+def test_single_flight_shares_errors_and_forgets_finished_keys():
+    flight = SingleFlight()
+    errors = []
+    release = threading.Event()
+
+    def failing():
+        release.wait(5)
+        raise ValueError("rate limited")
+
+    def caller():
+        try:
+            flight.do("AAPL", failing)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=caller) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 4 and len({id(e) for e in errors}) == 1
+    # The failed call is not cached; the next one runs again
+    assert flight.do("AAPL", lambda: "bars") == "bars"
+
+
+def test_single_flight_keys_are_independent():
+    flight = SingleFlight()
+    assert flight.do("AAPL", lambda: 1) == 1
+    assert flight.do("MSFT", lambda: 2) == 2
+
+
+def test_async_single_flight_coalesces_awaits():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "bars"
+
+    async def main():
+        return await asyncio.gather(*(flight.do("AAPL", fetch) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["bars"] * 5
+    assert len(calls) == 1
+
+
+def test_file_lock_serializes_threads(tmp_path):
+    path = str(tmp_path / "counter")
+    with open(path, "w") as f:
+        f.write("0")
+
+    def increment():
+        for _ in range(20):
+            with file_lock(path):
+                with open(path) as f:
+                    value = int(f.read())
+                with open(path, "w") as f:
+                    f.write(str(value + 1))
+
+    run_threads(4, increment)
+    with open(path) as f:
+        assert f.read() == "80"
+
+
+def test_file_lock_is_reentrant_within_a_thread(tmp_path):
+    path = str(tmp_path / "store.parquet")
+    with file_lock(path):
+        with file_lock(path):
+            pass
+
+
+def _hold_lock(path, held, marker):
+    with file_lock(path):
+        held.set()
+        time.sleep(0.3)
+        with open(marker, "w") as f:
+            f.write("done")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses fork")
+def test_file_lock_holds_across_processes(tmp_path):
+    path = str(tmp_path / "store.parquet")
+    marker = str(tmp_path / "marker")
+    context = multiprocessing.get_context("fork")
+    held = context.Event()
+    child = context.Process(target=_hold_lock, args=(path, held, marker))
+    child.start()
+    try:
+        assert held.wait(5)
+        with file_lock(path):
+            # Only acquired once the child has finished its write
+            assert os.path.exists(marker)
+    finally:
+        child.join(5)
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    path = str(tmp_path / "ohlcv.parquet")
+    with atomic_write(path) as tmp:
+        with open(tmp, "w") as f:
+            f.write("new")
+
+    with open(path) as f:
+        assert f.read() == "new"
+    assert os.listdir(tmp_path) == ["ohlcv.parquet"]
+
+
+def test_failed_atomic_write_keeps_old_file(tmp_path):
+    path = str(tmp_path / "ohlcv.parquet")
+    with open(path, "w") as f:
+        f.write("old")
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as tmp:
+            with open(tmp, "w") as f:
+                f.write("partial")
+            raise RuntimeError("download interrupted")
+
+    with open(path) as f:
+        assert f.read() == "old"
+    assert os.listdir(tmp_path) == ["ohlcv.parquet"]
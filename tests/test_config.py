@@ -0,0 +1,83 @@
+"""Read-only config snapshots and per-context run configs."""
+
+import contextvars
+import threading
+
+import pytest
+
+from tradingagents.dataflows import config
+from tradingagents.default_config import DEFAULT_CONFIG
+
+
+@pytest.fixture(autouse=True)
+def process_config(monkeypatch):
+    monkeypatch.setattr(config, "_config", None)
+    monkeypatch.setattr(config, "_default_snapshot", None)
+
+
+def test_config_is_read_only():
+    current = config.get_config()
+
+    assert current["llm_provider"] == DEFAULT_CONFIG["llm_provider"]
+    with pytest.raises(TypeError):
+        current["llm_provider"] = "anthropic"
+    with pytest.raises(TypeError):
+        current["data_vendors"]["news_data"] = "alpha_vantage"
+    # Snapshots are shared, not copied per call
+    assert config.get_config() is current
+
+
+def test_use_config_overrides_and_restores():
+    with config.use_config({"max_debate_rounds": 3}) as snapshot:
+        assert config.get_config() is snapshot
+        assert snapshot["max_debate_rounds"] == 3
+        assert snapshot["llm_provider"] == DEFAULT_CONFIG["llm_provider"]
+        with config.use_config({"max_debate_rounds": 5}):
+            assert config.get_config()["max_debate_rounds"] == 5
+        assert config.get_config()["max_debate_rounds"] == 3
+
+    assert config.get_config()["max_debate_rounds"] == DEFAULT_CONFIG["max_debate_rounds"]
+
+
+def test_set_config_updates_the_process_default():
+    default_rounds = DEFAULT_CONFIG["max_debate_rounds"]
+    config.set_config({"max_debate_rounds": default_rounds + 3})
+
+    assert config.get_config()["max_debate_rounds"] == default_rounds + 3
+    assert DEFAULT_CONFIG["max_debate_rounds"] == default_rounds
+    with config.use_config({"results_dir": "/tmp/results"}):
+        assert config.get_config()["max_debate_rounds"] == default_rounds + 3
+
+
+def test_concurrent_contexts_are_isolated():
+    barrier = threading.Barrier(2)
+    seen = {}
+
+    def run(name):
+        with config.use_config({"data_cache_dir": f"/tmp/{name}"}):
+            barrier.wait()
+            seen[name] = config.get_config()["data_cache_dir"]
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == {"a": "/tmp/a", "b": "/tmp/b"}
+
+
+def test_copied_contexts_carry_the_run_config_into_threads():
+    seen = {}
+
+    def read(name):
+        seen[name] = config.get_config()["data_cache_dir"]
+
+    with config.use_config({"data_cache_dir": "/tmp/run"}):
+        copied = threading.Thread(target=contextvars.copy_context().run, args=(read, "copied"))
+        plain = threading.Thread(target=read, args=("plain",))
+        for thread in (copied, plain):
+            thread.start()
+            thread.join()
+
+    assert seen == {"copied": "/tmp/run", "plain": DEFAULT_CONFIG["data_cache_dir"]}
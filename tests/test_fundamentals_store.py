@@ -0,0 +1,126 @@
+"""Point-in-time reads and refresh cadence of the fundamentals store."""
+
+import json
+import os
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from tradingagents.dataflows import fundamentals_store
+from tradingagents.dataflows.config import use_config
+
+
+def statement(values_by_period):
+    """A yfinance statement: line items as rows, report periods as columns."""
+    return pd.DataFrame(
+        {pd.Timestamp(period): values for period, values in values_by_period.items()},
+        index=["Total Revenue", "Net Income"],
+    )
+
+
+class FakeTicker:
+    info = {"longName": "Apple Inc.", "marketCap": 3_000_000_000_000}
+    quarterly = statement(
+        {
+            "2023-12-31": [120.0, 30.0],
+            "2023-09-30": [90.0, 23.0],
+            "2023-06-30": [80.0, 20.0],
+        }
+    )
+    insider = pd.DataFrame(
+        {
+            "Insider": ["COOK TIMOTHY D", "MAESTRI LUCA"],
+            "Shares": [100, 200],
+            "Start Date": ["2023-11-01", "2024-02-01"],
+        }
+    )
+
+    def __init__(self, symbol, created):
+        created.append(symbol)
+        self.quarterly_income_stmt = self.quarterly
+        self.quarterly_balance_sheet = self.quarterly
+        self.quarterly_cashflow = pd.DataFrame()
+        self.income_stmt = self.balance_sheet = self.cashflow = pd.DataFrame()
+        self.insider_transactions = self.insider
+
+
+@pytest.fixture
+def tickers(tmp_path, monkeypatch):
+    created = []
+    monkeypatch.setattr(
+        fundamentals_store,
+        "yf",
+        SimpleNamespace(Ticker=lambda symbol: FakeTicker(symbol, created)),
+    )
+    with use_config({"data_cache_dir": str(tmp_path)}):
+        yield created
+
+
+def test_statement_periods_appear_after_their_filing_deadline(tickers):
+    data = fundamentals_store.get_statement("aapl", "income_statement", "quarterly", "2024-01-20")
+
+    # 2023-12-31 is only filed 45 days later
+    assert list(data.columns) == [pd.Timestamp("2023-09-30"), pd.Timestamp("2023-06-30")]
+    assert data.loc["Total Revenue"].tolist() == [90.0, 80.0]
+    assert len(fundamentals_store.get_statement("AAPL", "income_statement")) == 2
+    assert fundamentals_store.get_statement("AAPL", "cashflow").empty
+
+
+def test_one_fetch_serves_every_endpoint_until_stale(tickers):
+    fundamentals_store.get_info("AAPL")
+    fundamentals_store.get_statement("AAPL", "balance_sheet")
+    fundamentals_store.get_insider_transactions("AAPL")
+    assert tickers == ["AAPL"]
+
+    # The overview is a live snapshot and refreshes once a day
+    manifest_path = os.path.join(fundamentals_store._symbol_dir("AAPL"), "manifest.json")
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    manifest["info_fetched_at"] = "2000-01-01 00:00:00"
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f)
+
+    assert fundamentals_store.get_info("AAPL")["longName"] == "Apple Inc."
+    assert tickers == ["AAPL", "AAPL"]
+
+
+def test_periods_accumulate_and_restatements_win(tickers, monkeypatch):
+    fundamentals_store.get_statement("AAPL", "income_statement")
+    monkeypatch.setattr(
+        FakeTicker,
+        "quarterly",
+        statement({"2024-03-31": [100.0, 25.0], "2023-12-31": [121.0, 31.0]}),
+    )
+    fundamentals_store.refresh_fundamentals("AAPL", force=True)
+
+    data = fundamentals_store.get_statement("AAPL", "income_statement")
+    assert [c.strftime("%Y-%m-%d") for c in data.columns] == [
+        "2024-03-31",
+        "2023-12-31",
+        "2023-09-30",
+        "2023-06-30",
+    ]
+    assert data.loc["Total Revenue", pd.Timestamp("2023-12-31")] == 121.0
+
+
+def test_insider_transactions_are_point_in_time(tickers):
+    data = fundamentals_store.get_insider_transactions("AAPL", "2024-01-15")
+    assert data["Insider"].tolist() == ["COOK TIMOTHY D"]
+    assert len(fundamentals_store.get_insider_transactions("AAPL")) == 2
+
+
+def test_failed_refresh_serves_stored_data(tickers, monkeypatch):
+    fundamentals_store.get_statement("AAPL", "income_statement")
+
+    def unavailable(symbol):
+        raise ConnectionError("Yahoo is down")
+
+    monkeypatch.setattr(fundamentals_store, "yf", SimpleNamespace(Ticker=unavailable))
+    fundamentals_store.refresh_fundamentals("AAPL", force=True)
+    assert len(fundamentals_store.get_statement("AAPL", "income_statement")) == 2
+
+    with pytest.raises(ConnectionError):
+        fundamentals_store.get_info("MSFT")
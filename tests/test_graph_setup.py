@@ -0,0 +1,100 @@
+"""Graph topologies built by GraphSetup: analysts and risk debate, sequential and parallel."""
+
+import asyncio
+
+from langgraph.graph import START
+
+TRADE_DATE = "2024-05-10"
+ANALYSTS = ("market", "news", "fundamentals")
+REPORT_KEYS = ("market_report", "news_report", "fundamentals_report")
+RISK_ANALYSTS = ("Aggressive Analyst", "Conservative Analyst", "Neutral Analyst")
+
+
+def edges(graph):
+    return {(edge.source, edge.target) for edge in graph.get_graph().edges}
+
+
+def test_sequential_analysts_are_chained(make_graph):
+    ta = make_graph(ANALYSTS)
+    graph_edges = edges(ta.graph)
+
+    assert (START, "Market Analyst") in graph_edges
+    assert ("Msg Clear Market", "News Analyst") in graph_edges
+    assert ("Msg Clear Fundamentals", "Bull Researcher") in graph_edges
+
+
+def test_parallel_analysts_fan_out_from_start(make_graph):
+    ta = make_graph(ANALYSTS, parallel_analysts=True)
+    graph_edges = edges(ta.graph)
+
+    for analyst in ("Market Analyst", "News Analyst", "Fundamentals Analyst"):
+        assert (START, analyst) in graph_edges
+        assert (analyst, "Bull Researcher") in graph_edges
+    assert not any(source.startswith("Msg Clear") for source, _ in graph_edges)
+
+
+def test_parallel_analysts_run_concurrently(make_graph, fake_llm):
+    ta = make_graph(ANALYSTS, parallel_analysts=True)
+    final_state, _ = ta.propagate("AAPL", TRADE_DATE)
+
+    # Every analyst starts from its own conversation about the ticker
+    assert [final_state[key] for key in REPORT_KEYS] == ["REPORT: AAPL"] * 3
+    assert fake_llm.peak >= len(ANALYSTS)
+
+
+def test_parallel_analysts_run_on_asyncio(make_graph, fake_llm):
+    ta = make_graph(ANALYSTS, parallel_analysts=True)
+    final_state, _ = asyncio.run(ta.apropagate("AAPL", TRADE_DATE))
+
+    assert [final_state[key] for key in REPORT_KEYS] == ["REPORT: AAPL"] * 3
+    assert fake_llm.peak >= len(ANALYSTS)
+
+
+def test_parallel_and_sequential_runs_reach_the_same_stages(make_graph):
+    sequential, _ = make_graph(ANALYSTS).propagate("AAPL", TRADE_DATE)
+    parallel, _ = make_graph(ANALYSTS, parallel_analysts=True).propagate("AAPL", TRADE_DATE)
+
+    for state in (sequential, parallel):
+        assert all(state[key] for key in REPORT_KEYS)
+        assert state["investment_plan"] and state["final_trade_decision"]
+    assert (
+        sequential["investment_debate_state"]["count"]
+        == parallel["investment_debate_state"]["count"]
+    )
+
+
+def test_parallel_risk_debate_fans_out_from_trader(make_graph):
+    ta = make_graph(["market"], parallel_risk_debate=True)
+    graph_edges = edges(ta.graph)
+
+    for analyst in RISK_ANALYSTS:
+        assert ("Trader", analyst) in graph_edges
+        assert (analyst, "Risk Round Merge") in graph_edges
+        assert ("Risk Round Merge", analyst) in graph_edges
+    assert ("Risk Round Merge", "Risk Judge") in graph_edges
+
+
+def risk_debate(make_graph, rounds, parallel):
+    ta = make_graph(
+        ["market"], max_risk_discuss_rounds=rounds, parallel_risk_debate=parallel
+    )
+    final_state, _ = ta.propagate("AAPL", TRADE_DATE)
+    return final_state["risk_debate_state"]
+
+
+def test_parallel_risk_rounds_match_sequential_transcript(make_graph):
+    for rounds in (1, 2):
+        sequential = risk_debate(make_graph, rounds, parallel=False)
+        parallel = risk_debate(make_graph, rounds, parallel=True)
+
+        assert parallel["count"] == sequential["count"] == 3 * rounds
+        # Arguments are appended in Aggressive, Conservative, Neutral order
+        assert parallel["history"] == sequential["history"]
+        for speaker in ("aggressive", "conservative", "neutral"):
+            assert parallel[f"{speaker}_history"] == sequential[f"{speaker}_history"]
+
+
+def test_parallel_risk_analysts_argue_concurrently(make_graph, fake_llm):
+    risk_debate(make_graph, 1, parallel=True)
+    # One analyst and sequential stages otherwise, so only the risk round overlaps
+    assert fake_llm.peak >= len(RISK_ANALYSTS)
@@ -0,0 +1,104 @@
+"""Pooled sessions, timeouts and retries of the shared HTTP transport."""
+
+import pytest
+import requests
+
+from tradingagents.dataflows import http_transport
+
+HOST = "api.example.com"
+URL = f"https://{HOST}/query"
+
+
+def response(status, headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers.update(headers or {})
+    return resp
+
+
+class FakeSession:
+    """Replays ``outcomes`` (responses or exceptions) one call at a time."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    monkeypatch.setattr(http_transport, "_sessions", {})
+    monkeypatch.setattr(http_transport, "_semaphores", {})
+    slept = []
+    monkeypatch.setattr(http_transport.time, "sleep", slept.append)
+    return slept
+
+
+def install(outcomes):
+    http_transport.get_session(HOST)
+    session = FakeSession(outcomes)
+    http_transport._sessions[HOST] = session
+    return session
+
+
+def test_one_pooled_session_per_host(sleeps):
+    session = http_transport.get_session("www.alphavantage.co")
+
+    assert http_transport.get_session("www.alphavantage.co") is session
+    assert http_transport.get_session(HOST) is not session
+    assert session.get_adapter("https://www.alphavantage.co")._pool_maxsize == 4
+    assert http_transport._semaphores["www.alphavantage.co"]._value == 4
+
+
+def test_requests_get_default_timeouts(sleeps):
+    session = install([response(200)])
+
+    assert http_transport.get(URL, params={"q": "AAPL"}).status_code == 200
+    assert session.calls == [
+        ("GET", URL, {"timeout": http_transport.DEFAULT_TIMEOUT, "params": {"q": "AAPL"}})
+    ]
+    assert sleeps == []
+
+
+def test_transient_statuses_are_retried(sleeps):
+    session = install([response(503), response(429, {"Retry-After": "2"}), response(200)])
+
+    assert http_transport.get(URL).status_code == 200
+    assert len(session.calls) == 3
+    assert 0 <= sleeps[0] <= http_transport.BACKOFF_BASE
+    # Retry-After overrides the jittered backoff
+    assert sleeps[1] == 2.0
+
+
+def test_last_response_is_returned_once_retries_run_out(sleeps):
+    session = install([response(502), response(502)])
+
+    assert http_transport.get(URL, retries=1).status_code == 502
+    assert len(session.calls) == 2
+    # Client errors are not retried
+    install([response(404)])
+    assert http_transport.get(URL).status_code == 404
+
+
+def test_connection_errors_raise_after_the_last_attempt(sleeps):
+    outcomes = [requests.ConnectionError("reset")] * (http_transport.MAX_RETRIES + 1)
+    session = install(outcomes)
+
+    with pytest.raises(requests.ConnectionError):
+        http_transport.get(URL)
+    assert len(session.calls) == http_transport.MAX_RETRIES + 1
+    assert len(sleeps) == http_transport.MAX_RETRIES
+
+
+def test_backoff_is_capped(sleeps):
+    for attempt in range(10):
+        assert 0 <= http_transport._backoff(attempt) <= http_transport.BACKOFF_MAX
+    assert http_transport._backoff(0, response(429, {"Retry-After": "600"})) == (
+        http_transport.BACKOFF_MAX
+    )
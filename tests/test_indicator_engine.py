@@ -0,0 +1,135 @@
+"""Parity of the NumPy indicator engine with stockstats."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+stockstats = pytest.importorskip("stockstats")
+
+from tradingagents.dataflows.indicator_engine import (
+    INDICATOR_FUNCTIONS,
+    RSI_RANGE_TOLERANCE,
+    STOCHRSI_WINDOW,
+    IndicatorState,
+    compute_indicators,
+    rolling_std,
+    rolling_sum,
+    sma,
+)
+
+FLAT = slice(300, 360)
+ZERO_VOLUME = slice(500, 540)
+
+
+def make_bars(n=1000, seed=0):
+    """Random-walk bars with a flat-price stretch and a zero-volume stretch."""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    close[FLAT] = close[FLAT.start - 1]
+    high = close + rng.uniform(0, 1, n)
+    low = close - rng.uniform(0, 1, n)
+    high[FLAT] = close[FLAT]
+    low[FLAT] = close[FLAT]
+    volume = rng.integers(100_000, 1_000_000, n).astype(float)
+    volume[ZERO_VOLUME] = 0
+    return pd.DataFrame(
+        {
+            "Date": pd.bdate_range("2020-01-01", periods=n),
+            "Open": close,
+            "High": high,
+            "Low": low,
+            "Close": close,
+            "Volume": volume,
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def bars():
+    return make_bars()
+
+
+@pytest.fixture(scope="module")
+def reference(bars):
+    return stockstats.wrap(bars.copy())
+
+
+def degenerate_rsi_range(reference):
+    """Bars where stockstats' own 14-bar RSI range is float noise."""
+    rsi = reference[f"rsi_{STOCHRSI_WINDOW}"]
+    window = rsi.rolling(STOCHRSI_WINDOW, min_periods=1)
+    return ((window.max() - window.min()) <= RSI_RANGE_TOLERANCE).to_numpy()
+
+
+def assert_stochrsi_matches(values, reference):
+    """stochrsi equals stockstats where the RSI range is real and is 0 on flat ranges.
+
+    On a flat stretch both libraries see an RSI range of ~1e-14 noise, which
+    an exact ``!= 0`` check turns into arbitrary 0 or 100 values.
+    """
+    expected = reference["stochrsi"].to_numpy()
+    degenerate = degenerate_rsi_range(reference)
+    assert degenerate[FLAT].any()
+    np.testing.assert_allclose(values[~degenerate], expected[~degenerate], rtol=1e-9, atol=1e-9)
+    np.testing.assert_array_equal(values[degenerate], 0.0)
+
+
+@pytest.mark.parametrize("name", sorted(set(INDICATOR_FUNCTIONS) - {"stochrsi"}))
+def test_compute_indicators_matches_stockstats(bars, reference, name):
+    values = compute_indicators(bars, [name])[name].to_numpy()
+    np.testing.assert_allclose(values, reference[name].to_numpy(dtype=float), rtol=1e-9, atol=1e-9)
+
+
+def test_compute_stochrsi_matches_stockstats(bars, reference):
+    assert_stochrsi_matches(compute_indicators(bars, ["stochrsi"])["stochrsi"].to_numpy(), reference)
+
+
+def test_zero_volume_stretch(bars):
+    values = compute_indicators(bars, ["vwma", "mfi"])
+    # A full VWMA window without volume has no weighted price
+    assert (values["vwma"].to_numpy()[ZERO_VOLUME][14:] == 0).all()
+    assert np.isfinite(values["mfi"].to_numpy()).all()
+
+
+@pytest.mark.parametrize("seed_bars", [0, 1, 250, 600])
+def test_incremental_update_matches_stockstats(bars, reference, seed_bars):
+    state = IndicatorState.from_history(bars.iloc[:seed_bars])
+    rows = [
+        state.update(row.High, row.Low, row.Close, row.Volume)
+        for row in bars.iloc[seed_bars:].itertuples()
+    ]
+    updates = pd.DataFrame(rows)
+    for name in INDICATOR_FUNCTIONS:
+        if name == "stochrsi":
+            continue
+        np.testing.assert_allclose(
+            updates[name].to_numpy(), reference[name].to_numpy(dtype=float)[seed_bars:],
+            rtol=1e-9, atol=1e-9, err_msg=name,
+        )
+
+    stochrsi = np.concatenate(
+        [compute_indicators(bars.iloc[:seed_bars], ["stochrsi"])["stochrsi"].to_numpy(),
+         updates["stochrsi"].to_numpy()]
+    ) if seed_bars else updates["stochrsi"].to_numpy()
+    assert_stochrsi_matches(stochrsi, reference)
+
+
+def test_rolling_kernels_skip_nan_like_pandas():
+    x = make_bars()["Close"].to_numpy().copy()
+    x[[400, 401, 402, 700]] = np.nan
+    series = pd.Series(x)
+
+    def check(actual, expected):
+        np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-9)
+
+    check(rolling_sum(x, 14), series.rolling(14, min_periods=1).sum())
+    check(sma(x, 50), series.rolling(50, min_periods=1).mean())
+    check(rolling_std(x, 20), series.rolling(20, min_periods=1).std())
+
+
+def test_missing_bar_only_affects_its_windows():
+    bars = make_bars()
+    bars.loc[400, ["High", "Low", "Close"]] = np.nan
+    values = compute_indicators(bars, ["close_50_sma", "boll_ub", "vwma"])
+    # Every window still holds valid bars, so nothing turns NaN downstream
+    assert not values.iloc[401:].isna().any().any()
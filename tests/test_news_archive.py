@@ -0,0 +1,172 @@
+"""Coverage rules of the news archive and when the router consults it."""
+
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from tradingagents.dataflows import interface, news_archive
+from tradingagents.dataflows.config import use_config
+
+NOW = datetime(2024, 6, 1, 12, 0)
+PAST = ("2024-05-01", "2024-05-07")
+CURRENT = ("2024-05-26", "2024-06-01")
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    monkeypatch.setattr(news_archive, "_now", lambda: NOW)
+    with use_config({"data_cache_dir": str(tmp_path)}):
+        yield str(tmp_path)
+
+
+def article(title, published):
+    return {
+        "title": title,
+        "summary": "",
+        "publisher": "Wire",
+        "link": f"https://example.com/{title}",
+        "pub_date": published,
+    }
+
+
+def advance(monkeypatch, delta):
+    monkeypatch.setattr(news_archive, "_now", lambda: NOW + delta)
+
+
+def test_closed_window_from_range_source_is_covered_for_good(archive, monkeypatch):
+    news_archive.record_fetch("AAPL", *PAST, "alpha_vantage")
+    advance(monkeypatch, timedelta(days=30))
+    assert news_archive.is_covered("AAPL", *PAST)
+
+
+def test_yfinance_fetch_only_covers_window_for_ttl(archive, monkeypatch):
+    news_archive.record_fetch("AAPL", *CURRENT, "yfinance")
+    assert news_archive.is_covered("AAPL", *CURRENT)
+
+    advance(monkeypatch, news_archive.NEWS_TTL + timedelta(minutes=1))
+    assert not news_archive.is_covered("AAPL", *CURRENT)
+
+
+def test_latest_only_fetch_never_covers_a_past_window(archive):
+    # yfinance only returns current headlines, whatever window was asked for
+    news_archive.record_fetch("AAPL", *PAST, "yfinance")
+    assert not news_archive.is_covered("AAPL", *PAST)
+
+
+def test_undated_articles_stay_out_of_date_ranges(archive):
+    news_archive.add_articles(
+        [article("Undated story", None), article("Dated story", datetime(2024, 6, 1, 9))],
+        "AAPL",
+        "yfinance",
+    )
+    news_archive.record_fetch("AAPL", *CURRENT, "yfinance")
+
+    rendered = news_archive.lookup("get_news", "AAPL", *CURRENT)
+    assert "Dated story" in rendered
+    assert "Undated story" not in rendered
+    assert [row["title"] for row in news_archive.search_news("Undated")] == ["Undated story"]
+
+
+def test_open_window_expires_for_range_source_too(archive, monkeypatch):
+    news_archive.record_fetch("AAPL", *CURRENT, "alpha_vantage")
+    advance(monkeypatch, news_archive.NEWS_TTL + timedelta(minutes=1))
+    assert not news_archive.is_covered("AAPL", *CURRENT)
+
+
+def test_coverage_is_per_topic_and_window(archive):
+    news_archive.record_fetch("AAPL", *PAST, "alpha_vantage")
+    assert news_archive.is_covered("aapl", "2024-05-02", "2024-05-06")
+    assert not news_archive.is_covered("AAPL", "2024-04-30", "2024-05-07")
+    assert not news_archive.is_covered("MSFT", *PAST)
+
+
+def test_lookup_renders_covered_window(archive):
+    news_archive.add_articles(
+        [
+            article("Apple beats estimates", datetime(2024, 5, 3, 14)),
+            article("Apple beats estimates", datetime(2024, 5, 3, 15)),
+            article("Older story", datetime(2024, 4, 1)),
+        ],
+        "AAPL",
+        "alpha_vantage",
+    )
+    assert news_archive.lookup("get_news", "AAPL", *PAST) is None
+
+    news_archive.record_fetch("AAPL", *PAST, "alpha_vantage")
+    rendered = news_archive.lookup("get_news", "AAPL", *PAST)
+    assert rendered.count("### Apple beats estimates") == 1
+    assert "Older story" not in rendered
+
+
+def test_legacy_archive_drops_stamped_publish_times(archive):
+    path = os.path.join(archive, "news", "archive.db")
+    os.makedirs(os.path.dirname(path))
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE articles (
+            id INTEGER PRIMARY KEY, url TEXT UNIQUE, title_hash TEXT NOT NULL UNIQUE,
+            title TEXT NOT NULL, summary TEXT NOT NULL DEFAULT '',
+            publisher TEXT NOT NULL DEFAULT '', sentiment TEXT,
+            published_at TEXT NOT NULL, source TEXT NOT NULL, archived_at TEXT NOT NULL
+        );
+        INSERT INTO articles (title_hash, title, published_at, source, archived_at) VALUES
+            ('a', 'Stamped story', '2024-06-01T11:00:00', 'yfinance', '2024-06-01T11:00:00'),
+            ('b', 'Dated story', '2024-05-31T09:00:00', 'yfinance', '2024-06-01T11:00:00');
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    news_archive.add_articles([article("New undated story", None)], "AAPL", "yfinance")
+    conn = sqlite3.connect(path)
+    rows = conn.execute("SELECT title, published_at FROM articles").fetchall()
+    conn.close()
+
+    assert dict(rows) == {
+        "Stamped story": None,
+        "Dated story": "2024-05-31T09:00:00",
+        "New undated story": None,
+    }
+
+
+@pytest.fixture
+def routed(archive, monkeypatch):
+    calls = []
+
+    def vendor(name):
+        def fetch(ticker, start_date, end_date):
+            calls.append(name)
+            return f"{name} news for {ticker}"
+        return fetch
+
+    monkeypatch.setitem(
+        interface.VENDOR_METHODS,
+        "get_news",
+        {"alpha_vantage": vendor("alpha_vantage"), "yfinance": vendor("yfinance")},
+    )
+    news_archive.add_articles(
+        [article("Apple beats estimates", datetime(2024, 5, 3, 14))], "AAPL", "alpha_vantage"
+    )
+    news_archive.record_fetch("AAPL", *PAST, "alpha_vantage")
+    return archive, calls
+
+
+def route_news(cache_dir, vendor):
+    config = {"data_cache_dir": cache_dir, "tool_vendors": {"get_news": vendor}}
+    with use_config(config):
+        return interface.route_to_vendor("get_news", "AAPL", *PAST)
+
+
+def test_router_serves_archive_for_yfinance(routed):
+    cache_dir, calls = routed
+    assert route_news(cache_dir, "yfinance").startswith("## AAPL News")
+    assert calls == []
+
+
+def test_router_keeps_alpha_vantage_format(routed):
+    cache_dir, calls = routed
+    assert route_news(cache_dir, "alpha_vantage") == "alpha_vantage news for AAPL"
+    assert calls == ["alpha_vantage"]
@@ -0,0 +1,100 @@
+"""Direct-injection analysts: parallel prefetch and a single LLM call."""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("rank_bm25")
+
+from langchain_core.messages import HumanMessage
+
+from tradingagents.agents.analysts.market_analyst import create_market_analyst
+from tradingagents.agents.utils import prefetch
+from tradingagents.dataflows.config import get_config, use_config
+
+PREFETCH = {"analyst_data_mode": "prefetch", "data_cache_dir": "/tmp/prefetch-run"}
+
+
+@pytest.fixture
+def vendor(monkeypatch):
+    """Replace the router: each call takes 50ms and reports the config it ran under."""
+    calls = []
+
+    def route(method, *args):
+        calls.append(method)
+        if method == "get_cashflow":
+            raise ConnectionError("vendor down")
+        time.sleep(0.05)
+        return f"{method} {args[0]} from {get_config()['data_cache_dir']}"
+
+    async def aroute(method, *args):
+        await asyncio.sleep(0)
+        return route(method, *args)
+
+    monkeypatch.setattr(prefetch, "route_to_vendor", route)
+    monkeypatch.setattr(prefetch, "aroute_to_vendor", aroute)
+    return calls
+
+
+def test_mode_is_read_per_run():
+    assert not prefetch.prefetch_enabled()
+    with use_config(PREFETCH):
+        assert prefetch.prefetch_enabled()
+
+
+def test_requests_run_concurrently_in_the_run_config(vendor):
+    requests = prefetch.fundamentals_requests("AAPL", "2024-05-07")
+
+    with use_config(PREFETCH):
+        started = time.monotonic()
+        sections = prefetch.fetch_all(requests)
+    elapsed = time.monotonic() - started
+
+    assert list(sections) == list(requests)
+    assert sections["Company fundamentals"] == "get_fundamentals AAPL from /tmp/prefetch-run"
+    # Failures become part of the data instead of failing the analyst
+    assert sections["Cash flow statement (quarterly)"] == (
+        "Error retrieving get_cashflow data: vendor down"
+    )
+    assert elapsed < 0.05 * 3
+
+
+def test_async_fetch_matches_sync(vendor):
+    requests = prefetch.news_requests("AAPL", "2024-05-07")
+    assert requests["News about AAPL"][1] == ("AAPL", "2024-04-30", "2024-05-07")
+
+    with use_config(PREFETCH):
+        sync = prefetch.fetch_all(requests)
+        async_ = asyncio.run(prefetch.afetch_all(requests))
+    assert async_ == sync
+
+
+def test_prompt_carries_the_prefetched_data(fake_llm):
+    chain = prefetch.chain_with_data(
+        fake_llm, "Analyze.", {"Prices": "Date,Close\n2024-05-07,10.0"}, "2024-05-07", "AAPL"
+    )
+    system = chain.first.invoke({"messages": []}).to_messages()[0].content
+
+    assert "Analyze." in system
+    assert "### Prices\nDate,Close\n2024-05-07,10.0" in system
+    assert system.endswith("The company we want to look at is AAPL")
+
+
+def test_market_analyst_makes_one_llm_call(vendor, fake_llm):
+    node = create_market_analyst(fake_llm)
+    state = {
+        "trade_date": "2024-05-07",
+        "company_of_interest": "AAPL",
+        "messages": [HumanMessage(content="AAPL")],
+    }
+
+    with use_config(PREFETCH):
+        update = node.invoke(state)
+        async_update = asyncio.run(node.ainvoke(state))
+
+    assert fake_llm.calls == 2
+    assert sorted(vendor) == sorted(["get_stock_data", "get_indicators_batch"] * 2)
+    assert update["market_report"] == update["messages"][0].content == "REPORT: AAPL"
+    assert not update["messages"][0].tool_calls
+    assert async_update["market_report"] == update["market_report"]
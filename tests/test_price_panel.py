@@ -0,0 +1,60 @@
+"""Building and reading the memory-mapped price panel."""
+
+import numpy as np
+import pandas as pd
+
+from tradingagents.dataflows.price_panel import build_price_panel, load_price_panel
+
+
+def build(store_prices):
+    aapl = store_prices("AAPL", start="2024-01-02", periods=40)
+    msft = store_prices("MSFT", start="2024-01-16", periods=20)
+    build_price_panel(["aapl", "MSFT", "AAPL"], online=False)
+    return aapl, msft, load_price_panel()
+
+
+def test_panel_aligns_symbols_on_one_date_axis(store_prices):
+    aapl, msft, panel = build(store_prices)
+
+    assert panel.symbols == ["AAPL", "MSFT"]
+    assert panel.shape == (2, 40, 5)
+    assert isinstance(panel.values, np.memmap)
+    assert panel.values.dtype == np.float32
+
+    close = panel.field("Close")
+    assert np.isnan(close[1, :10]).all()
+    np.testing.assert_allclose(close[1, 10:30], msft["Close"], rtol=1e-6)
+    np.testing.assert_allclose(close[0], aapl["Close"], rtol=1e-6)
+
+
+def test_symbol_frame_drops_missing_bars(store_prices):
+    _, msft, panel = build(store_prices)
+    frame = panel.symbol_frame("msft")
+
+    assert frame.index.equals(pd.DatetimeIndex(msft["Date"]))
+    np.testing.assert_allclose(frame["Volume"], msft["Volume"], rtol=1e-6)
+
+
+def test_vectorized_returns_and_sma(store_prices):
+    aapl, _, panel = build(store_prices)
+    close = aapl["Close"]
+
+    returns = panel.returns()
+    assert np.isnan(returns[:, 0]).all()
+    np.testing.assert_allclose(returns[0, 1:], close.pct_change().to_numpy()[1:], atol=1e-6)
+
+    sma = panel.sma(5)
+    np.testing.assert_allclose(sma[0], close.rolling(5, min_periods=1).mean(), rtol=1e-5)
+    assert np.isnan(sma[1, :10]).all()
+
+
+def test_date_slice_is_inclusive(store_prices):
+    _, _, panel = build(store_prices)
+    window = panel.date_slice("2024-01-16", "2024-01-19")
+
+    assert list(panel.dates[window].strftime("%Y-%m-%d")) == [
+        "2024-01-16",
+        "2024-01-17",
+        "2024-01-18",
+        "2024-01-19",
+    ]
@@ -0,0 +1,273 @@
+"""The Parquet price store: layout, incremental refreshes and merges."""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from tradingagents.dataflows import price_store
+from tradingagents.dataflows.config import use_config
+
+
+def bars(start, periods, close=100.0):
+    dates = pd.bdate_range(start, periods=periods)
+    data = pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": 1000,
+        },
+        index=pd.DatetimeIndex(dates, name="Date"),
+    )
+    return price_store.normalize_prices(data)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    downloads = []
+
+    def download_prices(symbol, start, end):
+        downloads.append((symbol, start, end))
+        return bars(start, 10, close=50.0)
+
+    monkeypatch.setattr(price_store, "download_prices", download_prices)
+    with use_config({"data_cache_dir": str(tmp_path)}):
+        yield downloads
+
+
+def test_round_trip_keeps_types_and_metadata(store):
+    data = bars("2024-01-02", 5)
+    price_store.write_prices("aapl", data, fetched_on="2024-01-09")
+
+    path = price_store.get_store_path("aapl")
+    assert path.endswith("prices/symbol=AAPL/ohlcv.parquet")
+    stored = price_store.read_prices("AAPL")
+    pd.testing.assert_frame_equal(stored, data)
+    assert stored["Date"].dtype == "datetime64[ns]"
+    assert stored["Volume"].dtype == "int64"
+    assert price_store.read_store_metadata("AAPL") == {"fetched_on": "2024-01-09"}
+
+
+def test_normalize_prices_drops_timezone_and_fills_columns():
+    index = pd.DatetimeIndex(
+        ["2024-01-03", "2024-01-02", "2024-01-03"], tz="America/New_York", name="Date"
+    )
+    raw = pd.DataFrame(
+        {
+            "Open": [2.0, 1.0, 3.0],
+            "High": 4.0,
+            "Low": 0.5,
+            "Close": [2.0, 1.0, 3.0],
+            "Volume": [10.0, None, 30.0],
+        },
+        index=index,
+    )
+    data = price_store.normalize_prices(raw)
+
+    assert list(data.columns) == ["Date"] + price_store.PRICE_COLUMNS
+    assert data["Date"].dt.tz is None
+    # Sorted by date, the last duplicate wins
+    assert data["Close"].tolist() == [1.0, 3.0]
+    assert data["Volume"].tolist() == [0, 30]
+    assert (data["Dividends"] == 0.0).all()
+
+
+def test_offline_reads_need_a_stored_symbol(store):
+    with pytest.raises(Exception, match="not fetched yet"):
+        price_store.get_price_history("AAPL", online=False)
+
+
+def test_store_is_refreshed_once_per_day(store):
+    today = pd.Timestamp.today().strftime("%Y-%m-%d")
+    price_store.write_prices("AAPL", bars("2024-01-02", 5), fetched_on=today)
+
+    assert len(price_store.get_price_history("AAPL")) == 5
+    assert store == []
+
+
+def test_stale_store_downloads_only_the_tail(store, monkeypatch):
+    cached = bars("2024-01-02", 20)
+    price_store.write_prices(
+        "AAPL", cached, fetched_on="2024-01-29", covered_from="2010-01-04"
+    )
+    downloads = []
+
+    def download_prices(symbol, start, end):
+        downloads.append(start)
+        return bars(start, 10)
+
+    monkeypatch.setattr(price_store, "download_prices", download_prices)
+    data = price_store.get_price_history("AAPL")
+
+    # Only the last OVERLAP_BARS stored bars are fetched again
+    assert downloads == [cached["Date"].iloc[-price_store.OVERLAP_BARS].strftime("%Y-%m-%d")]
+    assert len(data) == 20 + 10 - price_store.OVERLAP_BARS
+    metadata = price_store.read_store_metadata("AAPL")
+    assert metadata["fetched_on"] == pd.Timestamp.today().strftime("%Y-%m-%d")
+    assert metadata["covered_from"] == "2010-01-04"
+
+
+def test_disjoint_ranges_merge_without_repull(store):
+    cached = bars("2024-03-01", 20)
+    fresh = bars("2024-01-02", 20)
+
+    merged = price_store._merge_prices("AAPL", cached, fresh, "2024-06-01")
+
+    assert store == []
+    assert len(merged) == 40
+    assert merged["Date"].is_monotonic_increasing
+
+
+def test_matching_overlap_appends_tail(store):
+    cached = bars("2024-01-02", 20)
+    fresh = bars(cached["Date"].iloc[-5], 10)
+
+    merged = price_store._merge_prices("AAPL", cached, fresh, "2024-06-01")
+
+    assert store == []
+    assert len(merged) == 25
+
+
+def test_readjusted_overlap_repulls_history(store):
+    cached = bars("2024-01-02", 20)
+    fresh = bars(cached["Date"].iloc[-5], 10, close=50.0)
+
+    price_store._merge_prices("AAPL", cached, fresh, "2024-06-01")
+
+    assert len(store) == 1
+    assert store[0][1] <= "2024-01-02"
+
+
+def test_prefetch_head_range_extends_store(store, monkeypatch):
+    price_store.write_prices(
+        "AAPL",
+        bars("2024-03-01", 20),
+        fetched_on="2024-06-01",
+        covered_from="2024-03-01",
+        covered_until="2024-06-01",
+    )
+    monkeypatch.setattr(
+        price_store,
+        "_download_batch",
+        lambda symbols, start, end: {s: bars(start, 20) for s in symbols},
+    )
+
+    status = price_store.prefetch_universe(["AAPL"], start="2024-01-02", end="2024-02-01")
+
+    assert status == {"AAPL": "ok"}
+    assert store == []
+    assert len(price_store.read_prices("AAPL")) == 40
+    assert price_store.read_store_metadata("AAPL")["covered_from"] == "2024-03-01"
+
+
+def test_prefetch_batches_symbols_by_start(store, monkeypatch):
+    today = pd.Timestamp.today().strftime("%Y-%m-%d")
+    price_store.write_prices("MSFT", bars("2024-01-02", 5), fetched_on=today)
+    batches = []
+
+    def download_batch(symbols, start, end):
+        batches.append((sorted(symbols), start))
+        return {s: bars("2024-01-02", 20) if s != "GONE" else pd.DataFrame() for s in symbols}
+
+    monkeypatch.setattr(price_store, "_download_batch", download_batch)
+    status = price_store.prefetch_universe(["aapl", "nvda", "MSFT", "gone", "AAPL"])
+
+    assert status == {
+        "MSFT": "cached",
+        "AAPL": "ok",
+        "NVDA": "ok",
+        "GONE": "failed: no data returned",
+    }
+    # New symbols share one multi-ticker request for the full history window
+    assert batches == [(["AAPL", "GONE", "NVDA"], price_store._history_start())]
+    assert price_store.read_store_metadata("AAPL")["fetched_on"] == today
+    assert store == []
+
+
+def test_covered_range_is_served_from_disk(store):
+    today = pd.Timestamp.today().strftime("%Y-%m-%d")
+    price_store.write_prices(
+        "AAPL",
+        bars("2024-01-02", 20),
+        fetched_on=today,
+        covered_from="2024-01-02",
+        covered_until=today,
+    )
+
+    data = price_store.get_price_range("aapl", "2024-01-05", "2024-01-12")
+
+    assert store == []
+    # The end date is exclusive
+    assert data["Date"].dt.strftime("%Y-%m-%d").tolist() == [
+        "2024-01-05",
+        "2024-01-08",
+        "2024-01-09",
+        "2024-01-10",
+        "2024-01-11",
+    ]
+
+
+def test_earlier_range_downloads_only_the_head(store, monkeypatch):
+    today = pd.Timestamp.today().strftime("%Y-%m-%d")
+    cached = bars("2024-03-01", 20)
+    price_store.write_prices(
+        "AAPL", cached, fetched_on=today, covered_from="2024-03-01", covered_until=today
+    )
+    downloads = []
+
+    def download_prices(symbol, start, end):
+        downloads.append((start, end))
+        return bars(start, len(pd.bdate_range(start, end, inclusive="left")))
+
+    monkeypatch.setattr(price_store, "download_prices", download_prices)
+    data = price_store.get_price_range("AAPL", "2024-02-01", "2024-03-05")
+
+    assert downloads == [("2024-02-01", price_store._head_overlap_end(cached))]
+    assert data["Date"].iloc[0] == pd.Timestamp("2024-02-01")
+    assert data["Date"].iloc[-1] == pd.Timestamp("2024-03-04")
+    # 21 February business days ahead of the 20 stored bars
+    assert len(price_store.read_prices("AAPL")) == 21 + 20
+    assert price_store.read_store_metadata("AAPL")["covered_from"] == "2024-02-01"
+
+    # The extended range is now covered
+    price_store.get_price_range("AAPL", "2024-02-05", "2024-03-05")
+    assert len(downloads) == 1
+
+
+def test_prefetch_after_a_gap_downloads_the_gap(store, monkeypatch):
+    cached = bars("2015-01-02", 60)
+    price_store.write_prices(
+        "AAPL",
+        cached,
+        fetched_on="2015-03-27",
+        covered_from="2015-01-02",
+        covered_until="2015-03-27",
+    )
+    downloads = []
+
+    def download_prices(symbol, start, end):
+        downloads.append((start, end))
+        return bars(start, len(pd.bdate_range(start, end, inclusive="left")))
+
+    monkeypatch.setattr(price_store, "download_prices", download_prices)
+    monkeypatch.setattr(
+        price_store,
+        "_download_batch",
+        lambda symbols, start, end: {s: bars(start, 20) for s in symbols},
+    )
+
+    assert price_store.prefetch_universe(["AAPL"], start="2016-01-04") == {"AAPL": "ok"}
+
+    # The gap is downloaded with an overlap on the stored tail
+    assert downloads == [(price_store._overlap_start(cached), "2016-01-04")]
+    stored = price_store.read_prices("AAPL")
+    assert stored["Date"].tolist() == list(pd.bdate_range("2015-01-02", periods=len(stored)))
+    metadata = price_store.read_store_metadata("AAPL")
+    assert metadata["covered_from"] == "2015-01-02"
+    assert metadata["covered_until"] == pd.Timestamp.today().strftime("%Y-%m-%d")
+
+    gap = price_store.get_price_range("AAPL", "2015-06-01", "2015-07-01")
+    assert len(gap) == 22
+    assert len(downloads) == 1
@@ -0,0 +1,62 @@
+"""Memoized indicator frames and the per-date indicator lookups built on them."""
+
+import pytest
+
+from tradingagents.dataflows import stockstats_utils
+from tradingagents.dataflows.stockstats_utils import StockstatsUtils, get_indicator_frame
+
+
+@pytest.fixture
+def computations(store_prices, monkeypatch):
+    calls = []
+    compute = stockstats_utils.compute_indicator_frame
+
+    def counting_compute(data):
+        calls.append(len(data))
+        return compute(data)
+
+    monkeypatch.setattr(stockstats_utils, "compute_indicator_frame", counting_compute)
+    monkeypatch.setattr(stockstats_utils, "_indicator_frames", stockstats_utils.OrderedDict())
+    return calls
+
+
+def test_indicator_frame_is_computed_once_per_refresh(store_prices, computations):
+    store_prices("AAPL")
+    frame = get_indicator_frame("aapl")
+
+    assert get_indicator_frame("AAPL") is frame
+    assert list(frame.columns) == list(stockstats_utils.SUPPORTED_INDICATORS)
+    assert len(computations) == 1
+
+    # New prices (a new fetched_at) invalidate the memoized frame
+    store_prices("AAPL", fetched_at="2024-01-02 18:00:00")
+    assert get_indicator_frame("AAPL") is not frame
+    assert len(computations) == 2
+
+
+def test_memoized_frames_are_bounded(store_prices, computations, monkeypatch):
+    monkeypatch.setattr(stockstats_utils, "_MAX_INDICATOR_FRAMES", 2)
+    for symbol in ("AAPL", "MSFT", "NVDA"):
+        store_prices(symbol, periods=50)
+        get_indicator_frame(symbol)
+
+    assert len(stockstats_utils._indicator_frames) == 2
+    get_indicator_frame("AAPL")
+    assert len(computations) == 4
+
+
+def test_get_stock_stats_reads_one_date(store_prices, computations):
+    data = store_prices("AAPL")
+    frame = get_indicator_frame("AAPL")
+    date = data["Date"].iloc[250]
+
+    value = StockstatsUtils.get_stock_stats("AAPL", "rsi", date.strftime("%Y-%m-%d"))
+    assert value == frame.loc[date, "rsi"]
+    # 2023-12-30 is a Saturday
+    assert StockstatsUtils.get_stock_stats("AAPL", "rsi", "2023-12-30").startswith("N/A")
+
+
+def test_unsupported_indicators_fall_back_to_stockstats(store_prices, computations):
+    store_prices("AAPL")
+    value = StockstatsUtils.get_stock_stats("AAPL", "close_20_sma", "2023-06-01")
+    assert isinstance(value, float)
@@ -0,0 +1,149 @@
+"""One TradingAgentsGraph serving many runs: graph cache, config and isolation."""
+
+import asyncio
+import json
+import threading
+
+from tradingagents.dataflows import http_transport
+from tradingagents.dataflows.config import get_config
+
+TRADE_DATE = "2024-05-10"
+
+
+def debate_count(final_state):
+    return final_state["investment_debate_state"]["count"]
+
+
+def test_graphs_are_cached_per_settings(make_graph):
+    ta = make_graph(max_debate_rounds=2)
+
+    assert ta.get_graph() is ta.graph
+    assert ta.get_graph(["market", "news", "fundamentals"], 2) is ta.graph
+    assert ta.get_graph(max_debate_rounds=1) is ta.get_graph(max_debate_rounds=1)
+    assert ta.get_graph(["market"]) is not ta.graph
+
+
+def test_zero_rounds_are_not_replaced_by_config(make_graph):
+    ta = make_graph(max_debate_rounds=2)
+
+    assert ta.get_graph(max_debate_rounds=0) is not ta.graph
+    assert (("market", "news", "fundamentals"), 0, 1) in ta._graphs
+
+    final_state, _ = ta.propagate("AAPL", TRADE_DATE, max_debate_rounds=0)
+    assert debate_count(final_state) == 1
+    final_state, _ = ta.propagate("AAPL", TRADE_DATE)
+    assert debate_count(final_state) == 4
+
+
+def test_graph_sets_process_default_config(make_graph):
+    ta = make_graph(max_debate_rounds=2)
+    # Code calling the dataflows directly after building the graph sees its config
+    assert get_config()["data_cache_dir"] == ta.config["data_cache_dir"]
+
+
+def test_propagate_many_isolates_jobs(make_graph, fake_llm, tmp_path):
+    ta = make_graph(["market", "news"])
+    jobs = [(f"T{i}", TRADE_DATE) for i in range(6)]
+
+    results = list(ta.propagate_many(jobs, max_concurrency=6))
+
+    assert sorted(r["ticker"] for r in results) == [ticker for ticker, _ in jobs]
+    for result in results:
+        assert result["error"] is None
+        final_state = result["final_state"]
+        assert final_state["company_of_interest"] == result["ticker"]
+        assert final_state["market_report"] == f"REPORT: {result['ticker']}"
+
+        log_path = (
+            tmp_path / "eval_results" / result["ticker"] / "TradingAgentsStrategy_logs"
+            / f"full_states_log_{TRADE_DATE}.json"
+        )
+        logged = json.loads(log_path.read_text())[TRADE_DATE]
+        assert logged["company_of_interest"] == result["ticker"]
+    assert fake_llm.peak > 1
+
+
+def test_propagate_many_reports_failures(make_graph, monkeypatch):
+    ta = make_graph(["market"])
+    log_state = ta._log_state
+
+    def failing_log_state(trade_date, final_state):
+        if final_state["company_of_interest"] == "BAD":
+            raise RuntimeError("disk full")
+        log_state(trade_date, final_state)
+
+    monkeypatch.setattr(ta, "_log_state", failing_log_state)
+    jobs = [("GOOD", TRADE_DATE), ("BAD", TRADE_DATE)]
+    results = {r["ticker"]: r for r in ta.propagate_many(jobs)}
+
+    assert results["GOOD"]["error"] is None
+    assert isinstance(results["BAD"]["error"], RuntimeError)
+    assert results["BAD"]["final_state"] is None
+
+
+def test_curr_state_is_per_thread(make_graph):
+    ta = make_graph(["market"])
+    ta.propagate("MAIN", TRADE_DATE)
+
+    thread = threading.Thread(target=ta.propagate, args=("OTHER", TRADE_DATE))
+    thread.start()
+    thread.join()
+
+    assert ta.curr_state["company_of_interest"] == "MAIN"
+
+
+def test_apropagate_many_shares_one_event_loop(make_graph, fake_llm):
+    ta = make_graph(["market", "news"])
+    jobs = [(f"A{i}", TRADE_DATE) for i in range(8)]
+
+    async def run():
+        return [r async for r in ta.apropagate_many(jobs, max_concurrency=8)]
+
+    results = asyncio.run(run())
+
+    assert all(r["error"] is None for r in results)
+    assert {r["final_state"]["market_report"] for r in results} == {
+        f"REPORT: {ticker}" for ticker, _ in jobs
+    }
+    assert fake_llm.peak > 1
+
+
+def test_apropagate_matches_propagate(make_graph, fake_llm):
+    ta = make_graph(["market", "news"])
+    final_state, decision = ta.propagate("AAPL", TRADE_DATE)
+
+    async def run():
+        return await asyncio.gather(
+            ta.apropagate("AAPL", TRADE_DATE), ta.apropagate("MSFT", TRADE_DATE)
+        )
+
+    (afinal_state, adecision), (other_state, _) = asyncio.run(run())
+
+    assert adecision == decision
+    for key in ("market_report", "news_report", "final_trade_decision"):
+        assert afinal_state[key] == final_state[key]
+    assert other_state["market_report"] == "REPORT: MSFT"
+    assert fake_llm.peak > 1
+
+
+def test_async_runs_close_their_http_clients(make_graph, monkeypatch):
+    ta = make_graph(["market"])
+    clients = []
+
+    async def fake_apropagate(company_name, trade_date, graph):
+        clients.append(http_transport.get_async_client("www.alphavantage.co")[0])
+        return {}, "HOLD"
+
+    monkeypatch.setattr(ta, "_apropagate", fake_apropagate)
+
+    async def run():
+        await ta.apropagate("AAPL", TRADE_DATE)
+        return [r async for r in ta.apropagate_many([("MSFT", TRADE_DATE), ("NVDA", TRADE_DATE)])]
+
+    results = asyncio.run(run())
+
+    assert [r["error"] for r in results] == [None, None]
+    # apropagate closes its client; the batch shares one, closed at the end
+    assert clients[0] is not clients[1]
+    assert clients[1] is clients[2]
+    assert all(client.is_closed for client in clients)
@@ -0,0 +1,112 @@
+"""TTL policies, LRU eviction and call caching of the vendor cache."""
+
+from datetime import datetime
+
+import pytest
+
+from tradingagents.dataflows import vendor_cache
+from tradingagents.dataflows.config import use_config
+
+
+@pytest.fixture
+def cache(tmp_path):
+    vendor_cache.reset_cache_stats()
+    with use_config({"data_cache_dir": str(tmp_path)}):
+        yield vendor_cache.get_cache_settings()
+
+
+def counting(value):
+    calls = []
+
+    def fetch(ticker, curr_date=None):
+        calls.append((ticker, curr_date))
+        return value
+
+    return fetch, calls
+
+
+def test_fundamentals_overview_expires_at_market_close(cache):
+    assert vendor_cache.ttl_for(cache, "get_fundamentals", "fundamental_data") == "market_close"
+    assert vendor_cache.ttl_for(cache, "get_balance_sheet", "fundamental_data") == "quarter"
+    assert vendor_cache.ttl_for(cache, "get_news", "news_data") == 3600
+
+
+def test_method_ttl_can_be_configured(tmp_path):
+    with use_config(
+        {"data_cache_dir": str(tmp_path), "vendor_cache": {"ttl": {"get_cashflow": None}}}
+    ):
+        settings = vendor_cache.get_cache_settings()
+    assert vendor_cache.ttl_for(settings, "get_cashflow", "fundamental_data") is None
+    assert vendor_cache.ttl_for(settings, "get_income_statement", "fundamental_data") == "quarter"
+
+
+def test_expiry_policies():
+    # Friday 2024-05-31 17:00 New York time is after the close
+    friday_evening = datetime(2024, 5, 31, 17, tzinfo=vendor_cache._MARKET_TZ).timestamp()
+    monday_close = datetime(2024, 6, 3, 16, tzinfo=vendor_cache._MARKET_TZ).timestamp()
+    assert vendor_cache.expiry_for("market_close", friday_evening) == monday_close
+
+    assert vendor_cache.expiry_for("quarter", datetime(2024, 11, 5).timestamp()) == (
+        datetime(2025, 1, 1).timestamp()
+    )
+    assert vendor_cache.expiry_for(60, 1000.0) == 1060.0
+    assert vendor_cache.expiry_for(None, 1000.0) is None
+
+
+def test_keys_normalize_arguments():
+    fetch, _ = counting("")
+    key = vendor_cache.make_key("get_fundamentals", "yfinance", fetch, ("aapl ",), {})
+    assert key == vendor_cache.make_key(
+        "get_fundamentals", "yfinance", fetch, (), {"ticker": "AAPL", "curr_date": None}
+    )
+
+
+def test_cached_call_serves_repeats_from_disk(cache):
+    fetch, calls = counting("overview")
+    for _ in range(3):
+        result = vendor_cache.cached_call(
+            "get_fundamentals", "fundamental_data", "yfinance", fetch, ("AAPL",), {}
+        )
+    assert result == "overview"
+    assert len(calls) == 1
+    stats = vendor_cache.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (2, 1, 1)
+
+
+def test_error_results_are_not_cached(cache):
+    fetch, calls = counting("Error: rate limited")
+    for _ in range(2):
+        vendor_cache.cached_call(
+            "get_fundamentals", "fundamental_data", "yfinance", fetch, ("AAPL",), {}
+        )
+    assert len(calls) == 2
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    value = "x" * 100
+    size = len(vendor_cache.json.dumps(value))
+    far_future = 4102444800.0
+
+    for key in ("a", "b", "c"):
+        vendor_cache.put_entry(key, "get_news", "yfinance", value, far_future, 3 * size)
+    # Touch "a" so "b" becomes the least recently used entry
+    assert vendor_cache.get_entry("a", "get_news") == (True, value)
+    vendor_cache.put_entry("d", "get_news", "yfinance", value, far_future, 3 * size)
+
+    assert vendor_cache.get_entry("b", "get_news") == (False, None)
+    for key in ("a", "c", "d"):
+        assert vendor_cache.get_entry(key, "get_news")[0]
+    assert vendor_cache.cache_stats()["evictions"] == 1
+
+
+def test_cache_failures_are_logged(cache, monkeypatch, caplog):
+    def broken(*args, **kwargs):
+        raise vendor_cache.sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(vendor_cache, "get_entry", broken)
+    fetch, calls = counting("overview")
+    result = vendor_cache.cached_call(
+        "get_fundamentals", "fundamental_data", "yfinance", fetch, ("AAPL",), {}
+    )
+    assert result == "overview"
+    assert "vendor cache read failed" in caplog.text
@@ -0,0 +1,170 @@
+"""Circuit breakers and hedged requests of the vendor router."""
+
+import asyncio
+import time
+
+import pytest
+
+from tradingagents.dataflows import interface, vendor_health
+from tradingagents.dataflows.config import use_config
+
+
+@pytest.fixture(autouse=True)
+def fresh_health():
+    vendor_health.reset_health()
+    yield
+    vendor_health.reset_health()
+
+
+def fail(vendor, method, times):
+    for _ in range(times):
+        vendor_health.record(vendor, method, 0.1, ok=False)
+
+
+def test_circuit_opens_after_consecutive_failures():
+    fail("alpha_vantage", "get_news", 2)
+    assert vendor_health.is_available("alpha_vantage", "get_news")
+
+    fail("alpha_vantage", "get_news", 1)
+    assert not vendor_health.is_available("alpha_vantage", "get_news")
+    assert vendor_health.order_vendors(["alpha_vantage", "yfinance"], "get_news") == [
+        "yfinance",
+        "alpha_vantage",
+    ]
+    # Circuits are per method
+    assert vendor_health.is_available("alpha_vantage", "get_stock_data")
+
+
+def test_success_resets_failure_streak():
+    fail("yfinance", "get_news", 2)
+    vendor_health.record("yfinance", "get_news", 0.1, ok=True)
+    fail("yfinance", "get_news", 2)
+    assert vendor_health.is_available("yfinance", "get_news")
+
+
+def test_circuit_half_opens_after_cool_down():
+    with use_config({"vendor_routing": {"cool_down_seconds": 0.05}}):
+        fail("yfinance", "get_news", 3)
+        assert not vendor_health.is_available("yfinance", "get_news")
+
+        time.sleep(0.06)
+        assert vendor_health.is_available("yfinance", "get_news")
+        # The streak is kept, so one more failure re-opens it
+        fail("yfinance", "get_news", 1)
+        assert not vendor_health.is_available("yfinance", "get_news")
+
+
+def test_timed_counts_error_strings_and_exceptions():
+    def error_string():
+        return "Error: invalid API key"
+
+    def raising():
+        raise ConnectionError("reset")
+
+    vendor_health.timed("alpha_vantage", "get_news", error_string)()
+    with pytest.raises(ConnectionError):
+        vendor_health.timed("alpha_vantage", "get_news", raising)()
+    vendor_health.timed("yfinance", "get_news", lambda: "news")()
+
+    report = vendor_health.health_report()
+    assert report["alpha_vantage.get_news"]["failures"] == 2
+    assert report["yfinance.get_news"]["error_rate"] == 0.0
+    assert report["yfinance.get_news"]["p95_latency"] is not None
+
+
+def test_hedge_delay_needs_hedging_and_enough_samples():
+    for _ in range(5):
+        vendor_health.record("yfinance", "get_news", 0.2, ok=True)
+    assert vendor_health.hedge_delay("yfinance", "get_news") is None
+
+    with use_config({"vendor_routing": {"hedge": True, "hedge_min_samples": 10}}):
+        assert vendor_health.hedge_delay("yfinance", "get_news") is None
+        for _ in range(5):
+            vendor_health.record("yfinance", "get_news", 0.2, ok=True)
+        assert vendor_health.hedge_delay("yfinance", "get_news") == pytest.approx(0.2)
+
+
+def slow(value, seconds, calls=None):
+    def call():
+        if calls is not None:
+            calls.append(value)
+        time.sleep(seconds)
+        return value
+
+    return call
+
+
+def test_run_hedged_returns_faster_secondary():
+    assert vendor_health.run_hedged(slow("primary", 0.5), slow("secondary", 0), 0.05) == (
+        "secondary"
+    )
+
+
+def test_run_hedged_skips_secondary_when_primary_is_fast():
+    calls = []
+    result = vendor_health.run_hedged(
+        slow("primary", 0, calls), slow("secondary", 0, calls), 0.5
+    )
+    assert result == "primary"
+    assert calls == ["primary"]
+
+
+def test_run_hedged_falls_back_to_primary_outcome():
+    result = vendor_health.run_hedged(
+        slow("Error: primary failed", 0.1), slow("Error: secondary failed", 0), 0.01
+    )
+    assert result == "Error: primary failed"
+
+
+def test_arun_hedged_returns_faster_secondary():
+    async def primary():
+        await asyncio.sleep(0.5)
+        return "primary"
+
+    async def secondary():
+        return "secondary"
+
+    assert asyncio.run(vendor_health.arun_hedged(primary, secondary, 0.05)) == "secondary"
+
+
+@pytest.fixture
+def vendors(tmp_path, monkeypatch):
+    calls = []
+
+    def vendor(name, result):
+        def fetch(ticker, start_date, end_date):
+            calls.append(name)
+            return result
+        return fetch
+
+    monkeypatch.setitem(
+        interface.VENDOR_METHODS,
+        "get_insider_transactions",
+        {
+            "alpha_vantage": vendor("alpha_vantage", "Error: rate limit"),
+            "yfinance": vendor("yfinance", "insider table"),
+        },
+    )
+    config = {
+        "data_cache_dir": str(tmp_path),
+        "vendor_cache": {"enabled": False},
+        "tool_vendors": {"get_insider_transactions": "alpha_vantage"},
+    }
+    with use_config(config):
+        yield calls
+
+
+def route_insider_transactions():
+    return interface.route_to_vendor(
+        "get_insider_transactions", "AAPL", "2024-01-01", "2024-02-01"
+    )
+
+
+def test_router_moves_open_circuits_to_the_back(vendors):
+    for _ in range(3):
+        assert route_insider_transactions() == "insider table"
+    assert vendors == ["alpha_vantage", "yfinance"] * 3
+
+    vendors.clear()
+    route_insider_transactions()
+    assert vendors == ["yfinance"]
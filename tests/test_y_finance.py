@@ -0,0 +1,100 @@
+"""Indicator reports of the yfinance vendor, served from the local price store."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows import stockstats_utils
+from tradingagents.dataflows.y_finance import (
+    _format_indicator_window,
+    get_YFin_data_online,
+    get_stock_stats_indicators_batch,
+    get_stock_stats_indicators_window,
+    get_stockstats_indicator,
+)
+
+NOT_TRADING = "N/A: Not a trading day (weekend or holiday)"
+
+
+@pytest.fixture(autouse=True)
+def fresh_frames(monkeypatch):
+    monkeypatch.setattr(stockstats_utils, "_indicator_frames", stockstats_utils.OrderedDict())
+
+
+def test_window_lists_every_calendar_day_newest_first():
+    # Thursday 2024-05-02 to Tuesday 2024-05-07
+    trading_days = pd.DatetimeIndex(["2024-05-02", "2024-05-03", "2024-05-06", "2024-05-07"])
+    series = pd.Series([1.5, np.nan, 2.25, 3.0], index=trading_days)
+    window = pd.date_range("2024-05-02", "2024-05-07")[::-1]
+
+    assert _format_indicator_window(series, window).splitlines() == [
+        "2024-05-07: 3.0",
+        "2024-05-06: 2.25",
+        f"2024-05-05: {NOT_TRADING}",
+        f"2024-05-04: {NOT_TRADING}",
+        "2024-05-03: N/A",
+        "2024-05-02: 1.5",
+    ]
+
+
+def test_window_report_matches_day_by_day_lookups(store_prices):
+    store_prices("AAPL")
+    report = get_stock_stats_indicators_window("AAPL", "macd", "2023-12-29", 10)
+
+    header, body = report.split("\n\n")[:2]
+    assert header == "## macd values from 2023-12-19 to 2023-12-29:"
+    lines = body.splitlines()
+    assert len(lines) == 11
+    for line in lines:
+        date_str, value = line.split(": ", 1)
+        assert value == get_stockstats_indicator("AAPL", "macd", date_str)
+    assert f"2023-12-24: {NOT_TRADING}" in lines
+
+
+def test_window_rejects_unknown_indicators():
+    with pytest.raises(ValueError, match="not supported"):
+        get_stock_stats_indicators_window("AAPL", "ichimoku", "2024-05-07", 5)
+
+
+def test_stock_data_is_read_from_the_store(store_prices):
+    store_prices("AAPL", start="2024-01-02", periods=20)
+    report = get_YFin_data_online("aapl", "2024-01-08", "2024-01-12")
+
+    header, csv = report.split("\n\n", 1)
+    assert header.splitlines()[:2] == [
+        "# Stock data for AAPL from 2024-01-08 to 2024-01-12",
+        "# Total records: 4",
+    ]
+    lines = csv.splitlines()
+    assert lines[0].startswith("Date,Open,High,Low,Close,Volume")
+    assert [line.split(",")[0] for line in lines[1:]] == [
+        "2024-01-08",
+        "2024-01-09",
+        "2024-01-10",
+        "2024-01-11",
+    ]
+
+
+def test_batch_table_matches_single_lookups(store_prices):
+    store_prices("AAPL")
+    report = get_stock_stats_indicators_batch("AAPL", ["rsi", "macd", "rsi"], "2023-12-29", 10)
+
+    header, table, descriptions = report.split("\n\n")
+    assert header.startswith("## Technical indicators for AAPL from 2023-12-19 to 2023-12-29")
+    rows = table.splitlines()
+    assert rows[0] == "Date,rsi,macd"
+    # Trading days only, newest first
+    dates = [row.split(",")[0] for row in rows[1:]]
+    assert dates == sorted(dates, reverse=True)
+    assert dates[0] == "2023-12-29" and "2023-12-24" not in dates
+    for row in rows[1:]:
+        date_str, rsi, macd = row.split(",")
+        for name, value in (("rsi", rsi), ("macd", macd)):
+            expected = float(get_stockstats_indicator("AAPL", name, date_str))
+            assert float(value) == pytest.approx(expected, abs=1e-4)
+    assert descriptions.count("- rsi:") == 1
+
+
+def test_batch_rejects_unknown_indicators():
+    with pytest.raises(ValueError, match="ichimoku"):
+        get_stock_stats_indicators_batch("AAPL", ["rsi", "ichimoku"], "2024-05-07", 5)
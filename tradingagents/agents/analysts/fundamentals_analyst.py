@@ -1,8 +1,19 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
-from tradingagents.agents.utils.agent_utils import get_fundamentals, get_balance_sheet, get_cashflow, get_income_statement, get_insider_transactions
+from tradingagents.agents.utils.agent_utils import agent_node, get_fundamentals, get_balance_sheet, get_cashflow, get_income_statement, get_insider_transactions
 from tradingagents.dataflows.config import get_config
+from tradingagents.agents.utils.prefetch import (
+    chain_with_data,
+    fetch_data,
+    fundamentals_requests,
+    prefetch_enabled,
+)
+
+# System message of the direct-injection mode, where the data is in the prompt
+DIRECT_SYSTEM_MESSAGE = (
+    "You are a researcher tasked with analyzing fundamental information over the past week about a company. The company's profile and key metrics and its latest balance sheet, cash flow statement and income statement are provided below. Please write a comprehensive report of the company's fundamental information such as financial documents, company profile, basic company financials, and company financial history to gain a full view of the company's fundamental information to inform traders. Make sure to include as much detail as possible. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions. Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."
+)
 
 
 def create_fundamentals_analyst(llm):
@@ -11,6 +22,18 @@ def create_fundamentals_analyst(llm):
         ticker = state["company_of_interest"]
         company_name = state["company_of_interest"]
 
+        if prefetch_enabled():
+            # Data fetched in parallel up front, then a single LLM call
+            sections = yield fetch_data, fundamentals_requests(ticker, current_date)
+            result = yield (
+                chain_with_data(llm, DIRECT_SYSTEM_MESSAGE, sections, current_date, ticker),
+                state["messages"],
+            )
+            return {
+                "messages": [result],
+                "fundamentals_report": result.content,
+            }
+
         tools = [
             get_fundamentals,
             get_balance_sheet,
@@ -48,7 +71,7 @@ def create_fundamentals_analyst(llm):
 
         chain = prompt | llm.bind_tools(tools)
 
-        result = chain.invoke(state["messages"])
+        result = yield chain, state["messages"]
 
         report = ""
 
@@ -60,4 +83,4 @@ def create_fundamentals_analyst(llm):
             "fundamentals_report": report,
         }
 
-    return fundamentals_analyst_node
+    return agent_node(fundamentals_analyst_node)
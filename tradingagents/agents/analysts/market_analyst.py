@@ -1,8 +1,19 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
-from tradingagents.agents.utils.agent_utils import get_stock_data, get_indicators
+from tradingagents.agents.utils.agent_utils import agent_node, get_stock_data, get_indicators, get_indicators_batch
 from tradingagents.dataflows.config import get_config
+from tradingagents.agents.utils.prefetch import (
+    chain_with_data,
+    fetch_data,
+    market_requests,
+    prefetch_enabled,
+)
+
+# System message of the direct-injection mode, where the data is in the prompt
+DIRECT_SYSTEM_MESSAGE = (
+    "You are a trading assistant tasked with analyzing financial markets. Recent OHLCV price data and a set of complementary technical indicators (moving averages, MACD, RSI, Bollinger Bands, ATR and VWMA), each followed by a description of how to read it, are provided below. Focus on the indicators most relevant to the current market condition and briefly explain why they are suitable. Write a very detailed and nuanced report of the trends you observe. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions. Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."
+)
 
 
 def create_market_analyst(llm):
@@ -12,9 +23,22 @@ def create_market_analyst(llm):
         ticker = state["company_of_interest"]
         company_name = state["company_of_interest"]
 
+        if prefetch_enabled():
+            # Data fetched in parallel up front, then a single LLM call
+            sections = yield fetch_data, market_requests(ticker, current_date)
+            result = yield (
+                chain_with_data(llm, DIRECT_SYSTEM_MESSAGE, sections, current_date, ticker),
+                state["messages"],
+            )
+            return {
+                "messages": [result],
+                "market_report": result.content,
+            }
+
         tools = [
             get_stock_data,
             get_indicators,
+            get_indicators_batch,
         ]
 
         system_message = (
@@ -42,7 +66,7 @@ Volatility Indicators:
 Volume-Based Indicators:
 - vwma: VWMA: A moving average weighted by volume. Usage: Confirm trends by integrating price action with volume data. Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses.
 
-- Select indicators that provide diverse and complementary information. Avoid redundancy (e.g., do not select both rsi and stochrsi). Also briefly explain why they are suitable for the given market context. When you tool call, please use the exact name of the indicators provided above as they are defined parameters, otherwise your call will fail. Please make sure to call get_stock_data first to retrieve the CSV that is needed to generate indicators. Then use get_indicators with the specific indicator names. Write a very detailed and nuanced report of the trends you observe. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."""
+- Select indicators that provide diverse and complementary information. Avoid redundancy (e.g., do not select both rsi and stochrsi). Also briefly explain why they are suitable for the given market context. When you tool call, please use the exact name of the indicators provided above as they are defined parameters, otherwise your call will fail. Please make sure to call get_stock_data first to retrieve the CSV that is needed to generate indicators. Then call get_indicators_batch once with the list of selected indicator names to retrieve all of them as one table (get_indicators retrieves a single indicator). Write a very detailed and nuanced report of the trends you observe. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."""
             + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
         )
 
@@ -70,7 +94,7 @@ Volume-Based Indicators:
 
         chain = prompt | llm.bind_tools(tools)
 
-        result = chain.invoke(state["messages"])
+        result = yield chain, state["messages"]
 
         report = ""
 
@@ -82,4 +106,4 @@ Volume-Based Indicators:
             "market_report": report,
         }
 
-    return market_analyst_node
+    return agent_node(market_analyst_node)
@@ -1,8 +1,19 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
-from tradingagents.agents.utils.agent_utils import get_news, get_global_news
+from tradingagents.agents.utils.agent_utils import agent_node, get_news, get_global_news
 from tradingagents.dataflows.config import get_config
+from tradingagents.agents.utils.prefetch import (
+    chain_with_data,
+    fetch_data,
+    news_requests,
+    prefetch_enabled,
+)
+
+# System message of the direct-injection mode, where the data is in the prompt
+DIRECT_SYSTEM_MESSAGE = (
+    "You are a news researcher tasked with analyzing recent news and trends over the past week. Company-specific news and broader macroeconomic news for the past week are provided below. Please write a comprehensive report of the current state of the world that is relevant for trading and macroeconomics. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions. Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."
+)
 
 
 def create_news_analyst(llm):
@@ -10,6 +21,18 @@ def create_news_analyst(llm):
         current_date = state["trade_date"]
         ticker = state["company_of_interest"]
 
+        if prefetch_enabled():
+            # Data fetched in parallel up front, then a single LLM call
+            sections = yield fetch_data, news_requests(ticker, current_date)
+            result = yield (
+                chain_with_data(llm, DIRECT_SYSTEM_MESSAGE, sections, current_date, ticker),
+                state["messages"],
+            )
+            return {
+                "messages": [result],
+                "news_report": result.content,
+            }
+
         tools = [
             get_news,
             get_global_news,
@@ -43,7 +66,7 @@ def create_news_analyst(llm):
         prompt = prompt.partial(ticker=ticker)
 
         chain = prompt | llm.bind_tools(tools)
-        result = chain.invoke(state["messages"])
+        result = yield chain, state["messages"]
 
         report = ""
 
@@ -55,4 +78,4 @@ def create_news_analyst(llm):
             "news_report": report,
         }
 
-    return news_analyst_node
+    return agent_node(news_analyst_node)
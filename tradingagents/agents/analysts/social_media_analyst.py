@@ -1,42 +1,71 @@
 import os
-import requests
+from tradingagents.dataflows import http_transport
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import RunnableLambda
 import time
 import json
-from tradingagents.agents.utils.agent_utils import get_news
+from tradingagents.agents.utils.agent_utils import agent_node, get_news
 from tradingagents.dataflows.config import get_config
 
 # ==============================================================================
 # 【修改 1】把它变成一个普通的 Python 函数，去掉 @tool 装饰器
 # ==============================================================================
-def perform_brave_search(query: str) -> str:
-    """自动在后台搜索社交媒体数据，直接喂给大模型"""
+def _brave_request(query: str):
     api_key = os.environ.get("BRAVE_API_KEY")
     if not api_key:
-        return "Brave Search API Key missing."
-    
+        return None
     url = "https://api.search.brave.com/res/v1/web/search"
     headers = {
         "Accept": "application/json",
         "X-Subscription-Token": api_key
     }
     params = {"q": query, "count": 5} 
+    return url, {"headers": headers, "params": params}
+
+
+def _format_brave_results(data: dict) -> str:
+    results = []
+    for result in data.get("web", {}).get("results", []):
+        title = result.get("title", "")
+        description = result.get("description", "")
+        results.append(f"- {title}: {description}")
+        
+    return "\n".join(results) if results else "No social media discussions found."
+
+
+def perform_brave_search(query: str) -> str:
+    """自动在后台搜索社交媒体数据，直接喂给大模型"""
+    request = _brave_request(query)
+    if request is None:
+        return "Brave Search API Key missing."
+    url, kwargs = request
     
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = http_transport.get(url, **kwargs)
         response.raise_for_status()
-        data = response.json()
-        
-        results = []
-        for result in data.get("web", {}).get("results", []):
-            title = result.get("title", "")
-            description = result.get("description", "")
-            results.append(f"- {title}: {description}")
-            
-        return "\n".join(results) if results else "No social media discussions found."
+        return _format_brave_results(response.json())
     except Exception as e:
         return f"Brave Search API error: {e}"
 
+
+async def aperform_brave_search(query: str) -> str:
+    """perform_brave_search 的异步版本（httpx，不阻塞事件循环）"""
+    request = _brave_request(query)
+    if request is None:
+        return "Brave Search API Key missing."
+    url, kwargs = request
+
+    try:
+        response = await http_transport.aget(url, **kwargs)
+        response.raise_for_status()
+        return _format_brave_results(response.json())
+    except Exception as e:
+        return f"Brave Search API error: {e}"
+
+
+# 节点里 yield 这个 runnable：同步图走 perform_brave_search，异步图走 aperform_brave_search
+brave_search = RunnableLambda(perform_brave_search, afunc=aperform_brave_search, name="brave_search")
+
 # ==============================================================================
 # 【修改 2】修改 Analyst 节点逻辑
 # ==============================================================================
@@ -53,7 +82,7 @@ def create_social_media_analyst(llm):
 
         # 🔥 【核心魔法】：在构建大模型请求前，Python 自动执行 Brave 搜索
         brave_query = f"{ticker} stock social media sentiment Reddit Twitter opinion"
-        brave_search_results = perform_brave_search(brave_query)
+        brave_search_results = yield brave_search, brave_query
 
         # 🔥 【核心魔法】：将搜到的数据直接“硬塞”给系统提示词
         system_message = (
@@ -94,7 +123,7 @@ def create_social_media_analyst(llm):
 
         chain = prompt | llm.bind_tools(tools)
 
-        result = chain.invoke(state["messages"])
+        result = yield chain, state["messages"]
 
         report = ""
 
@@ -106,4 +135,4 @@ def create_social_media_analyst(llm):
             "sentiment_report": report,
         }
 
-    return social_media_analyst_node
+    return agent_node(social_media_analyst_node)
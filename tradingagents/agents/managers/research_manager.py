@@ -1,6 +1,8 @@
 import time
 import json
 
+from tradingagents.agents.utils.agent_utils import agent_node
+
 
 def create_research_manager(llm, memory):
     def research_manager_node(state) -> dict:
@@ -36,7 +38,7 @@ Here are your past reflections on mistakes:
 Here is the debate:
 Debate History:
 {history}"""
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         new_investment_debate_state = {
             "judge_decision": response.content,
@@ -52,4 +54,4 @@ Debate History:
             "investment_plan": response.content,
         }
 
-    return research_manager_node
+    return agent_node(research_manager_node)
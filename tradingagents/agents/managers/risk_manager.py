@@ -1,6 +1,8 @@
 import time
 import json
 
+from tradingagents.agents.utils.agent_utils import agent_node
+
 
 def create_risk_manager(llm, memory):
     def risk_manager_node(state) -> dict:
@@ -43,7 +45,7 @@ Deliverables:
 
 Focus on actionable insights and continuous improvement. Build on past lessons, critically evaluate all perspectives, and ensure each decision advances better outcomes."""
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         new_risk_debate_state = {
             "judge_decision": response.content,
@@ -63,4 +65,4 @@ Focus on actionable insights and continuous improvement. Build on past lessons,
             "final_trade_decision": response.content,
         }
 
-    return risk_manager_node
+    return agent_node(risk_manager_node)
@@ -1,6 +1,8 @@
 import time
 import json
 
+from tradingagents.agents.utils.agent_utils import agent_node
+
 
 def create_aggressive_debator(llm):
     def aggressive_node(state) -> dict:
@@ -32,7 +34,7 @@ Here is the current conversation history: {history} Here are the last arguments
 
 Engage actively by addressing any specific concerns raised, refuting the weaknesses in their logic, and asserting the benefits of risk-taking to outpace market norms. Maintain a focus on debating and persuading, not just presenting data. Challenge each counterpoint to underscore why a high-risk approach is optimal. Output conversationally as if you are speaking without any special formatting."""
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         argument = f"Aggressive Analyst: {response.content}"
 
@@ -52,4 +54,4 @@ Engage actively by addressing any specific concerns raised, refuting the weaknes
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return aggressive_node
+    return agent_node(aggressive_node)
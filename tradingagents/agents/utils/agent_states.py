@@ -47,6 +47,27 @@ class RiskDebateState(TypedDict):
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
 
 
+def merge_round_responses(current: Optional[dict], update: Optional[dict]) -> dict:
+    """Collect one risk-debate round's arguments; a ``None`` update clears them."""
+    if update is None:
+        return {}
+    return {**(current or {}), **update}
+
+
+# State of one analyst's tool-calling loop when the analysts run in parallel;
+# each analyst gets its own message channel
+class AnalystState(MessagesState):
+    company_of_interest: Annotated[str, "Company that we are interested in trading"]
+    trade_date: Annotated[str, "What date we are trading at"]
+
+    market_report: Annotated[str, "Report from the Market Analyst"]
+    sentiment_report: Annotated[str, "Report from the Social Media Analyst"]
+    news_report: Annotated[
+        str, "Report from the News Researcher of current world affairs"
+    ]
+    fundamentals_report: Annotated[str, "Report from the Fundamentals Researcher"]
+
+
 class AgentState(MessagesState):
     company_of_interest: Annotated[str, "Company that we are interested in trading"]
     trade_date: Annotated[str, "What date we are trading at"]
@@ -73,4 +94,7 @@ class AgentState(MessagesState):
     risk_debate_state: Annotated[
         RiskDebateState, "Current state of the debate on evaluating risk"
     ]
+    # arguments of the current round when the risk debaters run in parallel,
+    # keyed by speaker; emptied once the round is merged into risk_debate_state
+    risk_round_responses: Annotated[dict, merge_round_responses]
     final_trade_decision: Annotated[str, "Final decision made by the Risk Analysts"]
@@ -1,11 +1,13 @@
 from langchain_core.messages import HumanMessage, RemoveMessage
+from langchain_core.runnables import RunnableLambda
 
 # Import tools from separate utility files
 from tradingagents.agents.utils.core_stock_tools import (
     get_stock_data
 )
 from tradingagents.agents.utils.technical_indicators_tools import (
-    get_indicators
+    get_indicators,
+    get_indicators_batch
 )
 from tradingagents.agents.utils.fundamental_data_tools import (
     get_fundamentals,
@@ -19,6 +21,38 @@ from tradingagents.agents.utils.news_data_tools import (
     get_global_news
 )
 
+def agent_node(step):
+    """Build a graph node that runs under both ``invoke`` and ``ainvoke``.
+
+    ``step(state)`` is a generator: it yields ``(runnable, input)`` for each
+    LLM chain or data fetch it needs, receives the result, and returns the
+    state update. The sync node runs those with ``runnable.invoke``, the
+    async one awaits ``runnable.ainvoke``, so the prompt logic is written once.
+    """
+
+    def run(state):
+        steps = step(state)
+        try:
+            runnable, step_input = next(steps)
+            while True:
+                runnable, step_input = steps.send(runnable.invoke(step_input))
+        except StopIteration as done:
+            return done.value
+
+    async def arun(state):
+        steps = step(state)
+        try:
+            runnable, step_input = next(steps)
+            while True:
+                runnable, step_input = steps.send(await runnable.ainvoke(step_input))
+        except StopIteration as done:
+            return done.value
+
+    # functools.partial steps (the trader) are named after the wrapped function
+    name = getattr(getattr(step, "func", step), "__name__", "agent_node")
+    return RunnableLambda(run, afunc=arun, name=name)
+
+
 def create_msg_delete():
     def delete_messages(state):
         """Clear messages and add placeholder for Anthropic compatibility"""
@@ -7,6 +7,7 @@ no token limits, works offline with any LLM provider.
 from rank_bm25 import BM25Okapi
 from typing import List, Tuple
 import re
+import threading
 
 
 class FinancialSituationMemory:
@@ -23,6 +24,8 @@ class FinancialSituationMemory:
         self.documents: List[str] = []
         self.recommendations: List[str] = []
         self.bm25 = None
+        # Serializes writers; get_memories reads without it
+        self._lock = threading.Lock()
 
     def _tokenize(self, text: str) -> List[str]:
         """Tokenize text for BM25 indexing.
@@ -47,12 +50,13 @@ class FinancialSituationMemory:
         Args:
             situations_and_advice: List of tuples (situation, recommendation)
         """
-        for situation, recommendation in situations_and_advice:
-            self.documents.append(situation)
-            self.recommendations.append(recommendation)
+        with self._lock:
+            for situation, recommendation in situations_and_advice:
+                self.documents.append(situation)
+                self.recommendations.append(recommendation)
 
-        # Rebuild BM25 index with new documents
-        self._rebuild_index()
+            # Rebuild BM25 index with new documents
+            self._rebuild_index()
 
     def get_memories(self, current_situation: str, n_matches: int = 1) -> List[dict]:
         """Find matching recommendations using BM25 similarity.
@@ -64,14 +68,19 @@ class FinancialSituationMemory:
         Returns:
             List of dicts with matched_situation, recommendation, and similarity_score
         """
-        if not self.documents or self.bm25 is None:
+        # Lists before index: clear() drops the index before the lists, and
+        # add_situations() appends before re-indexing, so the index never
+        # covers more documents than these lists hold
+        documents, recommendations = self.documents, self.recommendations
+        bm25 = self.bm25
+        if not documents or bm25 is None:
             return []
 
         # Tokenize query
         query_tokens = self._tokenize(current_situation)
 
         # Get BM25 scores for all documents
-        scores = self.bm25.get_scores(query_tokens)
+        scores = bm25.get_scores(query_tokens)
 
         # Get top-n indices sorted by score (descending)
         top_indices = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:n_matches]
@@ -84,8 +93,8 @@ class FinancialSituationMemory:
             # Normalize score to 0-1 range for consistency
             normalized_score = scores[idx] / max_score if max_score > 0 else 0
             results.append({
-                "matched_situation": self.documents[idx],
-                "recommendation": self.recommendations[idx],
+                "matched_situation": documents[idx],
+                "recommendation": recommendations[idx],
                 "similarity_score": normalized_score,
             })
 
@@ -93,9 +102,10 @@ class FinancialSituationMemory:
 
     def clear(self):
         """Clear all stored memories."""
-        self.documents = []
-        self.recommendations = []
-        self.bm25 = None
+        with self._lock:
+            self.bm25 = None
+            self.documents = []
+            self.recommendations = []
 
 
 if __name__ == "__main__":
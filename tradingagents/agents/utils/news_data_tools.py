@@ -1,6 +1,6 @@
 from langchain_core.tools import tool
 from typing import Annotated
-from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.interface import aroute_to_vendor, route_to_vendor
 
 @tool
 def get_news(
@@ -41,13 +41,33 @@ def get_global_news(
 @tool
 def get_insider_transactions(
     ticker: Annotated[str, "ticker symbol"],
+    curr_date: Annotated[str, "Current date in yyyy-mm-dd format"] = None,
 ) -> str:
     """
     Retrieve insider transaction information about a company.
     Uses the configured news_data vendor.
     Args:
         ticker (str): Ticker symbol of the company
+        curr_date (str): Current date; transactions after it are left out (optional)
     Returns:
         str: A report of insider transaction data
     """
-    return route_to_vendor("get_insider_transactions", ticker)
+    return route_to_vendor("get_insider_transactions", ticker, curr_date)
+
+
+# Async graphs (ainvoke/astream) run the tools through aroute_to_vendor
+async def _aget_news(ticker: str, start_date: str, end_date: str) -> str:
+    return await aroute_to_vendor("get_news", ticker, start_date, end_date)
+
+
+async def _aget_global_news(curr_date: str, look_back_days: int = 7, limit: int = 5) -> str:
+    return await aroute_to_vendor("get_global_news", curr_date, look_back_days, limit)
+
+
+async def _aget_insider_transactions(ticker: str, curr_date: str = None) -> str:
+    return await aroute_to_vendor("get_insider_transactions", ticker, curr_date)
+
+
+get_news.coroutine = _aget_news
+get_global_news.coroutine = _aget_global_news
+get_insider_transactions.coroutine = _aget_insider_transactions
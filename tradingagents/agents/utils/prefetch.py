@@ -0,0 +1,162 @@
+"""Direct-injection mode for the analysts (``config["analyst_data_mode"] == "prefetch"``).
+
+In the default tool-calling mode every tool call is another LLM round trip
+that re-sends the growing message list. In prefetch mode the data an analyst
+needs is fetched in parallel up front and injected into a single prompt, so
+the analyst costs one LLM call.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Tuple
+
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import RunnableLambda
+
+from tradingagents.dataflows.config import get_config
+from tradingagents.dataflows.interface import aroute_to_vendor, route_to_vendor
+
+# Fixed indicator set of the market analyst: trend, momentum, volatility, volume
+PREFETCH_INDICATORS = [
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "rsi",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+]
+PRICE_LOOK_BACK_DAYS = 60
+INDICATOR_LOOK_BACK_DAYS = 30
+NEWS_LOOK_BACK_DAYS = 7
+GLOBAL_NEWS_LIMIT = 5
+
+_prefetch_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="analyst-prefetch")
+
+# title -> (route_to_vendor method, args)
+Requests = Dict[str, Tuple[str, tuple]]
+
+
+def prefetch_enabled() -> bool:
+    """Whether the analysts run in direct-injection mode for the current run."""
+    return get_config().get("analyst_data_mode", "tools") == "prefetch"
+
+
+def _days_before(curr_date: str, days: int) -> str:
+    return (datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def market_requests(ticker: str, curr_date: str) -> Requests:
+    return {
+        "Stock price data (OHLCV)": (
+            "get_stock_data",
+            (ticker, _days_before(curr_date, PRICE_LOOK_BACK_DAYS), curr_date),
+        ),
+        "Technical indicators": (
+            "get_indicators_batch",
+            (ticker, PREFETCH_INDICATORS, curr_date, INDICATOR_LOOK_BACK_DAYS),
+        ),
+    }
+
+
+def fundamentals_requests(ticker: str, curr_date: str) -> Requests:
+    return {
+        "Company fundamentals": ("get_fundamentals", (ticker, curr_date)),
+        "Balance sheet (quarterly)": ("get_balance_sheet", (ticker, "quarterly", curr_date)),
+        "Cash flow statement (quarterly)": ("get_cashflow", (ticker, "quarterly", curr_date)),
+        "Income statement (quarterly)": ("get_income_statement", (ticker, "quarterly", curr_date)),
+    }
+
+
+def news_requests(ticker: str, curr_date: str) -> Requests:
+    return {
+        f"News about {ticker}": (
+            "get_news",
+            (ticker, _days_before(curr_date, NEWS_LOOK_BACK_DAYS), curr_date),
+        ),
+        "Global and macroeconomic news": (
+            "get_global_news",
+            (curr_date, NEWS_LOOK_BACK_DAYS, GLOBAL_NEWS_LIMIT),
+        ),
+    }
+
+
+def _fetch(method: str, args: tuple) -> str:
+    try:
+        return str(route_to_vendor(method, *args))
+    except Exception as e:
+        return f"Error retrieving {method} data: {e}"
+
+
+def fetch_all(requests: Requests) -> Dict[str, str]:
+    """Run every request concurrently; failures become error strings in the result."""
+    futures = {
+        title: _prefetch_executor.submit(contextvars.copy_context().run, _fetch, method, args)
+        for title, (method, args) in requests.items()
+    }
+    return {title: future.result() for title, future in futures.items()}
+
+
+async def _afetch(method: str, args: tuple) -> str:
+    try:
+        return str(await aroute_to_vendor(method, *args))
+    except Exception as e:
+        return f"Error retrieving {method} data: {e}"
+
+
+async def afetch_all(requests: Requests) -> Dict[str, str]:
+    """Async ``fetch_all``: the requests run concurrently on the event loop."""
+    results = await asyncio.gather(
+        *(_afetch(method, args) for method, args in requests.values())
+    )
+    return dict(zip(requests, results))
+
+
+# Yielded by the analyst nodes (see ``agent_node``) so the fetch matches the
+# graph's sync or async execution
+fetch_data = RunnableLambda(fetch_all, afunc=afetch_all, name="fetch_data")
+
+
+def format_sections(sections: Dict[str, str]) -> str:
+    return "\n\n".join(f"### {title}\n{content}" for title, content in sections.items())
+
+
+def chain_with_data(
+    llm,
+    system_message: str,
+    sections: Dict[str, str],
+    current_date: str,
+    ticker: str,
+):
+    """Build the analyst's single-call chain with the prefetched data in its prompt."""
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                "You are a helpful AI assistant, collaborating with other assistants."
+                " All data needed for your analysis has already been retrieved and is included below;"
+                " no tools are available, so write your complete report now."
+                " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
+                " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop.\n"
+                "{system_message}\n\n"
+                "==========================================================\n"
+                "PRE-FETCHED DATA\n"
+                "==========================================================\n"
+                "{data}\n\n"
+                "For your reference, the current date is {current_date}. The company we want to look at is {ticker}",
+            ),
+            MessagesPlaceholder(variable_name="messages"),
+        ]
+    )
+
+    prompt = prompt.partial(system_message=system_message)
+    prompt = prompt.partial(data=format_sections(sections))
+    prompt = prompt.partial(current_date=current_date)
+    prompt = prompt.partial(ticker=ticker)
+
+    return prompt | llm
@@ -1,6 +1,6 @@
 from langchain_core.tools import tool
-from typing import Annotated
-from tradingagents.dataflows.interface import route_to_vendor
+from typing import Annotated, List
+from tradingagents.dataflows.interface import aroute_to_vendor, route_to_vendor
 
 @tool
 def get_indicators(
@@ -20,4 +20,38 @@ def get_indicators(
     Returns:
         str: A formatted dataframe containing the technical indicators for the specified ticker symbol and indicator.
     """
-    return route_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
\ No newline at end of file
+    return route_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
+
+
+@tool
+def get_indicators_batch(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[List[str], "technical indicators to get the analysis and report of"],
+    curr_date: Annotated[str, "The current trading date you are trading on, YYYY-mm-dd"],
+    look_back_days: Annotated[int, "how many days to look back"] = 30,
+) -> str:
+    """
+    Retrieve several technical indicators for a given ticker symbol in one call.
+    Uses the configured technical_indicators vendor.
+    Args:
+        symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+        indicators (List[str]): Technical indicators to get the analysis and report of, e.g. ["close_50_sma", "macd", "rsi"]
+        curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+        look_back_days (int): How many days to look back, default is 30
+    Returns:
+        str: One table of trading days by indicator, followed by a description of each indicator.
+    """
+    return route_to_vendor("get_indicators_batch", symbol, indicators, curr_date, look_back_days)
+
+
+# Async graphs (ainvoke/astream) run the tools through aroute_to_vendor
+async def _aget_indicators(symbol: str, indicator: str, curr_date: str, look_back_days: int = 30) -> str:
+    return await aroute_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
+
+
+async def _aget_indicators_batch(symbol: str, indicators: List[str], curr_date: str, look_back_days: int = 30) -> str:
+    return await aroute_to_vendor("get_indicators_batch", symbol, indicators, curr_date, look_back_days)
+
+
+get_indicators.coroutine = _aget_indicators
+get_indicators_batch.coroutine = _aget_indicators_batch
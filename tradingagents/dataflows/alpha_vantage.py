@@ -1,5 +1,11 @@
 # Import functions from specialized modules
-from .alpha_vantage_stock import get_stock
-from .alpha_vantage_indicator import get_indicator
-from .alpha_vantage_fundamentals import get_fundamentals, get_balance_sheet, get_cashflow, get_income_statement
-from .alpha_vantage_news import get_news, get_global_news, get_insider_transactions
\ No newline at end of file
+from .alpha_vantage_stock import get_stock, aget_stock
+from .alpha_vantage_indicator import get_indicator, aget_indicator, get_indicator_batch, aget_indicator_batch
+from .alpha_vantage_fundamentals import (
+    get_fundamentals, get_balance_sheet, get_cashflow, get_income_statement,
+    aget_fundamentals, aget_balance_sheet, aget_cashflow, aget_income_statement,
+)
+from .alpha_vantage_news import (
+    get_news, get_global_news, get_insider_transactions,
+    aget_news, aget_global_news, aget_insider_transactions,
+)
@@ -1,18 +1,43 @@
+import asyncio
 import os
-import requests
+import hashlib
+import sqlite3
+import threading
+import time
 import pandas as pd
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from io import StringIO
 
+from . import http_transport
+from .config import get_config
+
 API_BASE_URL = "https://www.alphavantage.co/query"
 
+# Free-tier limits; override via config["alpha_vantage_limits"]
+DEFAULT_REQUESTS_PER_MINUTE = 5
+DEFAULT_REQUESTS_PER_DAY = 25
+# Longest time a request waits for a per-minute token before giving up
+MAX_QUOTA_WAIT_SECONDS = 60
+
+def get_api_keys() -> list[str]:
+    """Retrieve all configured Alpha Vantage API keys.
+
+    Keys come from ``ALPHA_VANTAGE_API_KEYS`` (comma-separated) and
+    ``ALPHA_VANTAGE_API_KEY``, in that order, without duplicates.
+    """
+    raw = [
+        *os.getenv("ALPHA_VANTAGE_API_KEYS", "").split(","),
+        os.getenv("ALPHA_VANTAGE_API_KEY", ""),
+    ]
+    keys = list(dict.fromkeys(k.strip() for k in raw if k.strip()))
+    if not keys:
+        raise ValueError("ALPHA_VANTAGE_API_KEY environment variable is not set.")
+    return keys
+
 def get_api_key() -> str:
     """Retrieve the API key for Alpha Vantage from environment variables."""
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        raise ValueError("ALPHA_VANTAGE_API_KEY environment variable is not set.")
-    return api_key
+    return get_api_keys()[0]
 
 def format_datetime_for_api(date_input) -> str:
     """Convert various date formats to YYYYMMDDTHHMM format required by Alpha Vantage API."""
@@ -39,17 +64,211 @@ class AlphaVantageRateLimitError(Exception):
     """Exception raised when Alpha Vantage API rate limit is exceeded."""
     pass
 
+class AlphaVantageKeyPool:
+    """Token-bucket quota accounting over several Alpha Vantage API keys.
+
+    Each key has a per-minute bucket that refills continuously and a daily
+    allowance that resets at midnight UTC. Usage is kept in a SQLite file in
+    ``data_cache_dir`` and updated in ``BEGIN IMMEDIATE`` transactions, so
+    every thread and process sharing the cache draws from the same buckets.
+    Requests go to the key with the most headroom.
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS key_usage (
+        key_id TEXT PRIMARY KEY,
+        minute_tokens REAL NOT NULL,
+        updated_at REAL NOT NULL,
+        day TEXT NOT NULL,
+        day_count INTEGER NOT NULL
+    )
+    """
+
+    def __init__(self, keys: list[str], db_path: str, per_minute: int, per_day: int):
+        self.keys = list(keys)
+        self.db_path = db_path
+        self.per_minute = per_minute
+        self.per_day = per_day
+        self._ids = {key: hashlib.sha256(key.encode()).hexdigest()[:16] for key in self.keys}
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(self._SCHEMA)
+            now = time.time()
+            for key_id in self._ids.values():
+                conn.execute(
+                    "INSERT OR IGNORE INTO key_usage VALUES (?, ?, ?, ?, 0)",
+                    (key_id, float(per_minute), now, self._today()),
+                )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    def _load(self, conn: sqlite3.Connection, now: float) -> dict:
+        """Read every key's state with refilled minute tokens and reset day counts."""
+        rows = {
+            row[0]: row[1:]
+            for row in conn.execute("SELECT key_id, minute_tokens, updated_at, day, day_count FROM key_usage")
+        }
+        today = self._today()
+        states = {}
+        for key, key_id in self._ids.items():
+            tokens, updated_at, day, day_count = rows.get(key_id, (self.per_minute, now, today, 0))
+            tokens = min(self.per_minute, tokens + (now - updated_at) * self.per_minute / 60.0)
+            states[key] = {"tokens": tokens, "day_used": day_count if day == today else 0}
+        return states
+
+    def _store(self, conn: sqlite3.Connection, key: str, state: dict, now: float) -> None:
+        conn.execute(
+            "UPDATE key_usage SET minute_tokens = ?, updated_at = ?, day = ?, day_count = ?"
+            " WHERE key_id = ?",
+            (state["tokens"], now, self._today(), state["day_used"], self._ids[key]),
+        )
+
+    def acquire(self, exclude: set = frozenset()) -> str:
+        """Reserve one request on the key with the most headroom and return it.
+
+        Waits for a per-minute token when every key is momentarily drained.
+
+        Raises:
+            AlphaVantageRateLimitError: When no key has daily quota left, or no
+                minute token frees up within ``MAX_QUOTA_WAIT_SECONDS``
+        """
+        deadline = time.time() + MAX_QUOTA_WAIT_SECONDS
+        while True:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                now = time.time()
+                states = self._load(conn, now)
+                candidates = [
+                    key for key in self.keys
+                    if key not in exclude and states[key]["day_used"] < self.per_day
+                ]
+                if not candidates:
+                    conn.execute("ROLLBACK")
+                    raise AlphaVantageRateLimitError(
+                        "Alpha Vantage rate limit exceeded: daily quota used up on all API keys"
+                    )
+
+                best = max(
+                    candidates,
+                    key=lambda k: (
+                        min(states[k]["tokens"], self.per_day - states[k]["day_used"]),
+                        self.per_day - states[k]["day_used"],
+                    ),
+                )
+                state = states[best]
+                if state["tokens"] >= 1:
+                    state["tokens"] -= 1
+                    state["day_used"] += 1
+                    self._store(conn, best, state, now)
+                    conn.execute("COMMIT")
+                    return best
+
+                conn.execute("ROLLBACK")
+                wait = (1 - max(states[k]["tokens"] for k in candidates)) * 60.0 / self.per_minute
+            finally:
+                conn.close()
+
+            if time.time() + wait > deadline:
+                raise AlphaVantageRateLimitError(
+                    "Alpha Vantage rate limit exceeded: per-minute quota used up on all API keys"
+                )
+            time.sleep(wait)
+
+    def mark_exhausted(self, key: str, daily: bool) -> None:
+        """Record that the server rejected ``key`` for its minute or daily limit."""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            state = self._load(conn, now)[key]
+            state["tokens"] = 0.0
+            if daily:
+                state["day_used"] = self.per_day
+            self._store(conn, key, state, now)
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def quota(self) -> list[dict]:
+        """Remaining quota per key (keys are masked)."""
+        conn = self._connect()
+        try:
+            states = self._load(conn, time.time())
+        finally:
+            conn.close()
+        return [
+            {
+                "key": f"{key[:4]}****",
+                "minute_remaining": int(states[key]["tokens"]),
+                "day_remaining": max(0, self.per_day - states[key]["day_used"]),
+            }
+            for key in self.keys
+        ]
+
+
+_key_pools: dict = {}
+_key_pools_lock = threading.Lock()
+
+def get_key_pool() -> AlphaVantageKeyPool:
+    """Return the process-wide key pool for the configured keys and cache dir."""
+    config = get_config()
+    limits = config.get("alpha_vantage_limits", {})
+    keys = tuple(get_api_keys())
+    db_path = os.path.join(config["data_cache_dir"], "alpha_vantage", "quota.db")
+    per_minute = limits.get("requests_per_minute", DEFAULT_REQUESTS_PER_MINUTE)
+    per_day = limits.get("requests_per_day", DEFAULT_REQUESTS_PER_DAY)
+
+    pool_id = (keys, db_path, per_minute, per_day)
+    with _key_pools_lock:
+        if pool_id not in _key_pools:
+            _key_pools[pool_id] = AlphaVantageKeyPool(list(keys), db_path, per_minute, per_day)
+        return _key_pools[pool_id]
+
+def get_quota_report() -> list[dict]:
+    """Remaining per-minute and per-day quota of every configured key."""
+    return get_key_pool().quota()
+
+def _is_daily_limit(message: str) -> bool:
+    message = message.lower()
+    return "per day" in message or "daily" in message
+
 def _make_api_request(function_name: str, params: dict) -> dict | str:
     """Helper function to make API requests and handle responses.
+
+    The request is sent with the pooled key that has the most quota left; a
+    key the server rejects for its rate limit is parked and the next key is
+    tried.
     
     Raises:
         AlphaVantageRateLimitError: When API rate limit is exceeded
     """
+    pool = get_key_pool()
+    rejected = set()
+
+    while True:
+        api_key = pool.acquire(exclude=rejected)
+        try:
+            return _request_with_key(function_name, params, api_key)
+        except AlphaVantageRateLimitError as e:
+            # Park the key and retry on the next one with headroom
+            pool.mark_exhausted(api_key, daily=_is_daily_limit(str(e)))
+            rejected.add(api_key)
+
+def _request_params(function_name: str, params: dict, api_key: str) -> dict:
     # Create a copy of params to avoid modifying the original
     api_params = params.copy()
     api_params.update({
         "function": function_name,
-        "apikey": get_api_key(),
+        "apikey": api_key,
         "source": "trading_agents",
     })
     
@@ -62,12 +281,9 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
     elif "entitlement" in api_params:
         # Remove entitlement if it's None or empty
         api_params.pop("entitlement", None)
-    
-    response = requests.get(API_BASE_URL, params=api_params)
-    response.raise_for_status()
+    return api_params
 
-    response_text = response.text
-    
+def _check_response(response_text: str) -> str:
     # Check if response is JSON (error responses are typically JSON)
     try:
         response_json = json.loads(response_text)
@@ -82,6 +298,35 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
 
     return response_text
 
+def _request_with_key(function_name: str, params: dict, api_key: str) -> str:
+    response = http_transport.get(API_BASE_URL, params=_request_params(function_name, params, api_key))
+    response.raise_for_status()
+    return _check_response(response.text)
+
+async def _amake_api_request(function_name: str, params: dict) -> dict | str:
+    """Async ``_make_api_request``: same key rotation, the request itself is non-blocking.
+
+    Quota bookkeeping (SQLite, and waiting for a minute token) runs in a
+    worker thread so the event loop is never blocked.
+
+    Raises:
+        AlphaVantageRateLimitError: When API rate limit is exceeded
+    """
+    pool = get_key_pool()
+    rejected = set()
+
+    while True:
+        api_key = await asyncio.to_thread(pool.acquire, frozenset(rejected))
+        try:
+            response = await http_transport.aget(
+                API_BASE_URL, params=_request_params(function_name, params, api_key)
+            )
+            response.raise_for_status()
+            return _check_response(response.text)
+        except AlphaVantageRateLimitError as e:
+            await asyncio.to_thread(pool.mark_exhausted, api_key, _is_daily_limit(str(e)))
+            rejected.add(api_key)
+
 
 
 def _filter_csv_by_date_range(csv_data: str, start_date: str, end_date: str) -> str:
@@ -1,4 +1,4 @@
-from .alpha_vantage_common import _make_api_request
+from .alpha_vantage_common import _make_api_request, _amake_api_request
 
 
 def get_fundamentals(ticker: str, curr_date: str = None) -> str:
@@ -75,3 +75,22 @@ def get_income_statement(ticker: str, freq: str = "quarterly", curr_date: str =
 
     return _make_api_request("INCOME_STATEMENT", params)
 
+
+async def aget_fundamentals(ticker: str, curr_date: str = None) -> str:
+    """Async ``get_fundamentals``."""
+    return await _amake_api_request("OVERVIEW", {"symbol": ticker})
+
+
+async def aget_balance_sheet(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+    """Async ``get_balance_sheet``."""
+    return await _amake_api_request("BALANCE_SHEET", {"symbol": ticker})
+
+
+async def aget_cashflow(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+    """Async ``get_cashflow``."""
+    return await _amake_api_request("CASH_FLOW", {"symbol": ticker})
+
+
+async def aget_income_statement(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+    """Async ``get_income_statement``."""
+    return await _amake_api_request("INCOME_STATEMENT", {"symbol": ticker})
@@ -1,29 +1,171 @@
-from .alpha_vantage_common import _make_api_request
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from io import StringIO
 
-def get_indicator(
-    symbol: str,
-    indicator: str,
-    curr_date: str,
-    look_back_days: int,
-    interval: str = "daily",
-    time_period: int = 14,
-    series_type: str = "close"
-) -> str:
-    """
-    Returns Alpha Vantage technical indicator values over a time window.
+import pandas as pd
 
-    Args:
-        symbol: ticker symbol of the company
-        indicator: technical indicator to get the analysis and report of
-        curr_date: The current trading date you are trading on, YYYY-mm-dd
-        look_back_days: how many days to look back
-        interval: Time interval (daily, weekly, monthly)
-        time_period: Number of data points for calculation
-        series_type: The desired price type (close, open, high, low)
+from .alpha_vantage_common import _make_api_request, _amake_api_request
+from .cache_sync import AsyncSingleFlight, SingleFlight
+from . import vendor_cache
+from .utils import format_indicator_table
 
-    Returns:
-        String containing indicator values and description
+# Alpha Vantage CSV column holding each indicator
+INDICATOR_COLUMNS = {
+    "macd": "MACD", "macds": "MACD_Signal", "macdh": "MACD_Hist",
+    "boll": "Real Middle Band", "boll_ub": "Real Upper Band", "boll_lb": "Real Lower Band",
+    "rsi": "RSI", "atr": "ATR", "close_10_ema": "EMA",
+    "close_50_sma": "SMA", "close_200_sma": "SMA"
+}
+
+INDICATOR_DESCRIPTIONS = {
+    "close_50_sma": "50 SMA: A medium-term trend indicator. Usage: Identify trend direction and serve as dynamic support/resistance. Tips: It lags price; combine with faster indicators for timely signals.",
+    "close_200_sma": "200 SMA: A long-term trend benchmark. Usage: Confirm overall market trend and identify golden/death cross setups. Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries.",
+    "close_10_ema": "10 EMA: A responsive short-term average. Usage: Capture quick shifts in momentum and potential entry points. Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals.",
+    "macd": "MACD: Computes momentum via differences of EMAs. Usage: Look for crossovers and divergence as signals of trend changes. Tips: Confirm with other indicators in low-volatility or sideways markets.",
+    "macds": "MACD Signal: An EMA smoothing of the MACD line. Usage: Use crossovers with the MACD line to trigger trades. Tips: Should be part of a broader strategy to avoid false positives.",
+    "macdh": "MACD Histogram: Shows the gap between the MACD line and its signal. Usage: Visualize momentum strength and spot divergence early. Tips: Can be volatile; complement with additional filters in fast-moving markets.",
+    "rsi": "RSI: Measures momentum to flag overbought/oversold conditions. Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis.",
+    "boll": "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. Usage: Acts as a dynamic benchmark for price movement. Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals.",
+    "boll_ub": "Bollinger Upper Band: Typically 2 standard deviations above the middle line. Usage: Signals potential overbought conditions and breakout zones. Tips: Confirm signals with other tools; prices may ride the band in strong trends.",
+    "boll_lb": "Bollinger Lower Band: Typically 2 standard deviations below the middle line. Usage: Indicates potential oversold conditions. Tips: Use additional analysis to avoid false reversal signals.",
+    "atr": "ATR: Averages true range to measure volatility. Usage: Set stop-loss levels and adjust position sizes based on current market volatility. Tips: It's a reactive measure, so use it as part of a broader risk management strategy.",
+    "vwma": "VWMA: A moving average weighted by volume. Usage: Confirm trends by integrating price action with volume data. Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+}
+
+_MAX_FRAMES = 64
+_frames: "OrderedDict[tuple, tuple]" = OrderedDict()
+_frames_lock = threading.Lock()
+_fetches = SingleFlight()
+_afetches = AsyncSingleFlight()
+
+
+def _indicator_request(indicator: str, interval: str, time_period: int, series_type: str) -> tuple:
+    """Return the Alpha Vantage function and parameters serving ``indicator``."""
+    if indicator in ("close_50_sma", "close_200_sma"):
+        return "SMA", {"interval": interval, "time_period": indicator.split("_")[1], "series_type": series_type}
+    if indicator == "close_10_ema":
+        return "EMA", {"interval": interval, "time_period": "10", "series_type": series_type}
+    if indicator in ("macd", "macds", "macdh"):
+        return "MACD", {"interval": interval, "series_type": series_type}
+    if indicator == "rsi":
+        return "RSI", {"interval": interval, "time_period": str(time_period), "series_type": series_type}
+    if indicator in ("boll", "boll_ub", "boll_lb"):
+        return "BBANDS", {"interval": interval, "time_period": "20", "series_type": series_type}
+    if indicator == "atr":
+        return "ATR", {"interval": interval, "time_period": str(time_period)}
+    raise ValueError(f"Indicator {indicator} not implemented yet.")
+
+
+def _parse_indicator_csv(data: str) -> pd.DataFrame:
+    """Parse an indicator CSV response into a float frame indexed by date."""
+    if not data or len(data.strip().split("\n")) < 2:
+        raise ValueError("No data returned")
+    frame = pd.read_csv(StringIO(data))
+    if "time" not in frame.columns:
+        raise ValueError(f"'time' column not found in data. Available columns: {list(frame.columns)}")
+    frame["time"] = pd.to_datetime(frame["time"])
+    return frame.set_index("time").sort_index().apply(pd.to_numeric, errors="coerce")
+
+
+def _frame_request(function: str, symbol: str, params: dict) -> tuple:
+    request_params = {"symbol": symbol.upper(), **params, "datatype": "csv"}
+    return request_params, (function, tuple(sorted(request_params.items())))
+
+
+def _cached_frame(frame_key: tuple):
+    with _frames_lock:
+        entry = _frames.get(frame_key)
+        if entry is not None and entry[0] > time.time():
+            _frames.move_to_end(frame_key)
+            return entry[1]
+    return None
+
+
+def _remember_frame(frame_key: tuple, expires_at: float, frame: pd.DataFrame) -> None:
+    with _frames_lock:
+        _frames[frame_key] = (expires_at, frame)
+        _frames.move_to_end(frame_key)
+        while len(_frames) > _MAX_FRAMES:
+            _frames.popitem(last=False)
+
+
+def _csv_cache_entry(function: str, request_params: dict) -> tuple:
+    """Return ``(method, cache_key, expires_at)`` of the raw CSV in the vendor cache."""
+    method = f"alpha_vantage:{function}"
+    cache_key = hashlib.sha256(
+        json.dumps([method, request_params], sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    return method, cache_key, vendor_cache.expiry_for("market_close", time.time())
+
+
+def get_indicator_frame(function: str, symbol: str, params: dict) -> pd.DataFrame:
+    """Return the parsed response of one Alpha Vantage indicator request.
+
+    The raw CSV is kept in the vendor cache (until the next market close) and
+    the parsed frame in an in-process LRU, both keyed by
+    ``(function, symbol, params)``; concurrent callers share one request.
     """
+    request_params, frame_key = _frame_request(function, symbol, params)
+    frame = _cached_frame(frame_key)
+    if frame is not None:
+        return frame
+
+    def fetch() -> tuple:
+        settings = vendor_cache.get_cache_settings()
+        method, cache_key, expires_at = _csv_cache_entry(function, request_params)
+
+        found, data = False, None
+        if settings["enabled"]:
+            found, data = vendor_cache.get_entry(cache_key, method)
+        if not found:
+            data = _make_api_request(function, request_params)
+        frame = _parse_indicator_csv(data)
+        if not found and settings["enabled"]:
+            vendor_cache.put_entry(
+                cache_key, method, "alpha_vantage", data, expires_at, settings["max_bytes"]
+            )
+        return expires_at, frame
+
+    expires_at, frame = _fetches.do(frame_key, fetch)
+    _remember_frame(frame_key, expires_at, frame)
+    return frame
+
+
+async def aget_indicator_frame(function: str, symbol: str, params: dict) -> pd.DataFrame:
+    """Async ``get_indicator_frame``, sharing its caches."""
+    request_params, frame_key = _frame_request(function, symbol, params)
+    frame = _cached_frame(frame_key)
+    if frame is not None:
+        return frame
+
+    async def fetch() -> tuple:
+        settings = vendor_cache.get_cache_settings()
+        method, cache_key, expires_at = _csv_cache_entry(function, request_params)
+
+        found, data = False, None
+        if settings["enabled"]:
+            found, data = await asyncio.to_thread(vendor_cache.get_entry, cache_key, method)
+        if not found:
+            data = await _amake_api_request(function, request_params)
+        frame = _parse_indicator_csv(data)
+        if not found and settings["enabled"]:
+            await asyncio.to_thread(
+                vendor_cache.put_entry,
+                cache_key, method, "alpha_vantage", data, expires_at, settings["max_bytes"],
+            )
+        return expires_at, frame
+
+    expires_at, frame = await _afetches.do(frame_key, fetch)
+    _remember_frame(frame_key, expires_at, frame)
+    return frame
+
+
+def _indicator_window(indicator: str, curr_date: str, look_back_days: int, series_type: str) -> tuple:
+    """Validate ``indicator`` and return ``(before, curr_date_dt, series_type)`` of its report."""
     from datetime import datetime
     from dateutil.relativedelta import relativedelta
 
@@ -42,21 +184,6 @@ def get_indicator(
         "vwma": ("VWMA", "close")
     }
 
-    indicator_descriptions = {
-        "close_50_sma": "50 SMA: A medium-term trend indicator. Usage: Identify trend direction and serve as dynamic support/resistance. Tips: It lags price; combine with faster indicators for timely signals.",
-        "close_200_sma": "200 SMA: A long-term trend benchmark. Usage: Confirm overall market trend and identify golden/death cross setups. Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries.",
-        "close_10_ema": "10 EMA: A responsive short-term average. Usage: Capture quick shifts in momentum and potential entry points. Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals.",
-        "macd": "MACD: Computes momentum via differences of EMAs. Usage: Look for crossovers and divergence as signals of trend changes. Tips: Confirm with other indicators in low-volatility or sideways markets.",
-        "macds": "MACD Signal: An EMA smoothing of the MACD line. Usage: Use crossovers with the MACD line to trigger trades. Tips: Should be part of a broader strategy to avoid false positives.",
-        "macdh": "MACD Histogram: Shows the gap between the MACD line and its signal. Usage: Visualize momentum strength and spot divergence early. Tips: Can be volatile; complement with additional filters in fast-moving markets.",
-        "rsi": "RSI: Measures momentum to flag overbought/oversold conditions. Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis.",
-        "boll": "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. Usage: Acts as a dynamic benchmark for price movement. Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals.",
-        "boll_ub": "Bollinger Upper Band: Typically 2 standard deviations above the middle line. Usage: Signals potential overbought conditions and breakout zones. Tips: Confirm signals with other tools; prices may ride the band in strong trends.",
-        "boll_lb": "Bollinger Lower Band: Typically 2 standard deviations below the middle line. Usage: Indicates potential oversold conditions. Tips: Use additional analysis to avoid false reversal signals.",
-        "atr": "ATR: Averages true range to measure volatility. Usage: Set stop-loss levels and adjust position sizes based on current market volatility. Tips: It's a reactive measure, so use it as part of a broader risk management strategy.",
-        "vwma": "VWMA: A moving average weighted by volume. Usage: Confirm trends by integrating price action with volume data. Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-    }
-
     if indicator not in supported_indicators:
         raise ValueError(
             f"Indicator {indicator} is not supported. Please choose from: {list(supported_indicators.keys())}"
@@ -72,151 +199,221 @@ def get_indicator(
     if required_series_type:
         series_type = required_series_type
 
+    return before, curr_date_dt, series_type
+
+
+def _vwma_report(symbol: str) -> str:
+    # Alpha Vantage doesn't have direct VWMA, so we'll return an informative message
+    # In a real implementation, this would need to be calculated from OHLCV data
+    return f"## VWMA (Volume Weighted Moving Average) for {symbol}:\n\nVWMA calculation requires OHLCV data and is not directly available from Alpha Vantage API.\nThis indicator would need to be calculated from the raw stock data using volume-weighted price averaging.\n\n{INDICATOR_DESCRIPTIONS.get('vwma', 'No description available.')}"
+
+
+def _render_indicator(indicator: str, frame: pd.DataFrame, before, curr_date_dt, curr_date: str) -> str:
+    """Render the report of one indicator from its request's parsed frame."""
+    target_col_name = INDICATOR_COLUMNS[indicator]
+    if target_col_name not in frame.columns:
+        return f"Error: Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {list(frame.columns)}"
+
+    window = frame.loc[before:curr_date_dt, target_col_name].dropna()
+
+    ind_string = "".join(
+        f"{date_dt.strftime('%Y-%m-%d')}: {value}\n" for date_dt, value in window.items()
+    )
+
+    if not ind_string:
+        ind_string = "No data available for the specified date range.\n"
+
+    return (
+        f"## {indicator.upper()} values from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n"
+        + ind_string
+        + "\n\n"
+        + INDICATOR_DESCRIPTIONS.get(indicator, "No description available.")
+    )
+
+
+def get_indicator(
+    symbol: str,
+    indicator: str,
+    curr_date: str,
+    look_back_days: int,
+    interval: str = "daily",
+    time_period: int = 14,
+    series_type: str = "close"
+) -> str:
+    """
+    Returns Alpha Vantage technical indicator values over a time window.
+
+    Args:
+        symbol: ticker symbol of the company
+        indicator: technical indicator to get the analysis and report of
+        curr_date: The current trading date you are trading on, YYYY-mm-dd
+        look_back_days: how many days to look back
+        interval: Time interval (daily, weekly, monthly)
+        time_period: Number of data points for calculation
+        series_type: The desired price type (close, open, high, low)
+
+    Returns:
+        String containing indicator values and description
+    """
+    before, curr_date_dt, series_type = _indicator_window(
+        indicator, curr_date, look_back_days, series_type
+    )
+    if indicator == "vwma":
+        return _vwma_report(symbol)
+
     try:
-        # Get indicator data for the period
-        if indicator == "close_50_sma":
-            data = _make_api_request("SMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "50",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "close_200_sma":
-            data = _make_api_request("SMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "200",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "close_10_ema":
-            data = _make_api_request("EMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "10",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macd":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macds":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macdh":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "rsi":
-            data = _make_api_request("RSI", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": str(time_period),
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator in ["boll", "boll_ub", "boll_lb"]:
-            data = _make_api_request("BBANDS", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "20",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "atr":
-            data = _make_api_request("ATR", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": str(time_period),
-                "datatype": "csv"
-            })
-        elif indicator == "vwma":
-            # Alpha Vantage doesn't have direct VWMA, so we'll return an informative message
-            # In a real implementation, this would need to be calculated from OHLCV data
-            return f"## VWMA (Volume Weighted Moving Average) for {symbol}:\n\nVWMA calculation requires OHLCV data and is not directly available from Alpha Vantage API.\nThis indicator would need to be calculated from the raw stock data using volume-weighted price averaging.\n\n{indicator_descriptions.get('vwma', 'No description available.')}"
-        else:
-            return f"Error: Indicator {indicator} not implemented yet."
-
-        # Parse CSV data and extract values for the date range
-        lines = data.strip().split('\n')
-        if len(lines) < 2:
-            return f"Error: No data returned for {indicator}"
-
-        # Parse header and data
-        header = [col.strip() for col in lines[0].split(',')]
-        try:
-            date_col_idx = header.index('time')
-        except ValueError:
-            return f"Error: 'time' column not found in data for {indicator}. Available columns: {header}"
-
-        # Map internal indicator names to expected CSV column names from Alpha Vantage
-        col_name_map = {
-            "macd": "MACD", "macds": "MACD_Signal", "macdh": "MACD_Hist",
-            "boll": "Real Middle Band", "boll_ub": "Real Upper Band", "boll_lb": "Real Lower Band",
-            "rsi": "RSI", "atr": "ATR", "close_10_ema": "EMA",
-            "close_50_sma": "SMA", "close_200_sma": "SMA"
-        }
-
-        target_col_name = col_name_map.get(indicator)
-
-        if not target_col_name:
-            # Default to the second column if no specific mapping exists
-            value_col_idx = 1
-        else:
-            try:
-                value_col_idx = header.index(target_col_name)
-            except ValueError:
-                return f"Error: Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {header}"
-
-        result_data = []
-        for line in lines[1:]:
-            if not line.strip():
-                continue
-            values = line.split(',')
-            if len(values) > value_col_idx:
-                try:
-                    date_str = values[date_col_idx].strip()
-                    # Parse the date
-                    date_dt = datetime.strptime(date_str, "%Y-%m-%d")
-
-                    # Check if date is in our range
-                    if before <= date_dt <= curr_date_dt:
-                        value = values[value_col_idx].strip()
-                        result_data.append((date_dt, value))
-                except (ValueError, IndexError):
-                    continue
-
-        # Sort by date and format output
-        result_data.sort(key=lambda x: x[0])
-
-        ind_string = ""
-        for date_dt, value in result_data:
-            ind_string += f"{date_dt.strftime('%Y-%m-%d')}: {value}\n"
-
-        if not ind_string:
-            ind_string = "No data available for the specified date range.\n"
-
-        result_str = (
-            f"## {indicator.upper()} values from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n"
-            + ind_string
-            + "\n\n"
-            + indicator_descriptions.get(indicator, "No description available.")
-        )
+        # Sibling indicators (MACD line/signal/histogram, the three Bollinger
+        # bands) share one request and one parsed frame
+        function, params = _indicator_request(indicator, interval, time_period, series_type)
+        frame = get_indicator_frame(function, symbol, params)
+        return _render_indicator(indicator, frame, before, curr_date_dt, curr_date)
+
+    except Exception as e:
+        print(f"Error getting Alpha Vantage indicator data for {indicator}: {e}")
+        return f"Error retrieving {indicator} data: {str(e)}"
+
+
+async def aget_indicator(
+    symbol: str,
+    indicator: str,
+    curr_date: str,
+    look_back_days: int,
+    interval: str = "daily",
+    time_period: int = 14,
+    series_type: str = "close"
+) -> str:
+    """Async ``get_indicator``: the report is rendered from the awaited frame."""
+    before, curr_date_dt, series_type = _indicator_window(
+        indicator, curr_date, look_back_days, series_type
+    )
+    if indicator == "vwma":
+        return _vwma_report(symbol)
 
-        return result_str
+    try:
+        function, params = _indicator_request(indicator, interval, time_period, series_type)
+        frame = await aget_indicator_frame(function, symbol, params)
+        return _render_indicator(indicator, frame, before, curr_date_dt, curr_date)
 
     except Exception as e:
         print(f"Error getting Alpha Vantage indicator data for {indicator}: {e}")
         return f"Error retrieving {indicator} data: {str(e)}"
+
+
+def _batch_requests(indicators: list, interval: str, time_period: int) -> dict:
+    """Map each indicator Alpha Vantage serves to its ``(function, params)`` request."""
+    return {
+        indicator: _indicator_request(indicator, interval, time_period, "close")
+        for indicator in indicators
+        if indicator in INDICATOR_COLUMNS
+    }
+
+
+def _request_key(function: str, params: dict) -> tuple:
+    return function, tuple(sorted(params.items()))
+
+
+def _batch_window(indicators: list, curr_date: str, look_back_days: int) -> tuple:
+    """Validate a batch and return ``(indicators, before, curr_date_dt, notes)``."""
+    from datetime import datetime
+    from dateutil.relativedelta import relativedelta
+
+    unsupported = [name for name in indicators if name not in INDICATOR_DESCRIPTIONS]
+    if unsupported:
+        raise ValueError(
+            f"Indicators {unsupported} are not supported. Please choose from: {list(INDICATOR_DESCRIPTIONS.keys())}"
+        )
+    indicators = list(dict.fromkeys(indicators))
+
+    curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = curr_date_dt - relativedelta(days=look_back_days)
+
+    notes = []
+    if "vwma" in indicators:
+        notes.append(
+            "vwma is not directly available from Alpha Vantage API; it would need to be calculated from OHLCV data."
+        )
+    return indicators, before, curr_date_dt, notes
+
+
+def _render_indicator_batch(
+    symbol: str, requests: dict, frames: dict, before, curr_date_dt, curr_date: str, notes: list
+) -> str:
+    """Render the batch table from the parsed frames, keyed by ``_request_key``."""
+    columns = {}
+    for indicator, (function, params) in requests.items():
+        frame = frames[_request_key(function, params)]
+        target_col_name = INDICATOR_COLUMNS[indicator]
+        if target_col_name not in frame.columns:
+            return f"Error: Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {list(frame.columns)}"
+        columns[indicator] = frame.loc[before:curr_date_dt, target_col_name]
+
+    window = pd.concat(columns, axis=1) if columns else pd.DataFrame(index=pd.DatetimeIndex([]))
+    return format_indicator_table(
+        symbol, window, before.strftime("%Y-%m-%d"), curr_date, INDICATOR_DESCRIPTIONS, notes
+    )
+
+
+def get_indicator_batch(
+    symbol: str,
+    indicators: list[str],
+    curr_date: str,
+    look_back_days: int,
+    interval: str = "daily",
+    time_period: int = 14,
+) -> str:
+    """
+    Returns several Alpha Vantage technical indicators over a time window as one table.
+
+    Indicators sharing a request (the MACD line, signal and histogram, the
+    three Bollinger bands) are fetched once.
+
+    Args:
+        symbol: ticker symbol of the company
+        indicators: technical indicators to report
+        curr_date: The current trading date you are trading on, YYYY-mm-dd
+        look_back_days: how many days to look back
+        interval: Time interval (daily, weekly, monthly)
+        time_period: Number of data points for calculation
+
+    Returns:
+        String containing a date-by-indicator table and the indicator descriptions
+    """
+    indicators, before, curr_date_dt, notes = _batch_window(indicators, curr_date, look_back_days)
+    requests = _batch_requests(indicators, interval, time_period)
+
+    try:
+        frames = {}
+        for function, params in requests.values():
+            key = _request_key(function, params)
+            if key not in frames:
+                frames[key] = get_indicator_frame(function, symbol, params)
+    except Exception as e:
+        print(f"Error getting Alpha Vantage indicator data for {indicators}: {e}")
+        return f"Error retrieving indicators data: {str(e)}"
+
+    return _render_indicator_batch(symbol, requests, frames, before, curr_date_dt, curr_date, notes)
+
+
+async def aget_indicator_batch(
+    symbol: str,
+    indicators: list[str],
+    curr_date: str,
+    look_back_days: int,
+    interval: str = "daily",
+    time_period: int = 14,
+) -> str:
+    """Async ``get_indicator_batch``: the distinct requests are awaited concurrently."""
+    indicators, before, curr_date_dt, notes = _batch_window(indicators, curr_date, look_back_days)
+    requests = _batch_requests(indicators, interval, time_period)
+
+    keys = list(dict.fromkeys(_request_key(function, params) for function, params in requests.values()))
+    try:
+        results = await asyncio.gather(
+            *(aget_indicator_frame(function, symbol, dict(params)) for function, params in keys)
+        )
+    except Exception as e:
+        print(f"Error getting Alpha Vantage indicator data for {indicators}: {e}")
+        return f"Error retrieving indicators data: {str(e)}"
+
+    frames = dict(zip(keys, results))
+    return _render_indicator_batch(symbol, requests, frames, before, curr_date_dt, curr_date, notes)
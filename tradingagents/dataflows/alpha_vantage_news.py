@@ -1,4 +1,8 @@
-from .alpha_vantage_common import _make_api_request, format_datetime_for_api
+import asyncio
+from datetime import datetime, timedelta
+
+from .alpha_vantage_common import _make_api_request, _amake_api_request, format_datetime_for_api
+from . import news_archive
 
 def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
     """Returns live and historical market news & sentiment data from premier news outlets worldwide.
@@ -14,13 +18,9 @@ def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
         Dictionary containing news sentiment data or JSON string.
     """
 
-    params = {
-        "tickers": ticker,
-        "time_from": format_datetime_for_api(start_date),
-        "time_to": format_datetime_for_api(end_date),
-    }
-
-    return _make_api_request("NEWS_SENTIMENT", params)
+    response = _make_api_request("NEWS_SENTIMENT", _news_params(ticker, start_date, end_date))
+    news_archive.archive_alpha_vantage_feed(response, ticker, start_date, end_date)
+    return response
 
 def get_global_news(curr_date, look_back_days: int = 7, limit: int = 50) -> dict[str, str] | str:
     """Returns global market news & sentiment data without ticker-specific filtering.
@@ -35,30 +35,23 @@ def get_global_news(curr_date, look_back_days: int = 7, limit: int = 50) -> dict
     Returns:
         Dictionary containing global news sentiment data or JSON string.
     """
-    from datetime import datetime, timedelta
-
-    # Calculate start date
-    curr_dt = datetime.strptime(curr_date, "%Y-%m-%d")
-    start_dt = curr_dt - timedelta(days=look_back_days)
-    start_date = start_dt.strftime("%Y-%m-%d")
+    start_date, params = _global_news_params(curr_date, look_back_days, limit)
 
-    params = {
-        "topics": "financial_markets,economy_macro,economy_monetary",
-        "time_from": format_datetime_for_api(start_date),
-        "time_to": format_datetime_for_api(curr_date),
-        "limit": str(limit),
-    }
-
-    return _make_api_request("NEWS_SENTIMENT", params)
+    response = _make_api_request("NEWS_SENTIMENT", params)
+    news_archive.archive_alpha_vantage_feed(
+        response, news_archive.GLOBAL_TOPIC, start_date, curr_date
+    )
+    return response
 
 
-def get_insider_transactions(symbol: str) -> dict[str, str] | str:
+def get_insider_transactions(symbol: str, curr_date: str = None) -> dict[str, str] | str:
     """Returns latest and historical insider transactions by key stakeholders.
 
     Covers transactions by founders, executives, board members, etc.
 
     Args:
         symbol: Ticker symbol. Example: "IBM".
+        curr_date: Current date in yyyy-mm-dd format (not used for Alpha Vantage).
 
     Returns:
         Dictionary containing insider transaction data or JSON string.
@@ -68,4 +61,53 @@ def get_insider_transactions(symbol: str) -> dict[str, str] | str:
         "symbol": symbol,
     }
 
-    return _make_api_request("INSIDER_TRANSACTIONS", params)
\ No newline at end of file
+    return _make_api_request("INSIDER_TRANSACTIONS", params)
+
+
+async def aget_news(ticker, start_date, end_date) -> dict[str, str] | str:
+    """Async ``get_news``."""
+    response = await _amake_api_request("NEWS_SENTIMENT", _news_params(ticker, start_date, end_date))
+    await asyncio.to_thread(
+        news_archive.archive_alpha_vantage_feed, response, ticker, start_date, end_date
+    )
+    return response
+
+
+async def aget_global_news(curr_date, look_back_days: int = 7, limit: int = 50) -> dict[str, str] | str:
+    """Async ``get_global_news``."""
+    start_date, params = _global_news_params(curr_date, look_back_days, limit)
+
+    response = await _amake_api_request("NEWS_SENTIMENT", params)
+    await asyncio.to_thread(
+        news_archive.archive_alpha_vantage_feed,
+        response, news_archive.GLOBAL_TOPIC, start_date, curr_date,
+    )
+    return response
+
+
+async def aget_insider_transactions(symbol: str, curr_date: str = None) -> dict[str, str] | str:
+    """Async ``get_insider_transactions``."""
+    return await _amake_api_request("INSIDER_TRANSACTIONS", {"symbol": symbol})
+
+
+def _news_params(ticker, start_date, end_date) -> dict:
+    return {
+        "tickers": ticker,
+        "time_from": format_datetime_for_api(start_date),
+        "time_to": format_datetime_for_api(end_date),
+    }
+
+
+def _global_news_params(curr_date, look_back_days, limit) -> tuple:
+    """Return the window start date and the request parameters."""
+    # Calculate start date
+    curr_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    start_dt = curr_dt - timedelta(days=look_back_days)
+    start_date = start_dt.strftime("%Y-%m-%d")
+
+    return start_date, {
+        "topics": "financial_markets,economy_macro,economy_monetary",
+        "time_from": format_datetime_for_api(start_date),
+        "time_to": format_datetime_for_api(curr_date),
+        "limit": str(limit),
+    }
@@ -0,0 +1,42 @@
+"""Run blocking dataflow calls from async code.
+
+yfinance has no async API, and its calls (plus the stores built on it) can
+block for seconds. Async callers hand them to a dedicated, bounded thread
+pool instead of the event loop's default executor, so a burst of tickers
+neither starves other ``asyncio.to_thread`` work nor opens an unbounded
+number of Yahoo connections. Each call runs in a copy of the caller's
+context, so it sees the run's config.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from typing import Any, Awaitable, Callable
+
+YFINANCE_MAX_WORKERS = 8
+
+_yfinance_executor = ThreadPoolExecutor(
+    max_workers=YFINANCE_MAX_WORKERS, thread_name_prefix="yfinance"
+)
+
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """Await ``func(*args, **kwargs)`` run on the yfinance executor."""
+    loop = asyncio.get_running_loop()
+    call = partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(_yfinance_executor, call)
+
+
+def to_async(func: Callable) -> Callable[..., Awaitable[Any]]:
+    """Return a coroutine function running ``func`` through ``run_blocking``.
+
+    The wrapper keeps ``func``'s signature, so vendor cache keys are the same
+    for sync and async calls.
+    """
+
+    @wraps(func)
+    async def call(*args, **kwargs):
+        return await run_blocking(func, *args, **kwargs)
+
+    return call
@@ -0,0 +1,182 @@
+"""Synchronization helpers for the on-disk data caches.
+
+Threads (``ToolNode`` runs tool calls concurrently, ``run_automation.py``
+runs several graphs at once) and processes share one ``data_cache_dir``.
+This module provides the three pieces the stores use to stay consistent:
+
+- ``SingleFlight``: concurrent calls for the same key within a process are
+  coalesced into one in-flight fetch whose result every waiter receives
+  (``AsyncSingleFlight`` does the same for coroutines on an event loop).
+- ``file_lock``: an exclusive lock on ``<path>.lock`` that holds across
+  processes (``fcntl`` on POSIX, ``msvcrt`` on Windows).
+- ``atomic_write``: writes go to a temporary file in the target directory
+  and are moved into place with ``os.replace``, so readers only ever see the
+  old or the new file, never a partial one.
+"""
+
+import asyncio
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into a single execution."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Run ``func`` unless a call for ``key`` is in flight, then share its outcome."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """``SingleFlight`` for coroutines: concurrent awaits of a key share one call.
+
+    Calls are coalesced per event loop, since their futures belong to one loop.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``func()`` unless a call for ``key`` is in flight, then share its outcome."""
+        loop = asyncio.get_running_loop()
+        call_key = (id(loop), key)
+        future = self._calls.get(call_key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = self._calls[call_key] = loop.create_future()
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark it retrieved so an unshared failure is not logged twice
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._calls[call_key]
+        return result
+
+
+# Threads of this process queue on an in-process lock before taking the
+# file lock; ``_held`` makes nested ``file_lock`` calls in one thread re-entrant
+_thread_locks: Dict[str, threading.Lock] = {}
+_thread_locks_guard = threading.Lock()
+_held = threading.local()
+
+
+def _thread_lock(path: str) -> threading.Lock:
+    with _thread_locks_guard:
+        return _thread_locks.setdefault(path, threading.Lock())
+
+
+def _lock_handle(handle) -> None:
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        return
+    handle.seek(0)
+    # LK_LOCK gives up after about 10 seconds; keep trying until acquired
+    while True:
+        try:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _unlock_handle(handle) -> None:
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    else:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """Hold an exclusive cross-process lock for ``path`` (via ``<path>.lock``)."""
+    lock_path = os.path.abspath(f"{path}.lock")
+    held = getattr(_held, "paths", None)
+    if held is None:
+        held = _held.paths = set()
+    if lock_path in held:
+        yield
+        return
+
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    with _thread_lock(lock_path):
+        with open(lock_path, "a+b") as handle:
+            _lock_handle(handle)
+            held.add(lock_path)
+            try:
+                yield
+            finally:
+                held.discard(lock_path)
+                _unlock_handle(handle)
+
+
+@contextmanager
+def atomic_write(path: str) -> Iterator[str]:
+    """Yield a temporary path to write to; it replaces ``path`` on success.
+
+    Example::
+
+        with atomic_write(path) as tmp_path:
+            frame.to_parquet(tmp_path)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(
+        directory,
+        f".{os.path.basename(path)}.{os.getpid()}.{threading.get_ident()}.tmp",
+    )
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
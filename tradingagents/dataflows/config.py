@@ -1,30 +1,81 @@
+import contextvars
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Optional
+
 import tradingagents.default_config as default_config
-from typing import Dict, Optional
 
 # Use default config but allow it to be overridden
 _config: Optional[Dict] = None
+# Frozen view of ``_config`` handed out by ``get_config``
+_default_snapshot: Optional[Mapping] = None
+
+# Config of the run executing in the current context (set by ``use_config``).
+# Threads started by LangGraph copy the context, so every node and tool call
+# of a run sees that run's config, independent of other runs in the process.
+_run_config: contextvars.ContextVar[Optional[Mapping]] = contextvars.ContextVar(
+    "tradingagents_config", default=None
+)
+
+
+def freeze_config(config: Mapping) -> Mapping:
+    """Return a read-only snapshot of ``config`` (nested dicts included)."""
+    return MappingProxyType(
+        {
+            key: freeze_config(value) if isinstance(value, Mapping) else value
+            for key, value in config.items()
+        }
+    )
 
 
 def initialize_config():
     """Initialize the configuration with default values."""
-    global _config
+    global _config, _default_snapshot
     if _config is None:
         _config = default_config.DEFAULT_CONFIG.copy()
+        _default_snapshot = freeze_config(_config)
 
 
 def set_config(config: Dict):
-    """Update the configuration with custom values."""
-    global _config
+    """Update the process-wide default configuration with custom values."""
+    global _config, _default_snapshot
     if _config is None:
         _config = default_config.DEFAULT_CONFIG.copy()
     _config.update(config)
+    _default_snapshot = freeze_config(_config)
+
+
+def get_config() -> Mapping:
+    """Get the current configuration as a read-only mapping.
+
+    Inside ``use_config`` this is the run's snapshot, otherwise the
+    process-wide default. No copy is made, so it is cheap to call per tool.
+    """
+    run_config = _run_config.get()
+    if run_config is not None:
+        return run_config
+    if _default_snapshot is None:
+        initialize_config()
+    return _default_snapshot
+
+
+@contextmanager
+def use_config(config: Mapping) -> Iterator[Mapping]:
+    """Make ``config`` (over the defaults) the current config for this context.
 
+    Example::
 
-def get_config() -> Dict:
-    """Get the current configuration."""
+        with use_config({"data_cache_dir": "/tmp/run-a"}):
+            route_to_vendor("get_stock_data", "AAPL", "2024-01-01", "2024-02-01")
+    """
     if _config is None:
         initialize_config()
-    return _config.copy()
+    snapshot = freeze_config({**_config, **config})
+    token = _run_config.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _run_config.reset(token)
 
 
 # Initialize with default config
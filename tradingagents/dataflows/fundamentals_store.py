@@ -0,0 +1,242 @@
+"""Local point-in-time store for yfinance fundamentals, statements and insider data.
+
+Everything yfinance knows about a symbol is fetched in one pass (company
+overview, quarterly and annual balance sheet / cash flow / income statement,
+insider transactions) and kept under
+``{data_cache_dir}/fundamentals/symbol=<SYMBOL>/``. Statements are stored one
+row per report period and merged with earlier fetches, so the store keeps
+growing a period history beyond the few periods yfinance returns at a time.
+
+Reads are sliced to what was public as of ``curr_date``: a report period only
+becomes visible once its filing deadline has passed, and insider transactions
+only once they have started. The store refreshes on the filing cadence:
+daily while a new quarterly filing is due, otherwise every few weeks. The
+company overview is a live snapshot and refreshes daily.
+"""
+
+import json
+import os
+from typing import Annotated, Dict, Optional
+
+import pandas as pd
+import yfinance as yf
+
+from .cache_sync import SingleFlight, atomic_write, file_lock
+from .config import get_config
+
+# yfinance attribute for each (statement, frequency) pair
+STATEMENT_ATTRIBUTES = {
+    ("balance_sheet", "quarterly"): "quarterly_balance_sheet",
+    ("balance_sheet", "annual"): "balance_sheet",
+    ("cashflow", "quarterly"): "quarterly_cashflow",
+    ("cashflow", "annual"): "cashflow",
+    ("income_statement", "quarterly"): "quarterly_income_stmt",
+    ("income_statement", "annual"): "income_stmt",
+}
+
+# Days after the period end by which a 10-Q / 10-K is normally public
+FILING_LAG_DAYS = {"quarterly": 45, "annual": 90}
+QUARTER_DAYS = 91
+
+INFO_TTL = pd.Timedelta(days=1)
+FILING_DUE_TTL = pd.Timedelta(days=1)
+STATEMENT_TTL = pd.Timedelta(days=30)
+
+_refreshes = SingleFlight()
+
+
+def _symbol_dir(symbol: str) -> str:
+    config = get_config()
+    return os.path.join(
+        config["data_cache_dir"], "fundamentals", f"symbol={symbol.upper()}"
+    )
+
+
+def _read_json(path: str) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_json(path: str, payload: dict) -> None:
+    with atomic_write(path) as tmp_path:
+        with open(tmp_path, "w") as f:
+            json.dump(payload, f, default=str)
+
+
+def _normalize_freq(freq: str) -> str:
+    return "quarterly" if freq.lower() == "quarterly" else "annual"
+
+
+def _statement_path(symbol: str, statement: str, freq: str) -> str:
+    return os.path.join(_symbol_dir(symbol), f"{statement}_{freq}.parquet")
+
+
+def _insider_path(symbol: str) -> str:
+    return os.path.join(_symbol_dir(symbol), "insider_transactions.parquet")
+
+
+def _merge_statement(path: str, data: pd.DataFrame) -> pd.DataFrame:
+    """Merge a yfinance statement (line items x periods) into the stored periods."""
+    periods = data.T
+    periods.index = pd.to_datetime(periods.index).astype("datetime64[ns]")
+    periods.index.name = "period_end"
+    periods.columns = [str(col) for col in periods.columns]
+
+    if os.path.exists(path):
+        stored = pd.read_parquet(path).set_index("period_end")
+        # Fresh values win for periods present in both (restatements)
+        stored = stored[~stored.index.isin(periods.index)]
+        periods = pd.concat([periods, stored])
+
+    periods = periods.sort_index(ascending=False)
+    with atomic_write(path) as tmp_path:
+        periods.reset_index().to_parquet(tmp_path, index=False)
+    return periods
+
+
+def _statements_stale(manifest: dict, now: pd.Timestamp) -> bool:
+    fetched_at = pd.Timestamp(manifest["statements_fetched_at"])
+    last_period = manifest.get("last_quarterly_period")
+    if last_period is None:
+        return now - fetched_at >= FILING_DUE_TTL
+
+    next_filing_due = pd.Timestamp(last_period) + pd.Timedelta(
+        days=QUARTER_DAYS + FILING_LAG_DAYS["quarterly"]
+    )
+    ttl = FILING_DUE_TTL if now >= next_filing_due else STATEMENT_TTL
+    return now - fetched_at >= ttl
+
+
+def refresh_fundamentals(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    force: bool = False,
+) -> dict:
+    """Bring the stored fundamentals of ``symbol`` up to date and return its manifest.
+
+    Statements and insider transactions are re-fetched on the filing cadence;
+    the overview is re-fetched when older than a day. Both come from a single
+    ``yf.Ticker`` object.
+    """
+    symbol = symbol.upper()
+    directory = _symbol_dir(symbol)
+    manifest_path = os.path.join(directory, "manifest.json")
+    manifest = _read_json(manifest_path) or {}
+    if not force and not any(_needs_refresh(manifest)):
+        return manifest
+
+    # Threads refreshing the same symbol share one fetch
+    return _refreshes.do(
+        directory, lambda: _refresh_locked(symbol, directory, manifest_path, force)
+    )
+
+
+def _needs_refresh(manifest: dict, now: pd.Timestamp = None) -> tuple:
+    """Return which parts of a manifest are stale as ``(statements, info)``."""
+    now = now or pd.Timestamp.now()
+    refresh_statements = not manifest or _statements_stale(manifest, now)
+    refresh_info = (
+        "info_fetched_at" not in manifest
+        or now - pd.Timestamp(manifest["info_fetched_at"]) >= INFO_TTL
+    )
+    return refresh_statements, refresh_info
+
+
+def _refresh_locked(symbol: str, directory: str, manifest_path: str, force: bool) -> dict:
+    os.makedirs(directory, exist_ok=True)
+    with file_lock(manifest_path):
+        # Re-read: another process may have refreshed while we waited
+        manifest = _read_json(manifest_path) or {}
+        now = pd.Timestamp.now()
+        refresh_statements, refresh_info = _needs_refresh(manifest, now)
+        refresh_statements = refresh_statements or force
+        refresh_info = refresh_info or force
+        if not refresh_statements and not refresh_info:
+            return manifest
+
+        fetched_at = now.strftime("%Y-%m-%d %H:%M:%S")
+
+        try:
+            ticker_obj = yf.Ticker(symbol)
+
+            if refresh_info:
+                info = ticker_obj.info or {}
+                _write_json(os.path.join(directory, "info.json"), info)
+                manifest["info_fetched_at"] = fetched_at
+
+            if refresh_statements:
+                for (statement, freq), attribute in STATEMENT_ATTRIBUTES.items():
+                    data = getattr(ticker_obj, attribute)
+                    if data is None or data.empty:
+                        continue
+                    periods = _merge_statement(_statement_path(symbol, statement, freq), data)
+                    if freq == "quarterly" and statement == "income_statement":
+                        manifest["last_quarterly_period"] = periods.index[0].strftime("%Y-%m-%d")
+
+                insider = ticker_obj.insider_transactions
+                if insider is not None and not insider.empty:
+                    with atomic_write(_insider_path(symbol)) as tmp_path:
+                        insider.to_parquet(tmp_path, index=False)
+                manifest["statements_fetched_at"] = fetched_at
+        except Exception:
+            # Serve what is already stored if the refresh fails
+            if not manifest:
+                raise
+            return manifest
+
+        _write_json(manifest_path, manifest)
+        return manifest
+
+
+def _visible_as_of(curr_date: Optional[str], lag_days: int = 0) -> Optional[pd.Timestamp]:
+    if not curr_date:
+        return None
+    return pd.Timestamp(curr_date) - pd.Timedelta(days=lag_days)
+
+
+def get_info(symbol: str) -> Dict:
+    """Return the stored company overview of ``symbol``."""
+    refresh_fundamentals(symbol)
+    return _read_json(os.path.join(_symbol_dir(symbol), "info.json")) or {}
+
+
+def get_statement(
+    symbol: str,
+    statement: str,
+    freq: str = "quarterly",
+    curr_date: Optional[str] = None,
+) -> pd.DataFrame:
+    """Return a statement in yfinance layout (line items x periods, newest first).
+
+    With ``curr_date`` only periods whose filing deadline had passed by that
+    date are included.
+    """
+    freq = _normalize_freq(freq)
+    refresh_fundamentals(symbol)
+    path = _statement_path(symbol, statement, freq)
+    if not os.path.exists(path):
+        return pd.DataFrame()
+
+    periods = pd.read_parquet(path).set_index("period_end")
+    cutoff = _visible_as_of(curr_date, FILING_LAG_DAYS[freq])
+    if cutoff is not None:
+        periods = periods[periods.index <= cutoff]
+
+    data = periods.dropna(axis=1, how="all").T
+    data.columns.name = None
+    return data
+
+
+def get_insider_transactions(symbol: str, curr_date: Optional[str] = None) -> pd.DataFrame:
+    """Return stored insider transactions, limited to those started by ``curr_date``."""
+    refresh_fundamentals(symbol)
+    path = _insider_path(symbol)
+    if not os.path.exists(path):
+        return pd.DataFrame()
+
+    data = pd.read_parquet(path)
+    cutoff = _visible_as_of(curr_date)
+    if cutoff is not None and "Start Date" in data.columns:
+        data = data[pd.to_datetime(data["Start Date"]) <= cutoff]
+    return data.reset_index(drop=True)
@@ -0,0 +1,214 @@
+"""Shared HTTP transport for every outbound API call.
+
+One pooled ``requests.Session`` is kept per host, so TLS connections are
+reused across calls and threads. Every request gets connect and read
+timeouts, transient failures (connection errors, timeouts, 429 and 5xx
+responses) are retried a bounded number of times with jittered exponential
+backoff, and a per-host semaphore caps how many requests are in flight
+against one host at a time.
+
+``arequest``/``aget`` are the async counterparts for code running on an event
+loop. They use one pooled ``httpx.AsyncClient`` per host and loop, with the
+same timeouts, retry policy and per-host limits. Top-level async entry points
+run inside ``client_scope()``, which closes the loop's clients once the last
+concurrent scope on that loop exits.
+"""
+
+import asyncio
+import random
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (5.0, 30.0)
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Concurrent requests allowed per host
+DEFAULT_HOST_CONCURRENCY = 8
+HOST_CONCURRENCY = {
+    "www.alphavantage.co": 4,
+    "api.search.brave.com": 2,
+}
+
+_sessions: Dict[str, requests.Session] = {}
+_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_registry_lock = threading.Lock()
+
+
+def _host_limit(host: str) -> int:
+    return HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY)
+
+
+def get_session(host: str) -> requests.Session:
+    """Return the pooled session used for ``host``."""
+    with _registry_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_host_limit(host))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[host] = session
+            _semaphores[host] = threading.BoundedSemaphore(_host_limit(host))
+        return session
+
+
+def _backoff(attempt: int, response=None) -> float:
+    """Seconds to wait before retry ``attempt`` (full jitter, honours Retry-After)."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), BACKOFF_MAX)
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def request(
+    method: str,
+    url: str,
+    timeout: Union[float, Tuple[float, float], None] = None,
+    retries: Optional[int] = None,
+    **kwargs,
+) -> requests.Response:
+    """Send a request through the host's pooled session.
+
+    Args:
+        method: HTTP method
+        url: Absolute URL
+        timeout: Seconds, or a ``(connect, read)`` tuple; defaults to ``DEFAULT_TIMEOUT``
+        retries: Retries after the first attempt; defaults to ``MAX_RETRIES``
+        **kwargs: Passed on to ``requests.Session.request`` (params, headers, ...)
+
+    Returns:
+        The last response. Status codes are not raised here; callers use
+        ``raise_for_status`` as before.
+
+    Raises:
+        requests.RequestException: When the last attempt fails without a response
+    """
+    host = urlsplit(url).netloc
+    session = get_session(host)
+    semaphore = _semaphores[host]
+    timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
+    retries = MAX_RETRIES if retries is None else retries
+
+    for attempt in range(retries + 1):
+        try:
+            with semaphore:
+                response = session.request(method, url, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == retries:
+                raise
+            time.sleep(_backoff(attempt))
+            continue
+
+        if response.status_code in RETRY_STATUSES and attempt < retries:
+            time.sleep(_backoff(attempt, response))
+            continue
+        return response
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """``GET`` through the shared transport; see ``request``."""
+    return request("GET", url, **kwargs)
+
+
+# event loop -> host -> (client, semaphore); clients are bound to their loop
+_async_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+# event loop -> number of open ``client_scope`` blocks
+_client_scopes: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _async_timeout(timeout) -> httpx.Timeout:
+    timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def get_async_client(host: str) -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    """Return the pooled async client for ``host`` on the running loop, and its limit."""
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.setdefault(loop, {})
+    if host not in clients:
+        limit = _host_limit(host)
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit)
+        )
+        clients[host] = (client, asyncio.Semaphore(limit))
+    return clients[host]
+
+
+async def arequest(
+    method: str,
+    url: str,
+    timeout: Union[float, Tuple[float, float], None] = None,
+    retries: Optional[int] = None,
+    **kwargs,
+) -> httpx.Response:
+    """Async ``request``: same arguments, retries and limits, an ``httpx.Response``.
+
+    Raises:
+        httpx.TransportError: When the last attempt fails without a response
+    """
+    host = urlsplit(url).netloc
+    client, semaphore = get_async_client(host)
+    timeout = _async_timeout(timeout)
+    retries = MAX_RETRIES if retries is None else retries
+
+    for attempt in range(retries + 1):
+        try:
+            async with semaphore:
+                response = await client.request(method, url, timeout=timeout, **kwargs)
+        except httpx.TransportError:
+            if attempt == retries:
+                raise
+            await asyncio.sleep(_backoff(attempt))
+            continue
+
+        if response.status_code in RETRY_STATUSES and attempt < retries:
+            await asyncio.sleep(_backoff(attempt, response))
+            continue
+        return response
+
+
+async def aget(url: str, **kwargs) -> httpx.Response:
+    """Async ``GET`` through the shared transport; see ``arequest``."""
+    return await arequest("GET", url, **kwargs)
+
+
+async def aclose() -> None:
+    """Close the async clients of the running loop (call before the loop ends)."""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client, _ in clients.values():
+        await client.aclose()
+
+
+@asynccontextmanager
+async def client_scope() -> AsyncIterator[None]:
+    """Close the running loop's async clients when the outermost scope exits.
+
+    Scopes nest and may run concurrently on one loop (e.g. several
+    ``apropagate`` calls under ``asyncio.gather``); the clients stay open
+    until the last of them finishes.
+    """
+    loop = asyncio.get_running_loop()
+    _client_scopes[loop] = _client_scopes.get(loop, 0) + 1
+    try:
+        yield
+    finally:
+        _client_scopes[loop] -= 1
+        if not _client_scopes[loop]:
+            del _client_scopes[loop]
+            await aclose()
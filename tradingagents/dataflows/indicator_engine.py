@@ -0,0 +1,495 @@
+"""Native NumPy implementation of the technical indicators offered to the market analyst.
+
+The formulas mirror stockstats for the same indicator names, so values are
+interchangeable with what ``stockstats.wrap(df)[name]`` produces:
+
+* moving averages use partial windows at the start of the series
+  (``min_periods=1``),
+* exponential averages are the adjusted ``ewm`` form (``span`` for EMAs,
+  ``alpha = 1 / window`` for the smoothed averages behind RSI and ATR),
+* ``vwma`` weights the typical price ``(high + low + close) / 3`` by volume,
+* ``mfi`` is reported as a 0-1 ratio and pinned to 0.5 for the first
+  ``window`` bars.
+
+``compute_indicators`` evaluates whole histories with cumulative-sum and
+blockwise recursive-filter kernels. ``IndicatorState`` keeps the rolling state
+of every indicator so appending a bar costs O(1).
+
+New indicators are added by registering a function in ``INDICATOR_FUNCTIONS``
+(bulk) and extending ``IndicatorState.update`` (incremental).
+"""
+
+import warnings
+from collections import deque
+from typing import Callable, Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+MACD_WINDOWS = (12, 26, 9)
+RSI_WINDOW = 14
+BOLL_WINDOW = 20
+BOLL_STD_TIMES = 2
+ATR_WINDOW = 14
+VWMA_WINDOW = 14
+MFI_WINDOW = 14
+STOCHRSI_WINDOW = 14
+
+# Keep decay ** -block well inside the float64 range in the blockwise filter
+_MAX_BLOCK_SCALE = 1e50
+
+# RSI ranges below this are float noise of a flat stretch, not a real range;
+# stochrsi treats them as stockstats treats an exactly flat RSI (value 0)
+RSI_RANGE_TOLERANCE = 1e-9
+
+
+# ---------------------------------------------------------------------------
+# Kernels
+# ---------------------------------------------------------------------------
+
+def _linear_filter(x: np.ndarray, decay: float) -> np.ndarray:
+    """Evaluate ``y[t] = x[t] + decay * y[t - 1]`` (with ``y[-1] = 0``).
+
+    Within a block the recurrence is solved in closed form as
+    ``decay**k * cumsum(x / decay**k)``; blocks are chained through the last
+    value so the scaling factors never overflow.
+    """
+    n = len(x)
+    y = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return y
+
+    block = max(1, int(np.log(_MAX_BLOCK_SCALE) / -np.log(decay))) if decay > 0 else 1
+    carry = 0.0
+    for start in range(0, n, block):
+        segment = x[start:start + block]
+        powers = decay ** np.arange(len(segment))
+        out = powers * np.cumsum(segment / powers) + carry * decay * powers
+        y[start:start + len(segment)] = out
+        carry = out[-1]
+    return y
+
+
+def _ewm_mean(x: np.ndarray, alpha: float) -> np.ndarray:
+    """Adjusted exponentially weighted mean (``pandas.Series.ewm(adjust=True)``)."""
+    decay = 1.0 - alpha
+    numerator = _linear_filter(x, decay)
+    denominator = _linear_filter(np.ones_like(x), decay)
+    return numerator / denominator
+
+
+def ema(x: np.ndarray, window: int) -> np.ndarray:
+    """Exponential moving average with ``span=window``."""
+    return _ewm_mean(x, 2.0 / (window + 1.0))
+
+
+def smma(x: np.ndarray, window: int) -> np.ndarray:
+    """Smoothed (Wilder) moving average with ``alpha=1/window``."""
+    return _ewm_mean(x, 1.0 / window)
+
+
+def _window_total(x: np.ndarray, window: int) -> np.ndarray:
+    cumsum = np.cumsum(x, axis=-1)
+    out = cumsum.copy()
+    out[..., window:] = cumsum[..., window:] - cumsum[..., :-window]
+    return out
+
+
+def _masked_window_totals(x: np.ndarray, window: int):
+    """Window sums of the non-NaN values and the number of them per window."""
+    valid = ~np.isnan(x)
+    sums = _window_total(np.where(valid, x, 0.0), window)
+    counts = _window_total(valid.astype(np.float64), window)
+    return sums, counts
+
+
+def rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sum along the last axis over partial windows at the start.
+
+    NaN values are skipped like ``pandas.Series.rolling(min_periods=1).sum()``,
+    so a missing bar only affects the windows containing it; a window with no
+    valid value is NaN.
+    """
+    sums, counts = _masked_window_totals(x, window)
+    return np.where(counts > 0, sums, np.nan)
+
+
+def sma(x: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average along the last axis over partial windows at the start.
+
+    NaN values are skipped, as in ``rolling_sum``.
+    """
+    sums, counts = _masked_window_totals(x, window)
+    return np.divide(sums, counts, out=np.full_like(sums, np.nan), where=counts > 0)
+
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Sample standard deviation (ddof=1) over partial windows; NaN for one sample.
+
+    NaN values are skipped, as in ``rolling_sum``.
+    """
+    n = len(x)
+    out = np.full(n, np.nan)
+    if n and np.isnan(x).any():
+        # Pad so every position has a full window; padding and gaps are NaN
+        padded = np.concatenate([np.full(window - 1, np.nan), x])
+        windows = np.lib.stride_tricks.sliding_window_view(padded, window)
+        counts = (~np.isnan(windows)).sum(axis=1)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            std = np.nanstd(windows, axis=1, ddof=1)
+        return np.where(counts > 1, std, np.nan)
+    for i in range(1, min(window - 1, n)):
+        out[i] = np.std(x[:i + 1], ddof=1)
+    if n >= window and window > 1:
+        windows = np.lib.stride_tricks.sliding_window_view(x, window)
+        out[window - 1:] = windows.std(axis=1, ddof=1)
+    return out
+
+
+def _rolling_extreme(x: np.ndarray, window: int, reducer) -> np.ndarray:
+    n = len(x)
+    out = np.empty(n, dtype=np.float64)
+    head = min(window - 1, n)
+    out[:head] = reducer.accumulate(x[:head])
+    if n >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(x, window)
+        out[window - 1:] = reducer.reduce(windows, axis=1)
+    return out
+
+
+def typical_price(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    return (close + high + low) / 3.0
+
+
+def _diff(x: np.ndarray) -> np.ndarray:
+    out = np.zeros_like(x)
+    out[1:] = np.diff(x)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Indicators
+# ---------------------------------------------------------------------------
+
+class _Inputs:
+    """Float64 price arrays plus memoized intermediates shared by indicators."""
+
+    def __init__(self, data: pd.DataFrame):
+        columns = {col.lower(): col for col in data.columns}
+        self.close = data[columns["close"]].to_numpy(dtype=np.float64)
+        self.high = data[columns["high"]].to_numpy(dtype=np.float64)
+        self.low = data[columns["low"]].to_numpy(dtype=np.float64)
+        self.volume = data[columns["volume"]].to_numpy(dtype=np.float64)
+        self._cache: Dict[str, np.ndarray] = {}
+
+    def memo(self, key: str, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+
+def _macd(inputs: _Inputs) -> np.ndarray:
+    short_w, long_w, _ = MACD_WINDOWS
+    return inputs.memo(
+        "macd", lambda: ema(inputs.close, short_w) - ema(inputs.close, long_w)
+    )
+
+
+def _macds(inputs: _Inputs) -> np.ndarray:
+    return inputs.memo("macds", lambda: ema(_macd(inputs), MACD_WINDOWS[2]))
+
+
+def _rsi(inputs: _Inputs, window: int = RSI_WINDOW) -> np.ndarray:
+    def compute():
+        diff = _diff(inputs.close)
+        up = smma(np.where(diff > 0, diff, 0.0), window)
+        down = smma(np.where(diff < 0, -diff, 0.0), window)
+        total = up + down
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = np.where(total != 0, 100 * (up / total), 50.0)
+        rsi[:1] = 50.0
+        return rsi
+
+    return inputs.memo(f"rsi_{window}", compute)
+
+
+def _boll(inputs: _Inputs) -> np.ndarray:
+    return inputs.memo("boll", lambda: sma(inputs.close, BOLL_WINDOW))
+
+
+def _boll_width(inputs: _Inputs) -> np.ndarray:
+    return inputs.memo(
+        "boll_width",
+        lambda: BOLL_STD_TIMES * rolling_std(inputs.close, BOLL_WINDOW),
+    )
+
+
+def _atr(inputs: _Inputs) -> np.ndarray:
+    prev_close = np.empty_like(inputs.close)
+    prev_close[:1] = inputs.close[:1]
+    prev_close[1:] = inputs.close[:-1]
+    tr = np.maximum(
+        inputs.high - inputs.low,
+        np.maximum(np.abs(inputs.high - prev_close), np.abs(inputs.low - prev_close)),
+    )
+    return smma(np.nan_to_num(tr), ATR_WINDOW)
+
+
+def _vwma(inputs: _Inputs) -> np.ndarray:
+    tp = typical_price(inputs.high, inputs.low, inputs.close)
+    tpv = rolling_sum(inputs.volume * tp, VWMA_WINDOW)
+    vol = rolling_sum(inputs.volume, VWMA_WINDOW)
+    return np.divide(tpv, vol, out=np.zeros_like(tpv), where=vol != 0)
+
+
+def _mfi(inputs: _Inputs) -> np.ndarray:
+    tp = typical_price(inputs.high, inputs.low, inputs.close)
+    raw_money_flow = tp * inputs.volume
+    tp_diff = _diff(tp)
+    pos_sum = rolling_sum(np.where(tp_diff > 0, raw_money_flow, 0.0), MFI_WINDOW)
+    neg_sum = rolling_sum(np.where(tp_diff < 0, raw_money_flow, 0.0), MFI_WINDOW)
+    total = pos_sum + neg_sum
+    mfi = np.divide(pos_sum, total, out=np.full_like(pos_sum, 0.5), where=total > 0)
+    mfi[:MFI_WINDOW] = 0.5
+    return mfi
+
+
+def _stochrsi(inputs: _Inputs) -> np.ndarray:
+    rsi = _rsi(inputs, STOCHRSI_WINDOW)
+    rsi_min = _rolling_extreme(rsi, STOCHRSI_WINDOW, np.minimum)
+    rsi_max = _rolling_extreme(rsi, STOCHRSI_WINDOW, np.maximum)
+    rsi_range = rsi_max - rsi_min
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(rsi_range > RSI_RANGE_TOLERANCE, (rsi - rsi_min) / rsi_range, 0.0) * 100
+
+
+INDICATOR_FUNCTIONS: Dict[str, Callable[[_Inputs], np.ndarray]] = {
+    "close_50_sma": lambda inputs: sma(inputs.close, 50),
+    "close_200_sma": lambda inputs: sma(inputs.close, 200),
+    "close_10_ema": lambda inputs: ema(inputs.close, 10),
+    "macd": _macd,
+    "macds": _macds,
+    "macdh": lambda inputs: _macd(inputs) - _macds(inputs),
+    "rsi": _rsi,
+    "boll": _boll,
+    "boll_ub": lambda inputs: _boll(inputs) + _boll_width(inputs),
+    "boll_lb": lambda inputs: _boll(inputs) - _boll_width(inputs),
+    "atr": _atr,
+    "vwma": _vwma,
+    "mfi": _mfi,
+    "stochrsi": _stochrsi,
+}
+
+
+def compute_indicators(
+    data: pd.DataFrame,
+    indicators: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    """Compute indicators over a full price history in one vectorized pass.
+
+    Args:
+        data: Price frame with Date, High, Low, Close and Volume columns
+        indicators: Names to compute; defaults to every registered indicator
+
+    Returns:
+        Frame indexed by Date with one float column per indicator
+    """
+    names = list(indicators) if indicators is not None else list(INDICATOR_FUNCTIONS)
+    unknown = [name for name in names if name not in INDICATOR_FUNCTIONS]
+    if unknown:
+        raise ValueError(
+            f"Indicators {unknown} are not supported. Please choose from: {list(INDICATOR_FUNCTIONS)}"
+        )
+
+    inputs = _Inputs(data)
+    index = pd.DatetimeIndex(data["Date"].to_numpy(), name="Date")
+    return pd.DataFrame(
+        {name: INDICATOR_FUNCTIONS[name](inputs) for name in names}, index=index
+    )
+
+
+# ---------------------------------------------------------------------------
+# Incremental state
+# ---------------------------------------------------------------------------
+
+class _EwmState:
+    """Running numerator/denominator of an adjusted exponentially weighted mean."""
+
+    __slots__ = ("decay", "numerator", "denominator")
+
+    def __init__(self, alpha: float):
+        self.decay = 1.0 - alpha
+        self.numerator = 0.0
+        self.denominator = 0.0
+
+    def seed(self, x: np.ndarray) -> None:
+        if len(x):
+            self.numerator = _linear_filter(x, self.decay)[-1]
+            self.denominator = _linear_filter(np.ones_like(x), self.decay)[-1]
+
+    def update(self, x: float) -> float:
+        self.numerator = x + self.decay * self.numerator
+        self.denominator = 1.0 + self.decay * self.denominator
+        return self.numerator / self.denominator
+
+
+class _WindowSum:
+    """Rolling sum over the last ``window`` values (partial at the start)."""
+
+    __slots__ = ("values", "total")
+
+    def __init__(self, window: int):
+        self.values = deque(maxlen=window)
+        self.total = 0.0
+
+    def seed(self, x: np.ndarray) -> None:
+        self.values.extend(x[-self.values.maxlen:].tolist())
+        self.total = float(sum(self.values))
+
+    def update(self, x: float) -> float:
+        if len(self.values) == self.values.maxlen:
+            self.total -= self.values[0]
+        self.values.append(x)
+        self.total += x
+        return self.total
+
+
+class IndicatorState:
+    """Rolling state of every indicator, updated one bar at a time in O(1).
+
+    Example:
+        state = IndicatorState.from_history(prices)
+        latest = state.update(high=..., low=..., close=..., volume=...)
+    """
+
+    def __init__(self):
+        short_w, long_w, signal_w = MACD_WINDOWS
+        self.bars = 0
+        self.prev_close: Optional[float] = None
+        self.prev_tp: Optional[float] = None
+
+        self.sma_50 = _WindowSum(50)
+        self.sma_200 = _WindowSum(200)
+        self.ema_10 = _EwmState(2.0 / 11.0)
+        self.ema_short = _EwmState(2.0 / (short_w + 1.0))
+        self.ema_long = _EwmState(2.0 / (long_w + 1.0))
+        self.macd_signal = _EwmState(2.0 / (signal_w + 1.0))
+        self.rsi_up = _EwmState(1.0 / RSI_WINDOW)
+        self.rsi_down = _EwmState(1.0 / RSI_WINDOW)
+        self.rsi_history = deque(maxlen=STOCHRSI_WINDOW)
+        self.boll_closes = deque(maxlen=BOLL_WINDOW)
+        self.atr = _EwmState(1.0 / ATR_WINDOW)
+        self.vwma_tpv = _WindowSum(VWMA_WINDOW)
+        self.vwma_volume = _WindowSum(VWMA_WINDOW)
+        self.mfi_pos = _WindowSum(MFI_WINDOW)
+        self.mfi_neg = _WindowSum(MFI_WINDOW)
+
+    @classmethod
+    def from_history(cls, data: pd.DataFrame) -> "IndicatorState":
+        """Seed the state from an existing price history.
+
+        The recursive averages are seeded with the vectorized kernels and the
+        windowed ones with their last ``window`` inputs, so no bar is replayed.
+        """
+        inputs = _Inputs(data)
+        state = cls()
+        if len(inputs.close) == 0:
+            return state
+
+        close, high, low, volume = inputs.close, inputs.high, inputs.low, inputs.volume
+        diff = _diff(close)
+        tp = typical_price(high, low, close)
+        tp_diff = _diff(tp)
+        flow = tp * volume
+        prev_close = np.concatenate([close[:1], close[:-1]])
+        tr = np.maximum(
+            high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close))
+        )
+
+        state.sma_50.seed(close)
+        state.sma_200.seed(close)
+        state.ema_10.seed(close)
+        state.ema_short.seed(close)
+        state.ema_long.seed(close)
+        state.macd_signal.seed(_macd(inputs))
+        state.rsi_up.seed(np.where(diff > 0, diff, 0.0))
+        state.rsi_down.seed(np.where(diff < 0, -diff, 0.0))
+        state.rsi_history.extend(_rsi(inputs, STOCHRSI_WINDOW)[-STOCHRSI_WINDOW:].tolist())
+        state.boll_closes.extend(close[-BOLL_WINDOW:].tolist())
+        state.atr.seed(np.nan_to_num(tr))
+        state.vwma_tpv.seed(volume * tp)
+        state.vwma_volume.seed(volume)
+        state.mfi_pos.seed(np.where(tp_diff > 0, flow, 0.0))
+        state.mfi_neg.seed(np.where(tp_diff < 0, flow, 0.0))
+
+        state.bars = len(close)
+        state.prev_close = float(close[-1])
+        state.prev_tp = float(tp[-1])
+        return state
+
+    def update(self, high: float, low: float, close: float, volume: float) -> Dict[str, float]:
+        """Append one bar and return every indicator value for it."""
+        high, low, close, volume = float(high), float(low), float(close), float(volume)
+        prev_close = close if self.prev_close is None else self.prev_close
+        tp = (close + high + low) / 3.0
+        tp_diff = 0.0 if self.prev_tp is None else tp - self.prev_tp
+        diff = close - prev_close
+        values: Dict[str, float] = {}
+
+        # Moving averages
+        values["close_50_sma"] = self.sma_50.update(close) / len(self.sma_50.values)
+        values["close_200_sma"] = self.sma_200.update(close) / len(self.sma_200.values)
+        values["close_10_ema"] = self.ema_10.update(close)
+
+        # MACD
+        macd = self.ema_short.update(close) - self.ema_long.update(close)
+        macds = self.macd_signal.update(macd)
+        values["macd"] = macd
+        values["macds"] = macds
+        values["macdh"] = macd - macds
+
+        # RSI and stochastic RSI
+        up = self.rsi_up.update(diff if diff > 0 else 0.0)
+        down = self.rsi_down.update(-diff if diff < 0 else 0.0)
+        total = up + down
+        rsi = 100 * (up / total) if total != 0 else 50.0
+        if self.bars == 0:
+            rsi = 50.0
+        values["rsi"] = rsi
+        self.rsi_history.append(rsi)
+        rsi_min, rsi_max = min(self.rsi_history), max(self.rsi_history)
+        rsi_range = rsi_max - rsi_min
+        values["stochrsi"] = (
+            (rsi - rsi_min) / rsi_range * 100 if rsi_range > RSI_RANGE_TOLERANCE else 0.0
+        )
+
+        # Bollinger bands
+        self.boll_closes.append(close)
+        window = np.fromiter(self.boll_closes, dtype=np.float64)
+        boll = window.mean()
+        width = BOLL_STD_TIMES * (window.std(ddof=1) if len(window) > 1 else np.nan)
+        values["boll"] = boll
+        values["boll_ub"] = boll + width
+        values["boll_lb"] = boll - width
+
+        # ATR
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        values["atr"] = self.atr.update(0.0 if np.isnan(tr) else tr)
+
+        # Volume-based
+        tpv = self.vwma_tpv.update(volume * tp)
+        vol = self.vwma_volume.update(volume)
+        values["vwma"] = tpv / vol if vol != 0 else 0.0
+
+        flow = tp * volume
+        pos = self.mfi_pos.update(flow if tp_diff > 0 else 0.0)
+        neg = self.mfi_neg.update(flow if tp_diff < 0 else 0.0)
+        mfi_total = pos + neg
+        mfi = pos / mfi_total if mfi_total > 0 else 0.5
+        values["mfi"] = 0.5 if self.bars < MFI_WINDOW else mfi
+
+        self.bars += 1
+        self.prev_close = close
+        self.prev_tp = tp
+        return values
@@ -1,19 +1,34 @@
+import asyncio
+from functools import partial
 from typing import Annotated
 
 # Import from vendor-specific modules
 from .y_finance import (
     get_YFin_data_online,
     get_stock_stats_indicators_window,
+    get_stock_stats_indicators_batch,
     get_fundamentals as get_yfinance_fundamentals,
     get_balance_sheet as get_yfinance_balance_sheet,
     get_cashflow as get_yfinance_cashflow,
     get_income_statement as get_yfinance_income_statement,
     get_insider_transactions as get_yfinance_insider_transactions,
 )
+from .y_finance import (
+    aget_YFin_data_online,
+    aget_stock_stats_indicators_window,
+    aget_stock_stats_indicators_batch,
+    aget_fundamentals as aget_yfinance_fundamentals,
+    aget_balance_sheet as aget_yfinance_balance_sheet,
+    aget_cashflow as aget_yfinance_cashflow,
+    aget_income_statement as aget_yfinance_income_statement,
+    aget_insider_transactions as aget_yfinance_insider_transactions,
+)
 from .yfinance_news import get_news_yfinance, get_global_news_yfinance
+from .yfinance_news import aget_news_yfinance, aget_global_news_yfinance
 from .alpha_vantage import (
     get_stock as get_alpha_vantage_stock,
     get_indicator as get_alpha_vantage_indicator,
+    get_indicator_batch as get_alpha_vantage_indicator_batch,
     get_fundamentals as get_alpha_vantage_fundamentals,
     get_balance_sheet as get_alpha_vantage_balance_sheet,
     get_cashflow as get_alpha_vantage_cashflow,
@@ -21,8 +36,21 @@ from .alpha_vantage import (
     get_insider_transactions as get_alpha_vantage_insider_transactions,
     get_news as get_alpha_vantage_news,
     get_global_news as get_alpha_vantage_global_news,
+    aget_stock as aget_alpha_vantage_stock,
+    aget_indicator as aget_alpha_vantage_indicator,
+    aget_indicator_batch as aget_alpha_vantage_indicator_batch,
+    aget_fundamentals as aget_alpha_vantage_fundamentals,
+    aget_balance_sheet as aget_alpha_vantage_balance_sheet,
+    aget_cashflow as aget_alpha_vantage_cashflow,
+    aget_income_statement as aget_alpha_vantage_income_statement,
+    aget_insider_transactions as aget_alpha_vantage_insider_transactions,
+    aget_news as aget_alpha_vantage_news,
+    aget_global_news as aget_alpha_vantage_global_news,
 )
 from .alpha_vantage_common import AlphaVantageRateLimitError
+from . import news_archive
+from .vendor_cache import acached_call, cached_call
+from . import vendor_health
 
 # Configuration and routing logic
 from .config import get_config
@@ -38,7 +66,8 @@ TOOLS_CATEGORIES = {
     "technical_indicators": {
         "description": "Technical analysis indicators",
         "tools": [
-            "get_indicators"
+            "get_indicators",
+            "get_indicators_batch"
         ]
     },
     "fundamental_data": {
@@ -77,6 +106,10 @@ VENDOR_METHODS = {
         "alpha_vantage": get_alpha_vantage_indicator,
         "yfinance": get_stock_stats_indicators_window,
     },
+    "get_indicators_batch": {
+        "alpha_vantage": get_alpha_vantage_indicator_batch,
+        "yfinance": get_stock_stats_indicators_batch,
+    },
     # fundamental_data
     "get_fundamentals": {
         "alpha_vantage": get_alpha_vantage_fundamentals,
@@ -109,6 +142,55 @@ VENDOR_METHODS = {
     },
 }
 
+# Async implementations used by aroute_to_vendor: native async HTTP for Alpha
+# Vantage, the bounded yfinance executor for yfinance
+ASYNC_VENDOR_METHODS = {
+    # core_stock_apis
+    "get_stock_data": {
+        "alpha_vantage": aget_alpha_vantage_stock,
+        "yfinance": aget_YFin_data_online,
+    },
+    # technical_indicators
+    "get_indicators": {
+        "alpha_vantage": aget_alpha_vantage_indicator,
+        "yfinance": aget_stock_stats_indicators_window,
+    },
+    "get_indicators_batch": {
+        "alpha_vantage": aget_alpha_vantage_indicator_batch,
+        "yfinance": aget_stock_stats_indicators_batch,
+    },
+    # fundamental_data
+    "get_fundamentals": {
+        "alpha_vantage": aget_alpha_vantage_fundamentals,
+        "yfinance": aget_yfinance_fundamentals,
+    },
+    "get_balance_sheet": {
+        "alpha_vantage": aget_alpha_vantage_balance_sheet,
+        "yfinance": aget_yfinance_balance_sheet,
+    },
+    "get_cashflow": {
+        "alpha_vantage": aget_alpha_vantage_cashflow,
+        "yfinance": aget_yfinance_cashflow,
+    },
+    "get_income_statement": {
+        "alpha_vantage": aget_alpha_vantage_income_statement,
+        "yfinance": aget_yfinance_income_statement,
+    },
+    # news_data
+    "get_news": {
+        "alpha_vantage": aget_alpha_vantage_news,
+        "yfinance": aget_news_yfinance,
+    },
+    "get_global_news": {
+        "yfinance": aget_global_news_yfinance,
+        "alpha_vantage": aget_alpha_vantage_global_news,
+    },
+    "get_insider_transactions": {
+        "alpha_vantage": aget_alpha_vantage_insider_transactions,
+        "yfinance": aget_yfinance_insider_transactions,
+    },
+}
+
 def get_category_for_method(method: str) -> str:
     """Get the category that contains the specified method."""
     for category, info in TOOLS_CATEGORIES.items():
@@ -131,8 +213,8 @@ def get_vendor(category: str, method: str = None) -> str:
     # Fall back to category-level configuration
     return config.get("data_vendors", {}).get(category, "default")
 
-def route_to_vendor(method: str, *args, **kwargs):
-    """Route method calls to appropriate vendor implementation with fallback support."""
+def _fallback_chain(method: str) -> list:
+    """Configured vendors first, then the remaining ones; open circuits go last."""
     category = get_category_for_method(method)
     vendor_config = get_vendor(category, method)
     primary_vendors = [v.strip() for v in vendor_config.split(',')]
@@ -147,16 +229,104 @@ def route_to_vendor(method: str, *args, **kwargs):
         if vendor not in fallback_vendors:
             fallback_vendors.append(vendor)
 
-    for vendor in fallback_vendors:
-        if vendor not in VENDOR_METHODS[method]:
-            continue
+    # Vendors with an open circuit breaker go to the back of the chain
+    return vendor_health.order_vendors(
+        [v for v in fallback_vendors if v in VENDOR_METHODS[method]], method
+    )
+
+def _no_vendor_succeeded(method: str, last_result, last_error):
+    if last_result is not None:
+        return last_result
+    if last_error is not None and not isinstance(last_error, AlphaVantageRateLimitError):
+        raise last_error
+    raise RuntimeError(f"No available vendor for '{method}'")
+
+def route_to_vendor(method: str, *args, **kwargs):
+    """Route method calls to appropriate vendor implementation with fallback support."""
+    category = get_category_for_method(method)
+    fallback_vendors = _fallback_chain(method)
 
+    # News already fetched for this window is served from the local archive,
+    # which renders it the way the yfinance vendor does
+    serves_archive = fallback_vendors[:1] == [news_archive.ARCHIVE_VENDOR]
+    if method in news_archive.ARCHIVE_METHODS and serves_archive:
+        archived = news_archive.lookup(method, *args, **kwargs)
+        if archived is not None:
+            return archived
+
+    def call_vendor(vendor):
         vendor_impl = VENDOR_METHODS[method][vendor]
         impl_func = vendor_impl[0] if isinstance(vendor_impl, list) else vendor_impl
+        timed_func = vendor_health.timed(vendor, method, impl_func)
+        return lambda: cached_call(method, category, vendor, timed_func, args, kwargs)
+
+    last_result = None
+    last_error = None
+    for i, vendor in enumerate(fallback_vendors):
+        call = call_vendor(vendor)
+
+        # Hedged mode: also ask the next vendor if this one is slower than its p95
+        delay = vendor_health.hedge_delay(vendor, method)
+        if delay is not None and i + 1 < len(fallback_vendors):
+            call = partial(
+                vendor_health.run_hedged, call, call_vendor(fallback_vendors[i + 1]), delay
+            )
 
         try:
-            return impl_func(*args, **kwargs)
-        except AlphaVantageRateLimitError:
-            continue  # Only rate limits trigger fallback
+            result = call()
+        except Exception as e:
+            # Rate limits and vendor failures alike move on to the next vendor
+            last_error = e
+            continue
+
+        if not vendor_health.is_error_result(result):
+            return result
+        last_result = result
+
+    return _no_vendor_succeeded(method, last_result, last_error)
+
+async def aroute_to_vendor(method: str, *args, **kwargs):
+    """Async ``route_to_vendor``: same fallback chain, caches and health tracking.
+
+    Alpha Vantage is called over async HTTP; yfinance calls run on a bounded
+    executor, so many tickers can be served from one event loop.
+    """
+    category = get_category_for_method(method)
+    fallback_vendors = _fallback_chain(method)
+
+    # News already fetched for this window is served from the local archive,
+    # which renders it the way the yfinance vendor does
+    serves_archive = fallback_vendors[:1] == [news_archive.ARCHIVE_VENDOR]
+    if method in news_archive.ARCHIVE_METHODS and serves_archive:
+        archived = await asyncio.to_thread(news_archive.lookup, method, *args, **kwargs)
+        if archived is not None:
+            return archived
+
+    def call_vendor(vendor):
+        timed_func = vendor_health.atimed(vendor, method, ASYNC_VENDOR_METHODS[method][vendor])
+        return lambda: acached_call(method, category, vendor, timed_func, args, kwargs)
+
+    last_result = None
+    last_error = None
+    for i, vendor in enumerate(fallback_vendors):
+        call = call_vendor(vendor)
+
+        # Hedged mode: also ask the next vendor if this one is slower than its p95
+        delay = vendor_health.hedge_delay(vendor, method)
+        if delay is not None and i + 1 < len(fallback_vendors):
+            call = partial(
+                vendor_health.arun_hedged, call, call_vendor(fallback_vendors[i + 1]), delay
+            )
+
+        try:
+            result = await call()
+        except Exception as e:
+            # Rate limits and vendor failures alike move on to the next vendor
+            last_error = e
+            continue
+
+        if not vendor_health.is_error_result(result):
+            return result
+        last_result = result
 
-    raise RuntimeError(f"No available vendor for '{method}'")
\ No newline at end of file
+    return _no_vendor_succeeded(method, last_result, last_error)
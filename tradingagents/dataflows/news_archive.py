@@ -0,0 +1,407 @@
+"""Append-only local news archive backed by SQLite with FTS5 full-text search.
+
+Every article the news vendors return is appended to
+``{data_cache_dir}/news/archive.db`` and tagged with the topic it was fetched
+for (a ticker symbol, or ``GLOBAL`` for macro news). Articles are deduplicated
+by URL and by a hash of their normalized title, so the same story syndicated
+under several links is stored once. Publish times are stored as UTC ISO
+strings with an index, which makes date-range queries index scans. Articles
+without a publish time are kept (full-text search finds them) but never
+appear in a date range.
+
+The archive also records which ``(topic, start, end)`` windows have been
+fetched. ``lookup`` serves a ``get_news`` / ``get_global_news`` call from disk
+when a previous fetch already covers it. A fetch from a source that queries
+the date range itself (``RANGE_SOURCES``) covers a window forever once the
+window had closed when it was fetched. Any other source (yfinance only
+returns the latest articles) can only serve windows reaching today; such a
+fetch covers its window for ``NEWS_TTL``, and past windows are never recorded.
+
+Archived news is rendered in the yfinance vendor's markdown layout, so the
+router only consults the archive when yfinance is the vendor being asked.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_TOPIC = "GLOBAL"
+ARCHIVE_METHODS = ("get_news", "get_global_news")
+ARCHIVE_VENDOR = "yfinance"
+# Sources whose fetch returns every article in the requested window
+RANGE_SOURCES = ("alpha_vantage",)
+NEWS_TTL = timedelta(hours=1)
+TICKER_NEWS_LIMIT = 20
+GLOBAL_NEWS_LIMIT = 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT UNIQUE,
+    title_hash TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL DEFAULT '',
+    publisher TEXT NOT NULL DEFAULT '',
+    sentiment TEXT,
+    published_at TEXT,
+    source TEXT NOT NULL,
+    archived_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_published_at ON articles (published_at);
+CREATE TABLE IF NOT EXISTS article_topics (
+    topic TEXT NOT NULL,
+    article_id INTEGER NOT NULL REFERENCES articles (id),
+    PRIMARY KEY (topic, article_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS fetch_log (
+    topic TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    source TEXT NOT NULL,
+    fetched_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fetch_log_topic ON fetch_log (topic, fetched_at);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (
+    title, summary, content='articles', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, summary)
+    VALUES (new.id, new.title, new.summary);
+END;
+"""
+
+# Archive paths whose schema is in place, mapped to FTS5 availability
+_initialized: Dict[str, bool] = {}
+
+
+def get_archive_path() -> str:
+    """Return the SQLite file holding the news archive."""
+    config = get_config()
+    return os.path.join(config["data_cache_dir"], "news", "archive.db")
+
+
+def _rename_legacy_articles(conn: sqlite3.Connection) -> bool:
+    """Move aside an ``articles`` table whose ``published_at`` is NOT NULL."""
+    columns = {row["name"]: row for row in conn.execute("PRAGMA table_info(articles)")}
+    if "published_at" not in columns or not columns["published_at"]["notnull"]:
+        return False
+    conn.execute("ALTER TABLE articles RENAME TO articles_legacy")
+    return True
+
+
+def _copy_legacy_articles(conn: sqlite3.Connection) -> None:
+    # Undated articles used to be stamped with their archive time
+    conn.executescript(
+        """
+        INSERT INTO articles (id, url, title_hash, title, summary, publisher, sentiment,
+                              published_at, source, archived_at)
+        SELECT id, url, title_hash, title, summary, publisher, sentiment,
+               NULLIF(published_at, archived_at), source, archived_at
+        FROM articles_legacy;
+        DROP TABLE articles_legacy;
+        """
+    )
+
+
+def _connect() -> sqlite3.Connection:
+    path = get_archive_path()
+    if path not in _initialized:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+
+    if path not in _initialized:
+        conn.execute("PRAGMA journal_mode=WAL")
+        legacy = _rename_legacy_articles(conn)
+        conn.executescript(_SCHEMA)
+        if legacy:
+            _copy_legacy_articles(conn)
+        try:
+            conn.executescript(_FTS_SCHEMA)
+            _initialized[path] = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5: search falls back to LIKE
+            _initialized[path] = False
+    return conn
+
+
+def _fts_available() -> bool:
+    return _initialized.get(get_archive_path(), False)
+
+
+def _utc_iso(value) -> str:
+    """Normalize a datetime (naive = UTC) to a sortable UTC ISO string."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _title_hash(title: str) -> str:
+    normalized = " ".join(title.lower().split())
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def add_articles(articles: Iterable[Dict], topic: str, source: str) -> int:
+    """Append articles to the archive and tag them with ``topic``.
+
+    Each article is a dict with ``title``, ``summary``, ``publisher``,
+    ``link``, ``pub_date`` (datetime or None) and optionally ``sentiment``.
+    Articles without a publish time are stored without one, so they never
+    match a date range.
+
+    Returns:
+        Number of articles that were new to the archive
+    """
+    topic = topic.upper()
+    archived_at = _utc_iso(_now())
+    added = 0
+
+    with _connect() as conn:
+        for article in articles:
+            title = (article.get("title") or "").strip()
+            if not title or title == "No title":
+                continue
+            url = article.get("link") or None
+            title_hash = _title_hash(title)
+            pub_date = article.get("pub_date")
+            published_at = _utc_iso(pub_date) if pub_date else None
+
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO articles (url, title_hash, title, summary, publisher,"
+                " sentiment, published_at, source, archived_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    title_hash,
+                    title,
+                    article.get("summary") or "",
+                    article.get("publisher") or "",
+                    article.get("sentiment"),
+                    published_at,
+                    source,
+                    archived_at,
+                ),
+            )
+            added += cursor.rowcount
+
+            row = conn.execute(
+                "SELECT id FROM articles WHERE title_hash = ? OR url = ? LIMIT 1",
+                (title_hash, url),
+            ).fetchone()
+            conn.execute(
+                "INSERT OR IGNORE INTO article_topics (topic, article_id) VALUES (?, ?)",
+                (topic, row["id"]),
+            )
+    conn.close()
+    return added
+
+
+def record_fetch(topic: str, start_date: str, end_date: str, source: str) -> None:
+    """Remember that ``[start_date, end_date]`` was fetched for ``topic``.
+
+    Sources outside ``RANGE_SOURCES`` only return the latest articles, so a
+    window ending before today is not recorded: they cannot have served it.
+    """
+    if source not in RANGE_SOURCES and end_date < _now().strftime("%Y-%m-%d"):
+        return
+    with _connect() as conn:
+        conn.execute(
+            "INSERT INTO fetch_log (topic, start_date, end_date, source, fetched_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (topic.upper(), start_date, end_date, source, _utc_iso(_now())),
+        )
+    conn.close()
+
+
+def is_covered(topic: str, start_date: str, end_date: str) -> bool:
+    """Check whether an earlier fetch already returned everything for the window."""
+    now = _now()
+    window_closed_at = _utc_iso(datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1))
+    fresh_after = _utc_iso(now - NEWS_TTL)
+    range_sources = ", ".join("?" for _ in RANGE_SOURCES)
+
+    with _connect() as conn:
+        row = conn.execute(
+            "SELECT 1 FROM fetch_log WHERE topic = ? AND start_date <= ? AND end_date >= ?"
+            f" AND ((source IN ({range_sources}) AND fetched_at >= ?) OR fetched_at >= ?)"
+            " LIMIT 1",
+            (topic.upper(), start_date, end_date, *RANGE_SOURCES, window_closed_at, fresh_after),
+        ).fetchone()
+    conn.close()
+    return row is not None
+
+
+def query_articles(
+    topic: Optional[str],
+    start_date: str,
+    end_date: str,
+    limit: int = TICKER_NEWS_LIMIT,
+) -> List[sqlite3.Row]:
+    """Return archived articles published in ``[start_date, end_date]``, newest first."""
+    start = f"{start_date}T00:00:00"
+    end = _utc_iso(datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1))
+
+    sql = "SELECT a.* FROM articles a"
+    params: list = []
+    if topic:
+        sql += " JOIN article_topics t ON t.article_id = a.id AND t.topic = ?"
+        params.append(topic.upper())
+    sql += " WHERE a.published_at >= ? AND a.published_at < ?"
+    sql += " ORDER BY a.published_at DESC LIMIT ?"
+    params += [start, end, limit]
+
+    with _connect() as conn:
+        rows = conn.execute(sql, params).fetchall()
+    conn.close()
+    return rows
+
+
+def search_news(
+    query: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    topic: Optional[str] = None,
+    limit: int = TICKER_NEWS_LIMIT,
+) -> List[sqlite3.Row]:
+    """Full-text search over archived titles and summaries.
+
+    ``query`` uses FTS5 syntax (e.g. ``"rate cut" OR inflation``). Results are
+    ranked by relevance and can be limited to a date range and topic.
+    """
+    conn = _connect()
+    params: list = []
+    if _fts_available():
+        sql = (
+            "SELECT a.* FROM articles_fts f JOIN articles a ON a.id = f.rowid"
+            " WHERE articles_fts MATCH ?"
+        )
+        params.append(query)
+        order = " ORDER BY bm25(articles_fts)"
+    else:
+        sql = "SELECT a.* FROM articles a WHERE (a.title LIKE ? OR a.summary LIKE ?)"
+        params += [f"%{query}%", f"%{query}%"]
+        order = " ORDER BY a.published_at DESC"
+
+    if topic:
+        sql += " AND a.id IN (SELECT article_id FROM article_topics WHERE topic = ?)"
+        params.append(topic.upper())
+    if start_date:
+        sql += " AND a.published_at >= ?"
+        params.append(f"{start_date}T00:00:00")
+    if end_date:
+        sql += " AND a.published_at < ?"
+        params.append(_utc_iso(datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)))
+    sql += order + " LIMIT ?"
+    params.append(limit)
+
+    with conn:
+        rows = conn.execute(sql, params).fetchall()
+    conn.close()
+    return rows
+
+
+def format_articles(rows: Iterable[sqlite3.Row]) -> str:
+    """Render archived articles in the markdown layout used by the news tools."""
+    parts = []
+    for row in rows:
+        part = f"### {row['title']} (source: {row['publisher'] or 'Unknown'})\n"
+        if row["sentiment"]:
+            part += f"Sentiment: {row['sentiment']}\n"
+        if row["summary"]:
+            part += f"{row['summary']}\n"
+        if row["url"]:
+            part += f"Link: {row['url']}\n"
+        parts.append(part + "\n")
+    return "".join(parts)
+
+
+def render_ticker_news(ticker: str, start_date: str, end_date: str) -> str:
+    rows = query_articles(ticker, start_date, end_date, TICKER_NEWS_LIMIT)
+    if not rows:
+        return f"No news found for {ticker} between {start_date} and {end_date}"
+    return f"## {ticker} News, from {start_date} to {end_date}:\n\n{format_articles(rows)}"
+
+
+def global_news_window(curr_date: str, look_back_days: int = 7) -> tuple:
+    start = datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=look_back_days)
+    return start.strftime("%Y-%m-%d"), curr_date
+
+
+def render_global_news(curr_date: str, look_back_days: int = 7, limit: int = GLOBAL_NEWS_LIMIT) -> str:
+    start_date, end_date = global_news_window(curr_date, look_back_days)
+    rows = query_articles(GLOBAL_TOPIC, start_date, end_date, limit)
+    if not rows:
+        return f"No global news found for {curr_date}"
+    return f"## Global Market News, from {start_date} to {curr_date}:\n\n{format_articles(rows)}"
+
+
+def lookup(method: str, *args, **kwargs) -> Optional[str]:
+    """Serve a news tool call from the archive if an earlier fetch covers it.
+
+    Returns None when the vendors have to be asked.
+    """
+    try:
+        if method == "get_news":
+            ticker, start_date, end_date = _bind(args, kwargs, ("ticker", "start_date", "end_date"))
+            if is_covered(ticker, start_date, end_date):
+                return render_ticker_news(ticker, start_date, end_date)
+        elif method == "get_global_news":
+            curr_date, look_back_days, limit = _bind(
+                args, kwargs, ("curr_date", "look_back_days", "limit"), (7, GLOBAL_NEWS_LIMIT)
+            )
+            start_date, end_date = global_news_window(curr_date, look_back_days)
+            if is_covered(GLOBAL_TOPIC, start_date, end_date):
+                return render_global_news(curr_date, look_back_days, limit)
+    except (sqlite3.Error, ValueError) as e:
+        logger.warning("news archive lookup failed: %s", e)
+    return None
+
+
+def _bind(args: tuple, kwargs: dict, names: tuple, defaults: tuple = ()) -> list:
+    values = list(args) + [kwargs[name] for name in names[len(args):] if name in kwargs]
+    missing = len(names) - len(values)
+    if missing > 0:
+        values += list(defaults[len(defaults) - missing:])
+    return values
+
+
+def archive_alpha_vantage_feed(response, topic: str, start_date: str, end_date: str) -> None:
+    """Append the articles of an Alpha Vantage NEWS_SENTIMENT response to the archive."""
+    try:
+        payload = json.loads(response) if isinstance(response, str) else response
+        feed = payload.get("feed") if isinstance(payload, dict) else None
+        if feed is None:
+            return
+
+        articles = []
+        for item in feed:
+            published = item.get("time_published")
+            articles.append(
+                {
+                    "title": item.get("title", ""),
+                    "summary": item.get("summary", ""),
+                    "publisher": item.get("source", ""),
+                    "link": item.get("url", ""),
+                    "pub_date": datetime.strptime(published, "%Y%m%dT%H%M%S") if published else None,
+                    "sentiment": item.get("overall_sentiment_label"),
+                }
+            )
+        add_articles(articles, topic, "alpha_vantage")
+        record_fetch(topic, start_date, end_date, "alpha_vantage")
+    except (ValueError, sqlite3.Error) as e:
+        logger.warning("failed to archive Alpha Vantage news: %s", e)
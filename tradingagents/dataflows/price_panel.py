@@ -0,0 +1,165 @@
+"""Dense, memory-mapped OHLCV panel for universe-scale computations.
+
+A panel stores ``symbols x trading days x fields`` as one float32 ``.npy``
+array with a shared date axis. It is built once from the per-symbol price
+store and then opened read-only with ``mmap_mode="r"``, so screening and
+backtest code can run vectorized computations across every symbol at once and
+any number of worker processes can map the same file without copying it.
+
+Layout of a panel directory::
+
+    panel.npy   float32 array, shape (n_symbols, n_dates, n_fields)
+    dates.npy   datetime64[D] array, shape (n_dates,)
+    panel.json  {"symbols": [...], "fields": [...]}
+
+Bars a symbol does not have (before its listing, after a delisting) are NaN.
+"""
+
+import json
+import os
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .cache_sync import atomic_write, file_lock
+from .config import get_config
+from .indicator_engine import rolling_sum
+from .price_store import get_price_history
+
+PANEL_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+
+
+def get_panel_dir(name: str = "universe") -> str:
+    """Return the directory holding the panel called ``name``."""
+    config = get_config()
+    return os.path.join(config["data_cache_dir"], "panels", name)
+
+
+def build_price_panel(
+    symbols: Iterable[str],
+    name: str = "universe",
+    fields: Sequence[str] = PANEL_FIELDS,
+    online: bool = True,
+) -> str:
+    """Build a panel from the price store and write it to disk.
+
+    Args:
+        symbols: Ticker symbols to include, in panel order
+        name: Panel name, used as the directory under ``panels/``
+        fields: Price fields to include
+        online: Whether missing or stale symbols may be refreshed from the network
+
+    Returns:
+        Path of the panel directory
+    """
+    symbols = list(dict.fromkeys(s.upper() for s in symbols))
+    fields = list(fields)
+    histories = [get_price_history(symbol, online=online) for symbol in symbols]
+
+    dates = np.unique(
+        np.concatenate(
+            [h["Date"].to_numpy(dtype="datetime64[D]") for h in histories if not h.empty]
+            or [np.array([], dtype="datetime64[D]")]
+        )
+    )
+
+    directory = get_panel_dir(name)
+    os.makedirs(directory, exist_ok=True)
+    panel_path = os.path.join(directory, "panel.npy")
+
+    # Readers take the same lock, so the three files are always seen together
+    with file_lock(panel_path):
+        with atomic_write(panel_path) as tmp_path:
+            values = np.lib.format.open_memmap(
+                tmp_path, mode="w+", dtype=np.float32, shape=(len(symbols), len(dates), len(fields))
+            )
+            values[:] = np.nan
+            for i, history in enumerate(histories):
+                if history.empty:
+                    continue
+                positions = np.searchsorted(dates, history["Date"].to_numpy(dtype="datetime64[D]"))
+                values[i, positions, :] = history[fields].to_numpy(dtype=np.float32)
+            values.flush()
+            del values
+
+        with atomic_write(os.path.join(directory, "dates.npy")) as tmp_path:
+            with open(tmp_path, "wb") as f:
+                np.save(f, dates)
+        with atomic_write(os.path.join(directory, "panel.json")) as tmp_path:
+            with open(tmp_path, "w") as f:
+                json.dump({"symbols": symbols, "fields": fields}, f)
+
+    return directory
+
+
+class PricePanel:
+    """Read-only view over a memory-mapped price panel."""
+
+    def __init__(self, directory: str):
+        panel_path = os.path.join(directory, "panel.npy")
+        with file_lock(panel_path):
+            with open(os.path.join(directory, "panel.json")) as f:
+                layout = json.load(f)
+            self.dates = pd.DatetimeIndex(np.load(os.path.join(directory, "dates.npy")))
+            # The mapping stays valid after a rebuild replaces the file
+            self.values: np.ndarray = np.load(panel_path, mmap_mode="r")
+
+        self.directory = directory
+        self.symbols: List[str] = layout["symbols"]
+        self.fields: List[str] = layout["fields"]
+        self._symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._field_index = {field: i for i, field in enumerate(self.fields)}
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def field(self, field: str = "Close") -> np.ndarray:
+        """Return a ``symbols x dates`` view of one field (no copy)."""
+        return self.values[:, :, self._field_index[field]]
+
+    def symbol_frame(self, symbol: str) -> pd.DataFrame:
+        """Return the bars of one symbol as a date-indexed DataFrame."""
+        frame = pd.DataFrame(
+            self.values[self._symbol_index[symbol.upper()]],
+            index=self.dates,
+            columns=self.fields,
+        )
+        return frame.dropna(how="all")
+
+    def date_slice(self, start: Optional[str] = None, end: Optional[str] = None) -> slice:
+        """Return the slice of the date axis covering ``[start, end]``."""
+        lo = self.dates.searchsorted(pd.Timestamp(start)) if start else 0
+        hi = self.dates.searchsorted(pd.Timestamp(end), side="right") if end else len(self.dates)
+        return slice(lo, hi)
+
+    def returns(self, field: str = "Close", periods: int = 1, log: bool = False) -> np.ndarray:
+        """Period-over-period returns for every symbol; NaN where undefined."""
+        prices = self.field(field).astype(np.float64)
+        out = np.full(prices.shape, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if log:
+                out[:, periods:] = np.log(prices[:, periods:] / prices[:, :-periods])
+            else:
+                out[:, periods:] = prices[:, periods:] / prices[:, :-periods] - 1.0
+        return out
+
+    def sma(self, window: int, field: str = "Close") -> np.ndarray:
+        """Simple moving average for every symbol, skipping missing bars.
+
+        Like the per-symbol engine, the first bars use partial windows.
+        """
+        prices = self.field(field).astype(np.float64)
+        valid = np.isfinite(prices)
+        sums = rolling_sum(np.where(valid, prices, 0.0), window)
+        counts = rolling_sum(valid.astype(np.float64), window)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = sums / counts
+        out[~valid] = np.nan
+        return out
+
+
+def load_price_panel(name: str = "universe") -> PricePanel:
+    """Open a previously built panel read-only via memory mapping."""
+    return PricePanel(get_panel_dir(name))
@@ -0,0 +1,483 @@
+"""Per-symbol columnar OHLCV store backed by Parquet.
+
+Daily price history is kept in one Parquet file per symbol, partitioned as
+``{data_cache_dir}/prices/symbol=<SYMBOL>/ohlcv.parquet``. The date column is
+stored as a timestamp and the price columns as floats, so reads go straight
+into typed pandas columns without any CSV parsing. The file is overwritten in
+place on refresh, so the cache holds exactly one copy of each symbol.
+
+Refreshes are incremental: only the bars after the last stored date are
+downloaded, together with a short overlap window. If the overlapping bars no
+longer match what is stored, a split or dividend has re-adjusted the series
+and the full history is pulled again.
+
+The metadata records the date range the store is complete for
+(``covered_from`` to ``covered_until``, end exclusive). ``get_price_range``
+serves any range inside it from disk and downloads only the missing head or
+tail otherwise.
+
+``prefetch_universe`` warms the store for a whole watchlist with batched
+multi-ticker downloads, so later graph runs only read local data.
+
+Refreshes of one symbol are coalesced within a process and serialized across
+processes with a file lock, and files are replaced atomically, so concurrent
+graphs can share one ``data_cache_dir``.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Annotated, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import yfinance as yf
+
+from .cache_sync import SingleFlight, atomic_write, file_lock
+from .config import get_config
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits"]
+HISTORY_YEARS = 15
+# Number of already-stored bars re-downloaded on each refresh to detect
+# retroactive split/dividend adjustments.
+OVERLAP_BARS = 5
+
+_METADATA_KEY = b"tradingagents"
+
+_refreshes = SingleFlight()
+
+
+def get_store_path(symbol: Annotated[str, "ticker symbol of the company"]) -> str:
+    """Return the Parquet file holding the price history of ``symbol``."""
+    config = get_config()
+    return os.path.join(
+        config["data_cache_dir"],
+        "prices",
+        f"symbol={symbol.upper()}",
+        "ohlcv.parquet",
+    )
+
+
+def read_store_metadata(symbol: str) -> Optional[dict]:
+    """Read the bookkeeping metadata of a stored symbol without loading its rows."""
+    path = get_store_path(symbol)
+    if not os.path.exists(path):
+        return None
+    metadata = pq.read_schema(path).metadata or {}
+    raw = metadata.get(_METADATA_KEY)
+    return json.loads(raw) if raw else {}
+
+
+def read_prices(symbol: str) -> Optional[pd.DataFrame]:
+    """Load the stored price history of ``symbol``, or None if it was never fetched."""
+    path = get_store_path(symbol)
+    if not os.path.exists(path):
+        return None
+    return pq.read_table(path).to_pandas()
+
+
+def write_prices(symbol: str, data: pd.DataFrame, **metadata) -> None:
+    """Persist a normalized price frame for ``symbol`` together with its metadata."""
+    path = get_store_path(symbol)
+
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), _METADATA_KEY: json.dumps(metadata).encode()}
+    )
+    with atomic_write(path) as tmp_path:
+        pq.write_table(table, tmp_path)
+
+
+def normalize_prices(data: pd.DataFrame) -> pd.DataFrame:
+    """Convert a yfinance download into the store layout (Date column + typed prices)."""
+    if data.index.tz is not None:
+        data.index = data.index.tz_localize(None)
+    data = data.reset_index()
+    data = data.rename(columns={data.columns[0]: "Date"})
+
+    for col in PRICE_COLUMNS:
+        if col not in data.columns:
+            data[col] = 0.0
+
+    data = data[["Date"] + PRICE_COLUMNS]
+    data["Date"] = pd.to_datetime(data["Date"]).astype("datetime64[ns]")
+    float_columns = [col for col in PRICE_COLUMNS if col != "Volume"]
+    data[float_columns] = data[float_columns].astype("float64")
+    data["Volume"] = data["Volume"].fillna(0).astype("int64")
+    # yfinance reports missing bars as NaN rows; they are not trading days
+    data = data.dropna(subset=["Close"])
+
+    return data.sort_values("Date").drop_duplicates("Date", keep="last").reset_index(drop=True)
+
+
+def download_prices(symbol: str, start: str, end: str) -> pd.DataFrame:
+    """Download adjusted daily bars (with dividends and splits) for ``[start, end)``."""
+    data = yf.download(
+        symbol,
+        start=start,
+        end=end,
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+        actions=True,
+    )
+    return normalize_prices(data)
+
+
+def _history_start() -> str:
+    return (pd.Timestamp.today() - pd.DateOffset(years=HISTORY_YEARS)).strftime(
+        "%Y-%m-%d"
+    )
+
+
+def _overlap_matches(cached: pd.DataFrame, fresh: pd.DataFrame) -> bool:
+    """Check that re-downloaded bars agree with the stored ones on shared dates.
+
+    Frames without shared dates (e.g. a head range before the stored history)
+    have nothing to disagree on and match.
+    """
+    columns = ["Open", "High", "Low", "Close"]
+    shared = cached.merge(fresh, on="Date", suffixes=("_cached", "_fresh"))
+    return all(
+        np.allclose(
+            shared[f"{col}_cached"], shared[f"{col}_fresh"], rtol=1e-5, equal_nan=True
+        )
+        for col in columns
+    )
+
+
+def _merge_prices(
+    symbol: str, cached: Optional[pd.DataFrame], fresh: pd.DataFrame, today_str: str
+) -> pd.DataFrame:
+    """Merge freshly downloaded bars into the cached history.
+
+    Falls back to a full re-pull only when bars both frames share disagree,
+    i.e. past adjusted prices have changed; disjoint ranges are just merged.
+    """
+    if fresh.empty:
+        return cached
+    if cached is None or cached.empty:
+        return fresh
+
+    if not _overlap_matches(cached, fresh):
+        # Re-pull everything stored so far, including bars older than the default window
+        first_date = cached["Date"].iloc[0].strftime("%Y-%m-%d")
+        return download_prices(symbol, min(_history_start(), first_date), today_str)
+
+    merged = pd.concat([cached, fresh], ignore_index=True)
+    return merged.drop_duplicates("Date", keep="last").sort_values("Date").reset_index(
+        drop=True
+    )
+
+
+def _overlap_start(cached: pd.DataFrame) -> str:
+    """First date to re-download so the refresh overlaps the stored tail."""
+    return cached["Date"].iloc[-min(OVERLAP_BARS, len(cached))].strftime("%Y-%m-%d")
+
+
+def _coverage(metadata: dict, data: Optional[pd.DataFrame]) -> tuple:
+    """Return ``(covered_from, covered_until)`` of a stored symbol.
+
+    Stores written before coverage was tracked fall back to their first bar
+    and the day of their last refresh.
+    """
+    covered_from = metadata.get("covered_from")
+    covered_until = metadata.get("covered_until") or metadata.get("fetched_on")
+    if data is not None and not data.empty:
+        if covered_from is None:
+            covered_from = data["Date"].iloc[0].strftime("%Y-%m-%d")
+        if covered_until is None:
+            covered_until = (data["Date"].iloc[-1] + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    return covered_from, covered_until
+
+
+def _union_coverage(old: tuple, start: str, end: str) -> tuple:
+    """Extend a covered range by ``[start, end)`` if the two touch."""
+    covered_from, covered_until = old
+    if covered_from is None or covered_until is None:
+        return start, end
+    if start > covered_until or end < covered_from:
+        return old
+    return min(covered_from, start), max(covered_until, end)
+
+
+def _save_history(
+    symbol: str,
+    data: pd.DataFrame,
+    today_str: str,
+    covered_from: Optional[str] = None,
+    **extra,
+) -> None:
+    write_prices(
+        symbol,
+        data,
+        **{
+            **extra,
+            "fetched_on": today_str,
+            "fetched_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "last_date": data["Date"].iloc[-1].strftime("%Y-%m-%d"),
+            "covered_from": covered_from or _history_start(),
+            "covered_until": today_str,
+        },
+    )
+
+
+def get_price_history(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    online: bool = True,
+) -> pd.DataFrame:
+    """Return the full cached daily history of ``symbol``.
+
+    The store is refreshed at most once per calendar day, downloading only
+    the missing tail when possible. With ``online=False`` only what is
+    already on disk is served.
+    """
+    symbol = symbol.upper()
+    today_str = pd.Timestamp.today().strftime("%Y-%m-%d")
+    metadata = read_store_metadata(symbol)
+
+    if not online:
+        if metadata is None:
+            raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+        return read_prices(symbol)
+
+    if metadata is not None and metadata.get("fetched_on") == today_str:
+        return read_prices(symbol)
+
+    # Threads asking for the same symbol share one download
+    return _refreshes.do(
+        get_store_path(symbol), lambda: _refresh_history(symbol, today_str)
+    )
+
+
+def _refresh_history(symbol: str, today_str: str) -> pd.DataFrame:
+    with file_lock(get_store_path(symbol)):
+        # Another process may have refreshed the symbol while we waited
+        metadata = read_store_metadata(symbol)
+        if metadata is not None and metadata.get("fetched_on") == today_str:
+            return read_prices(symbol)
+
+        cached = read_prices(symbol) if metadata is not None else None
+        if cached is not None and not cached.empty:
+            covered_from = _coverage(metadata, cached)[0]
+            fresh = download_prices(symbol, _overlap_start(cached), today_str)
+            data = _merge_prices(symbol, cached, fresh, today_str)
+        else:
+            covered_from = _history_start()
+            data = download_prices(symbol, covered_from, today_str)
+
+        if data is cached:
+            return cached
+        if data.empty:
+            return cached if cached is not None else data
+
+        _save_history(symbol, data, today_str, covered_from)
+        return data
+
+
+def _head_overlap_end(cached: pd.DataFrame) -> str:
+    """Exclusive end of a head download that overlaps the first stored bars."""
+    last_overlap = cached["Date"].iloc[min(OVERLAP_BARS, len(cached)) - 1]
+    return (last_overlap + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def _extend_head(symbol: str, start: str, today_str: str) -> None:
+    """Download the bars between ``start`` and the start of the covered range."""
+    with file_lock(get_store_path(symbol)):
+        metadata = read_store_metadata(symbol) or {}
+        cached = read_prices(symbol)
+        covered_from, covered_until = _coverage(metadata, cached)
+        if covered_from is not None and start >= covered_from:
+            return
+
+        if cached is None or cached.empty:
+            data = download_prices(symbol, start, covered_until or today_str)
+        else:
+            fresh = download_prices(symbol, start, _head_overlap_end(cached))
+            overlapping = fresh["Date"] >= cached["Date"].iloc[0]
+            if not _overlap_matches(cached, fresh):
+                # Adjustments changed since the store was filled: re-pull it all
+                data = download_prices(symbol, start, today_str)
+                if not data.empty:
+                    _save_history(symbol, data, today_str, start)
+                return
+            data = pd.concat([fresh[~overlapping], cached], ignore_index=True)
+
+        if data.empty:
+            # Nothing traded before the stored history; the range is still covered
+            data = cached if cached is not None else data
+        if data is None or data.empty:
+            return
+        write_prices(
+            symbol,
+            data,
+            **{
+                **metadata,
+                "last_date": data["Date"].iloc[-1].strftime("%Y-%m-%d"),
+                "covered_from": start,
+                "covered_until": covered_until or today_str,
+            },
+        )
+
+
+def get_price_range(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date (exclusive) in yyyy-mm-dd format"],
+    online: bool = True,
+) -> pd.DataFrame:
+    """Return the stored bars of ``symbol`` with ``start_date <= Date < end_date``.
+
+    Ranges inside the covered range are served from disk without touching
+    the network. Otherwise only the uncovered gap is downloaded: the tail
+    through today via the regular refresh, and any head before the covered
+    range with a short overlap to detect re-adjusted prices.
+    """
+    symbol = symbol.upper()
+    today_str = pd.Timestamp.today().strftime("%Y-%m-%d")
+
+    if online:
+        metadata = read_store_metadata(symbol)
+        covered_until = _coverage(metadata, None)[1] if metadata is not None else None
+        if covered_until is None or (end_date > covered_until and covered_until < today_str):
+            get_price_history(symbol)
+            metadata = read_store_metadata(symbol) or {}
+
+        covered_from = metadata.get("covered_from") or _coverage(metadata, read_prices(symbol))[0]
+        if covered_from is not None and start_date < covered_from:
+            _refreshes.do(
+                (get_store_path(symbol), "head"),
+                lambda: _extend_head(symbol, start_date, today_str),
+            )
+
+    data = get_price_history(symbol, online=False)
+    mask = (data["Date"] >= pd.Timestamp(start_date)) & (data["Date"] < pd.Timestamp(end_date))
+    return data.loc[mask].reset_index(drop=True)
+
+
+def _download_batch(symbols: List[str], start: str, end: str) -> Dict[str, pd.DataFrame]:
+    """Download several symbols in one request and split the result by symbol."""
+    data = yf.download(
+        symbols,
+        start=start,
+        end=end,
+        group_by="ticker",
+        progress=False,
+        auto_adjust=True,
+        actions=True,
+        threads=True,
+    )
+
+    frames = {}
+    for symbol in symbols:
+        if data is None or data.empty or symbol not in data.columns.get_level_values(0):
+            frames[symbol] = pd.DataFrame()
+            continue
+        frame = data[symbol].dropna(how="all", subset=["Open", "High", "Low", "Close"])
+        frames[symbol] = normalize_prices(frame) if not frame.empty else pd.DataFrame()
+    return frames
+
+
+def prefetch_universe(
+    symbols: Iterable[str],
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> Dict[str, str]:
+    """Warm the price store for a whole watchlist with batched downloads.
+
+    Symbols are fetched with multi-ticker requests and the result is split
+    into each symbol's store file. By default this refreshes the standard
+    history window exactly like ``get_price_history``: symbols already fetched
+    today are skipped, stale ones only download their missing tail, and
+    never-seen ones get the full history. An explicit ``start``/``end`` range
+    is merged into whatever is already stored; a range through today that
+    starts after the stored history also downloads the gap in between.
+
+    Args:
+        symbols: Ticker symbols to prefetch
+        start: Optional start date in yyyy-mm-dd format
+        end: Optional end date (exclusive) in yyyy-mm-dd format
+
+    Returns:
+        Dict mapping each symbol to "cached", "ok" or "failed: <reason>"
+    """
+    today_str = pd.Timestamp.today().strftime("%Y-%m-%d")
+    explicit_range = start is not None or end is not None
+    end = end or today_str
+
+    status: Dict[str, str] = {}
+    batches: Dict[str, List[str]] = {}
+
+    for symbol in dict.fromkeys(s.upper() for s in symbols):
+        metadata = read_store_metadata(symbol)
+        if not explicit_range and metadata is not None and metadata.get("fetched_on") == today_str:
+            status[symbol] = "cached"
+            continue
+
+        history = read_prices(symbol) if metadata is not None else None
+        if start is not None:
+            batch_start = start
+        elif history is not None and not history.empty:
+            batch_start = _overlap_start(history)
+        else:
+            batch_start = _history_start()
+        batches.setdefault(batch_start, []).append(symbol)
+
+    for batch_start, batch in batches.items():
+        try:
+            fresh_frames = _download_batch(batch, batch_start, end)
+        except Exception as e:
+            for symbol in batch:
+                status[symbol] = f"failed: {e}"
+            continue
+
+        for symbol in batch:
+            fresh = fresh_frames[symbol]
+            if fresh.empty:
+                status[symbol] = "failed: no data returned"
+                continue
+            try:
+                with file_lock(get_store_path(symbol)):
+                    # Merge into the latest stored history, which a concurrent
+                    # refresh may have replaced since it was read above
+                    metadata = read_store_metadata(symbol)
+                    history = read_prices(symbol) if metadata is not None else None
+                    coverage = _coverage(metadata or {}, history)
+                    partial = explicit_range and end != today_str
+                    if (
+                        not partial
+                        and history is not None
+                        and not history.empty
+                        and coverage[1] is not None
+                        and batch_start > coverage[1]
+                    ):
+                        # The store is about to be marked current through today:
+                        # download the gap between its covered range and the batch
+                        gap = download_prices(symbol, _overlap_start(history), batch_start)
+                        fresh = pd.concat([gap, fresh], ignore_index=True)
+                    data = _merge_prices(symbol, history, fresh, today_str)
+                    if partial:
+                        # Partial ranges do not make the store current
+                        covered_from, covered_until = _union_coverage(
+                            coverage, batch_start, end
+                        )
+                        write_prices(
+                            symbol,
+                            data,
+                            **{
+                                **(metadata or {}),
+                                "last_date": data["Date"].iloc[-1].strftime("%Y-%m-%d"),
+                                "covered_from": covered_from,
+                                "covered_until": covered_until,
+                            },
+                        )
+                    else:
+                        covered_from = _union_coverage(coverage, batch_start, end)[0]
+                        _save_history(symbol, data, today_str, covered_from)
+                status[symbol] = "ok"
+            except Exception as e:
+                status[symbol] = f"failed: {e}"
+
+    return status
@@ -1,9 +1,83 @@
+import threading
+from collections import OrderedDict
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
 from typing import Annotated
-import os
 from .config import get_config
+from .indicator_engine import compute_indicators
+from .price_store import get_price_history, get_store_path, read_store_metadata
+
+# Indicators exposed to the market analyst. All of them are computed together
+# the first time a symbol is requested.
+SUPPORTED_INDICATORS = (
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+    "mfi",
+)
+
+_MAX_INDICATOR_FRAMES = 64
+_indicator_frames: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+_indicator_frames_lock = threading.Lock()
+
+
+def compute_indicator_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """Compute every supported indicator over a price history in one pass.
+
+    Returns a frame indexed by trading date with one column per indicator.
+    """
+    return compute_indicators(data, SUPPORTED_INDICATORS)
+
+
+def get_indicator_frame(
+    symbol: Annotated[str, "ticker symbol for the company"],
+) -> pd.DataFrame:
+    """Return the memoized indicator frame for ``symbol``.
+
+    Frames are keyed by the symbol's store file and the time it was last
+    refreshed, so every analyst and tool call in the process shares one
+    computation until new prices arrive.
+    """
+    config = get_config()
+    online = config["data_vendors"]["technical_indicators"] != "local"
+    symbol = symbol.upper()
+
+    data = None
+    metadata = read_store_metadata(symbol)
+    today_str = pd.Timestamp.today().strftime("%Y-%m-%d")
+    if metadata is None or (online and metadata.get("fetched_on") != today_str):
+        data = get_price_history(symbol, online=online)
+        metadata = read_store_metadata(symbol)
+
+    if metadata is None:
+        # Nothing could be stored (e.g. empty download), so nothing to memoize
+        return compute_indicator_frame(data)
+
+    key = (get_store_path(symbol), metadata.get("fetched_at"))
+    with _indicator_frames_lock:
+        frame = _indicator_frames.get(key)
+        if frame is not None:
+            _indicator_frames.move_to_end(key)
+            return frame
+
+    if data is None:
+        data = get_price_history(symbol, online=online)
+    frame = compute_indicator_frame(data)
+
+    with _indicator_frames_lock:
+        _indicator_frames[key] = frame
+        while len(_indicator_frames) > _MAX_INDICATOR_FRAMES:
+            _indicator_frames.popitem(last=False)
+    return frame
 
 
 class StockstatsUtils:
@@ -17,48 +91,22 @@ class StockstatsUtils:
             str, "curr date for retrieving stock price data, YYYY-mm-dd"
         ],
     ):
-        config = get_config()
-
-        today_date = pd.Timestamp.today()
-        curr_date_dt = pd.to_datetime(curr_date)
-
-        end_date = today_date
-        start_date = today_date - pd.DateOffset(years=15)
-        start_date_str = start_date.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
+        curr_date_dt = pd.to_datetime(curr_date).normalize()
 
-        # Ensure cache directory exists
-        os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-        data_file = os.path.join(
-            config["data_cache_dir"],
-            f"{symbol}-YFin-data-{start_date_str}-{end_date_str}.csv",
-        )
-
-        if os.path.exists(data_file):
-            data = pd.read_csv(data_file)
-            data["Date"] = pd.to_datetime(data["Date"])
+        if indicator in SUPPORTED_INDICATORS:
+            series = get_indicator_frame(symbol)[indicator]
         else:
-            data = yf.download(
-                symbol,
-                start=start_date_str,
-                end=end_date_str,
-                multi_level_index=False,
-                progress=False,
-                auto_adjust=True,
+            config = get_config()
+            online = config["data_vendors"]["technical_indicators"] != "local"
+            data = get_price_history(symbol, online=online)
+            df = wrap(data)
+            series = pd.Series(
+                df[indicator].to_numpy(),  # trigger stockstats to calculate the indicator
+                index=pd.DatetimeIndex(data["Date"].to_numpy()),
             )
-            data = data.reset_index()
-            data.to_csv(data_file, index=False)
-
-        df = wrap(data)
-        df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-        curr_date_str = curr_date_dt.strftime("%Y-%m-%d")
-
-        df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date_str)]
 
-        if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
-            return indicator_value
+        position = series.index.searchsorted(curr_date_dt)
+        if position < len(series) and series.index[position] == curr_date_dt:
+            return series.iloc[position]
         else:
             return "N/A: Not a trading day (weekend or holiday)"
@@ -37,3 +37,38 @@ def get_next_weekday(date):
         return next_weekday
     else:
         return date
+
+
+def format_indicator_table(
+    symbol: str,
+    window: pd.DataFrame,
+    start_date: str,
+    end_date: str,
+    descriptions: dict,
+    notes: list = (),
+) -> str:
+    """Render indicator values as one date-by-indicator CSV table.
+
+    ``window`` is indexed by trading date with one column per indicator; rows
+    are listed newest first and each indicator's description follows once.
+    """
+    table = window.astype(float).sort_index(ascending=False)
+    table.index = table.index.strftime("%Y-%m-%d")
+    table.index.name = "Date"
+    csv_string = table.to_csv(float_format="%.4f", na_rep="N/A")
+    if table.empty:
+        csv_string += "No trading days in the specified date range.\n"
+
+    result = (
+        f"## Technical indicators for {symbol.upper()} from {start_date} to {end_date}"
+        " (trading days only, newest first):\n\n"
+        + csv_string
+        + "\n### Indicator descriptions\n"
+        + "".join(
+            f"- {name}: {descriptions.get(name, 'No description available.')}\n"
+            for name in window.columns
+        )
+    )
+    if notes:
+        result += "\n" + "".join(f"Note: {note}\n" for note in notes)
+    return result
@@ -0,0 +1,336 @@
+"""Persistent cache for vendor calls made through ``route_to_vendor``.
+
+Results are keyed by the method, the vendor and the call's normalized
+arguments (bound to the vendor function's signature with defaults applied,
+ticker symbols upper-cased), so the same question asked by another analyst
+or another run is answered from disk.
+
+Entries live in ``{data_cache_dir}/vendor_cache/cache.db``, a SQLite file
+written in transactions, so a reader never sees a partial entry. The file is
+bounded by ``max_bytes``; the least recently used entries are evicted first.
+How long an entry stays valid is set per data category in
+``config["vendor_cache"]["ttl"]``, where a tool method name overrides its
+category (``get_fundamentals`` is a live company overview, unlike the
+quarterly statements in the same category):
+
+- ``"market_close"``: until the next US market close (16:00 New York time)
+- ``"quarter"``: until the start of the next calendar quarter
+- an int: that many seconds
+- ``None`` or ``0``: not cached
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from .cache_sync import AsyncSingleFlight, SingleFlight
+from .config import get_config
+
+DEFAULT_SETTINGS = {
+    "enabled": True,
+    "max_bytes": 256 * 1024 * 1024,
+    "ttl": {
+        "core_stock_apis": "market_close",
+        "technical_indicators": "market_close",
+        "fundamental_data": "quarter",
+        "get_fundamentals": "market_close",
+        "news_data": 3600,
+    },
+}
+
+MARKET_CLOSE_HOUR = 16
+_SYMBOL_ARGS = {"symbol", "ticker"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    vendor TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+"""
+
+logger = logging.getLogger(__name__)
+
+_initialized = set()
+_stats = Counter()
+_method_stats: Dict[str, Counter] = {}
+_stats_lock = threading.Lock()
+_inflight = SingleFlight()
+_ainflight = AsyncSingleFlight()
+
+try:
+    from zoneinfo import ZoneInfo
+
+    _MARKET_TZ = ZoneInfo("America/New_York")
+except Exception:
+    # No tz database available: approximate with standard time
+    _MARKET_TZ = timezone(timedelta(hours=-5))
+
+
+def get_cache_settings() -> Dict:
+    """Return the vendor cache settings, filled in with the defaults."""
+    settings = {**DEFAULT_SETTINGS, **get_config().get("vendor_cache", {})}
+    settings["ttl"] = {**DEFAULT_SETTINGS["ttl"], **settings.get("ttl", {})}
+    return settings
+
+
+def get_cache_path() -> str:
+    """Return the SQLite file holding the vendor cache."""
+    config = get_config()
+    return os.path.join(config["data_cache_dir"], "vendor_cache", "cache.db")
+
+
+def _connect() -> sqlite3.Connection:
+    path = get_cache_path()
+    if path not in _initialized:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    if path not in _initialized:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _initialized.add(path)
+    return conn
+
+
+def _next_market_close(now: float) -> float:
+    local = datetime.fromtimestamp(now, _MARKET_TZ)
+    close = local.replace(hour=MARKET_CLOSE_HOUR, minute=0, second=0, microsecond=0)
+    if local >= close:
+        close += timedelta(days=1)
+    while close.weekday() >= 5:
+        close += timedelta(days=1)
+    return close.timestamp()
+
+
+def _next_quarter_start(now: float) -> float:
+    local = datetime.fromtimestamp(now)
+    month = 3 * ((local.month - 1) // 3) + 4
+    year = local.year + (month > 12)
+    month = month - 12 if month > 12 else month
+    return datetime(year, month, 1).timestamp()
+
+
+def ttl_for(settings: Dict, method: str, category: str):
+    """Return the TTL policy of a method: its own entry, else its category's."""
+    ttl = settings["ttl"]
+    return ttl[method] if method in ttl else ttl.get(category)
+
+
+def expiry_for(ttl, now: float) -> Optional[float]:
+    """Translate a TTL policy into an absolute expiry time, or None to skip caching."""
+    if not ttl:
+        return None
+    if ttl == "market_close":
+        return _next_market_close(now)
+    if ttl == "quarter":
+        return _next_quarter_start(now)
+    return now + float(ttl)
+
+
+def make_key(method: str, vendor: str, func: Callable, args: tuple, kwargs: dict) -> str:
+    """Build the cache key of a vendor call from its normalized arguments."""
+    try:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+    except (TypeError, ValueError):
+        arguments = {"args": list(args), **kwargs}
+
+    for name, value in arguments.items():
+        if isinstance(value, str):
+            value = value.strip()
+            arguments[name] = value.upper() if name in _SYMBOL_ARGS else value
+
+    payload = json.dumps([method, vendor, arguments], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _count(method: str, event: str) -> None:
+    with _stats_lock:
+        _stats[event] += 1
+        _method_stats.setdefault(method, Counter())[event] += 1
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Return hit/miss counters of this process, overall and per method."""
+    with _stats_lock:
+        return {
+            **{event: _stats[event] for event in ("hits", "misses", "stores", "evictions")},
+            "by_method": {method: dict(counts) for method, counts in _method_stats.items()},
+        }
+
+
+def reset_cache_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+        _method_stats.clear()
+
+
+def _cacheable(value) -> bool:
+    # Vendor functions report failures as strings; those must not stick
+    if isinstance(value, str):
+        return not value.lstrip().lower().startswith("error")
+    return isinstance(value, (dict, list))
+
+
+def get_entry(key: str, method: str):
+    """Return ``(True, value)`` for a live entry, ``(False, None)`` otherwise."""
+    now = time.time()
+    conn = _connect()
+    try:
+        with conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                _count(method, "misses")
+                return False, None
+            conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+    finally:
+        conn.close()
+
+    _count(method, "hits")
+    return True, json.loads(row[0])
+
+
+def put_entry(key: str, method: str, vendor: str, value, expires_at: float, max_bytes: int) -> None:
+    """Store an entry and evict least recently used ones beyond ``max_bytes``."""
+    payload = json.dumps(value)
+    now = time.time()
+    conn = _connect()
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries"
+                " (key, method, vendor, value, size, expires_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, method, vendor, payload, len(payload), expires_at, now),
+            )
+            conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > max_bytes:
+                evicted = 0
+                for old_key, size in conn.execute(
+                    "SELECT key, size FROM entries ORDER BY last_access"
+                ).fetchall():
+                    if total <= max_bytes:
+                        break
+                    conn.execute("DELETE FROM entries WHERE key = ?", (old_key,))
+                    total -= size
+                    evicted += 1
+                with _stats_lock:
+                    _stats["evictions"] += evicted
+    finally:
+        conn.close()
+    _count(method, "stores")
+
+
+def cached_call(
+    method: str,
+    category: str,
+    vendor: str,
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+):
+    """Call ``func`` through the cache according to the category's TTL policy."""
+    settings = get_cache_settings()
+    ttl = ttl_for(settings, method, category)
+    if not settings["enabled"] or not ttl:
+        return func(*args, **kwargs)
+
+    key = make_key(method, vendor, func, args, kwargs)
+    # Concurrent identical calls share one lookup and at most one vendor request
+    return _inflight.do(
+        key, lambda: _lookup_or_call(key, method, vendor, func, args, kwargs, settings, ttl)
+    )
+
+
+def _lookup_or_call(key, method, vendor, func, args, kwargs, settings, ttl):
+    try:
+        found, value = get_entry(key, method)
+    except sqlite3.Error as e:
+        logger.warning("vendor cache read failed: %s", e)
+        return func(*args, **kwargs)
+    if found:
+        return value
+
+    value = func(*args, **kwargs)
+
+    expires_at = expiry_for(ttl, time.time())
+    if expires_at is not None and _cacheable(value):
+        try:
+            put_entry(key, method, vendor, value, expires_at, settings["max_bytes"])
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning("vendor cache write failed: %s", e)
+    return value
+
+
+async def acached_call(
+    method: str,
+    category: str,
+    vendor: str,
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+):
+    """Async ``cached_call`` for a coroutine function ``func``.
+
+    The SQLite lookups and writes run in a worker thread.
+    """
+    settings = get_cache_settings()
+    ttl = ttl_for(settings, method, category)
+    if not settings["enabled"] or not ttl:
+        return await func(*args, **kwargs)
+
+    key = make_key(method, vendor, func, args, kwargs)
+    return await _ainflight.do(
+        key, lambda: _alookup_or_call(key, method, vendor, func, args, kwargs, settings, ttl)
+    )
+
+
+async def _alookup_or_call(key, method, vendor, func, args, kwargs, settings, ttl):
+    try:
+        found, value = await asyncio.to_thread(get_entry, key, method)
+    except sqlite3.Error as e:
+        logger.warning("vendor cache read failed: %s", e)
+        return await func(*args, **kwargs)
+    if found:
+        return value
+
+    value = await func(*args, **kwargs)
+
+    expires_at = expiry_for(ttl, time.time())
+    if expires_at is not None and _cacheable(value):
+        try:
+            await asyncio.to_thread(
+                put_entry, key, method, vendor, value, expires_at, settings["max_bytes"]
+            )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning("vendor cache write failed: %s", e)
+    return value
+
+
+def clear_cache() -> None:
+    """Drop every cached vendor result."""
+    conn = _connect()
+    try:
+        with conn:
+            conn.execute("DELETE FROM entries")
+    finally:
+        conn.close()
@@ -0,0 +1,226 @@
+"""Health tracking for data vendors used by ``route_to_vendor``.
+
+Every real vendor call (cache hits are not counted) records its latency and
+outcome per ``(vendor, method)``. A vendor that fails ``failure_threshold``
+times in a row has its circuit opened: it is moved to the back of the
+fallback chain for ``cool_down_seconds``. After that it is tried again, and
+a single further failure re-opens the circuit.
+
+With ``config["vendor_routing"]["hedge"]`` enabled, a call whose primary
+vendor has not answered within that vendor's p95 latency is also sent to the
+next healthy vendor, and whichever answers first successfully wins.
+
+Vendor functions report most failures as strings starting with "Error"
+rather than raising, so those count as failures too.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import get_config
+
+DEFAULT_SETTINGS = {
+    "failure_threshold": 3,
+    "cool_down_seconds": 60,
+    "hedge": False,
+    # Latency samples needed before the p95 is trusted for hedging
+    "hedge_min_samples": 20,
+}
+
+LATENCY_WINDOW = 200
+
+_hedge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="vendor-hedge")
+
+
+def get_routing_settings() -> Dict:
+    return {**DEFAULT_SETTINGS, **get_config().get("vendor_routing", {})}
+
+
+def is_error_result(value) -> bool:
+    """Whether a vendor return value is one of the repo's error strings."""
+    return isinstance(value, str) and value.lstrip().lower().startswith("error")
+
+
+class VendorStats:
+    """Rolling latency and error statistics plus circuit state of one vendor method."""
+
+    def __init__(self):
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.calls = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+
+    def p95(self) -> float:
+        return float(np.percentile(self.latencies, 95)) if self.latencies else float("inf")
+
+    def snapshot(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "error_rate": self.failures / self.calls if self.calls else 0.0,
+            "p50_latency": float(np.percentile(self.latencies, 50)) if self.latencies else None,
+            "p95_latency": self.p95() if self.latencies else None,
+            "circuit_open": self.open_until > time.time(),
+        }
+
+
+_stats: Dict[Tuple[str, str], VendorStats] = {}
+_lock = threading.Lock()
+
+
+def _get_stats(vendor: str, method: str) -> VendorStats:
+    key = (vendor, method)
+    stats = _stats.get(key)
+    if stats is None:
+        with _lock:
+            stats = _stats.setdefault(key, VendorStats())
+    return stats
+
+
+def record(vendor: str, method: str, latency: float, ok: bool) -> None:
+    """Record the outcome of one vendor call and update its circuit."""
+    settings = get_routing_settings()
+    stats = _get_stats(vendor, method)
+    with _lock:
+        stats.calls += 1
+        if ok:
+            stats.latencies.append(latency)
+            stats.consecutive_failures = 0
+            stats.open_until = 0.0
+            return
+        stats.failures += 1
+        stats.consecutive_failures += 1
+        if stats.consecutive_failures >= settings["failure_threshold"]:
+            stats.open_until = time.time() + settings["cool_down_seconds"]
+
+
+def is_available(vendor: str, method: str) -> bool:
+    """Whether the vendor's circuit is closed or its cool-down has passed.
+
+    After the cool-down the vendor is tried again; since its failure streak
+    is kept, one more failure re-opens the circuit right away.
+    """
+    return _get_stats(vendor, method).open_until <= time.time()
+
+
+def order_vendors(vendors: List[str], method: str) -> List[str]:
+    """Keep the configured order, moving vendors with open circuits to the back."""
+    healthy = [v for v in vendors if is_available(v, method)]
+    return healthy + [v for v in vendors if v not in healthy]
+
+
+def timed(vendor: str, method: str, func: Callable) -> Callable:
+    """Wrap a vendor function so each real call is recorded."""
+
+    @wraps(func)
+    def call(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            record(vendor, method, time.perf_counter() - start, ok=False)
+            raise
+        record(vendor, method, time.perf_counter() - start, ok=not is_error_result(result))
+        return result
+
+    return call
+
+
+def atimed(vendor: str, method: str, func: Callable) -> Callable:
+    """``timed`` for async vendor functions."""
+
+    @wraps(func)
+    async def call(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            record(vendor, method, time.perf_counter() - start, ok=False)
+            raise
+        record(vendor, method, time.perf_counter() - start, ok=not is_error_result(result))
+        return result
+
+    return call
+
+
+def hedge_delay(vendor: str, method: str) -> Optional[float]:
+    """Seconds to wait on ``vendor`` before hedging, or None when not hedging."""
+    settings = get_routing_settings()
+    if not settings["hedge"]:
+        return None
+    stats = _get_stats(vendor, method)
+    if len(stats.latencies) < settings["hedge_min_samples"]:
+        return None
+    return stats.p95()
+
+
+def _submit(func: Callable):
+    # Each task runs in a copy of the caller's context (config, run state)
+    return _hedge_executor.submit(contextvars.copy_context().run, func)
+
+
+def run_hedged(primary: Callable, secondary: Callable, delay: float):
+    """Run ``primary``; if it has not finished after ``delay`` also run ``secondary``.
+
+    Returns the first successful result. If both fail, the primary's outcome
+    (error string or exception) is returned or raised.
+    """
+    first = _submit(primary)
+    done, _ = wait([first], timeout=delay)
+    if done:
+        return first.result()
+
+    second = _submit(secondary)
+    pending = {first, second}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None and not is_error_result(future.result()):
+                return future.result()
+    return first.result()
+
+
+def _consume_outcome(task: asyncio.Task) -> None:
+    # The losing call keeps running (its result still feeds the cache); read its
+    # exception so a late failure is not reported as never retrieved
+    if not task.cancelled():
+        task.exception()
+
+
+async def arun_hedged(primary: Callable, secondary: Callable, delay: float):
+    """Async ``run_hedged``: ``primary`` and ``secondary`` return awaitables."""
+    first = asyncio.ensure_future(primary())
+    done, _ = await asyncio.wait({first}, timeout=delay)
+    if done:
+        return first.result()
+
+    second = asyncio.ensure_future(secondary())
+    pending = {first, second}
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is None and not is_error_result(task.result()):
+                for other in pending:
+                    other.add_done_callback(_consume_outcome)
+                return task.result()
+    return first.result()
+
+
+def health_report() -> Dict[str, Dict]:
+    """Latency/error statistics and circuit state per ``vendor.method``."""
+    with _lock:
+        return {f"{vendor}.{method}": stats.snapshot() for (vendor, method), stats in _stats.items()}
+
+
+def reset_health() -> None:
+    with _lock:
+        _stats.clear()
@@ -1,8 +1,10 @@
 """yfinance-based news data fetching functions."""
 
 import yfinance as yf
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
+from datetime import datetime, timezone
+
+from . import news_archive
+from .blocking_executor import to_async
 
 
 def _extract_article_data(article: dict) -> dict:
@@ -37,12 +39,13 @@ def _extract_article_data(article: dict) -> dict:
         }
     else:
         # Fallback for flat structure
+        publish_time = article.get("providerPublishTime")
         return {
             "title": article.get("title", "No title"),
             "summary": article.get("summary", ""),
             "publisher": article.get("publisher", "Unknown"),
             "link": article.get("link", ""),
-            "pub_date": None,
+            "pub_date": datetime.fromtimestamp(publish_time, tz=timezone.utc) if publish_time else None,
         }
 
 
@@ -69,34 +72,12 @@ def get_news_yfinance(
         if not news:
             return f"No news found for {ticker}"
 
-        # Parse date range for filtering
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-        news_str = ""
-        filtered_count = 0
-
-        for article in news:
-            data = _extract_article_data(article)
-
-            # Filter by date if publish time is available
-            if data["pub_date"]:
-                pub_date_naive = data["pub_date"].replace(tzinfo=None)
-                if not (start_dt <= pub_date_naive <= end_dt + relativedelta(days=1)):
-                    continue
-
-            news_str += f"### {data['title']} (source: {data['publisher']})\n"
-            if data["summary"]:
-                news_str += f"{data['summary']}\n"
-            if data["link"]:
-                news_str += f"Link: {data['link']}\n"
-            news_str += "\n"
-            filtered_count += 1
+        # Append to the local archive, which also holds earlier fetches
+        articles = [_extract_article_data(article) for article in news]
+        news_archive.add_articles(articles, ticker, "yfinance")
+        news_archive.record_fetch(ticker, start_date, end_date, "yfinance")
 
-        if filtered_count == 0:
-            return f"No news found for {ticker} between {start_date} and {end_date}"
-
-        return f"## {ticker} News, from {start_date} to {end_date}:\n\n{news_str}"
+        return news_archive.render_ticker_news(ticker, start_date, end_date)
 
     except Exception as e:
         return f"Error fetching news for {ticker}: {str(e)}"
@@ -139,17 +120,12 @@ def get_global_news_yfinance(
 
             if search.news:
                 for article in search.news:
-                    # Handle both flat and nested structures
-                    if "content" in article:
-                        data = _extract_article_data(article)
-                        title = data["title"]
-                    else:
-                        title = article.get("title", "")
+                    data = _extract_article_data(article)
 
                     # Deduplicate by title
-                    if title and title not in seen_titles:
-                        seen_titles.add(title)
-                        all_news.append(article)
+                    if data["title"] and data["title"] not in seen_titles:
+                        seen_titles.add(data["title"])
+                        all_news.append(data)
 
             if len(all_news) >= limit:
                 break
@@ -157,34 +133,16 @@ def get_global_news_yfinance(
         if not all_news:
             return f"No global news found for {curr_date}"
 
-        # Calculate date range
-        curr_dt = datetime.strptime(curr_date, "%Y-%m-%d")
-        start_dt = curr_dt - relativedelta(days=look_back_days)
-        start_date = start_dt.strftime("%Y-%m-%d")
-
-        news_str = ""
-        for article in all_news[:limit]:
-            # Handle both flat and nested structures
-            if "content" in article:
-                data = _extract_article_data(article)
-                title = data["title"]
-                publisher = data["publisher"]
-                link = data["link"]
-                summary = data["summary"]
-            else:
-                title = article.get("title", "No title")
-                publisher = article.get("publisher", "Unknown")
-                link = article.get("link", "")
-                summary = ""
-
-            news_str += f"### {title} (source: {publisher})\n"
-            if summary:
-                news_str += f"{summary}\n"
-            if link:
-                news_str += f"Link: {link}\n"
-            news_str += "\n"
-
-        return f"## Global Market News, from {start_date} to {curr_date}:\n\n{news_str}"
+        start_date, end_date = news_archive.global_news_window(curr_date, look_back_days)
+        news_archive.add_articles(all_news, news_archive.GLOBAL_TOPIC, "yfinance")
+        news_archive.record_fetch(news_archive.GLOBAL_TOPIC, start_date, end_date, "yfinance")
+
+        return news_archive.render_global_news(curr_date, look_back_days, limit)
 
     except Exception as e:
         return f"Error fetching global news: {str(e)}"
+
+
+# Async variants for async callers; yfinance blocks, so they run on its executor
+aget_news_yfinance = to_async(get_news_yfinance)
+aget_global_news_yfinance = to_async(get_global_news_yfinance)
@@ -19,6 +19,18 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Analyst data access: "tools" runs each analyst's tool-calling loop;
+    # "prefetch" fetches the market, fundamentals and news analysts' data in
+    # parallel up front and injects it into a single LLM call per analyst
+    "analyst_data_mode": "tools",
+    # Run the selected analysts concurrently (each with a private message
+    # channel) instead of one after another. Off by default because the CLI
+    # streams the analysts' shared message channel.
+    "parallel_analysts": False,
+    # Run each risk-debate round with the three risk analysts arguing
+    # concurrently against the previous round (one LLM latency per round
+    # instead of three). max_risk_discuss_rounds keeps its meaning.
+    "parallel_risk_debate": False,
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
@@ -31,4 +43,29 @@ DEFAULT_CONFIG = {
     "tool_vendors": {
         # Example: "get_stock_data": "alpha_vantage",  # Override category default
     },
+    # Vendor health: circuit breaker and optional hedged requests at p95 latency
+    "vendor_routing": {
+        "failure_threshold": 3,
+        "cool_down_seconds": 60,
+        "hedge": False,
+        "hedge_min_samples": 20,
+    },
+    # Per-key Alpha Vantage quota (free tier); keys come from ALPHA_VANTAGE_API_KEYS
+    "alpha_vantage_limits": {
+        "requests_per_minute": 5,
+        "requests_per_day": 25,
+    },
+    # Persistent cache of vendor results, keyed by method, vendor and arguments
+    "vendor_cache": {
+        "enabled": True,
+        "max_bytes": 256 * 1024 * 1024,
+        # Per-category (or per-tool) TTL: "market_close", "quarter", seconds, or None to disable
+        "ttl": {
+            "core_stock_apis": "market_close",
+            "technical_indicators": "market_close",
+            "fundamental_data": "quarter",
+            "get_fundamentals": "market_close",
+            "news_data": 3600,
+        },
+    },
 }
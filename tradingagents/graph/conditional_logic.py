@@ -65,3 +65,13 @@ class ConditionalLogic:
         if state["risk_debate_state"]["latest_speaker"].startswith("Conservative"):
             return "Neutral Analyst"
         return "Aggressive Analyst"
+
+    def should_continue_risk_round(self, state: AgentState):
+        """Determine if another parallel risk-debate round should run.
+
+        Each round adds one argument per analyst to the count, so the limit
+        means the same as in the sequential debate.
+        """
+        if state["risk_debate_state"]["count"] >= 3 * self.max_risk_discuss_rounds:
+            return "Risk Judge"
+        return ["Aggressive Analyst", "Conservative Analyst", "Neutral Analyst"]
@@ -6,10 +6,22 @@ from langgraph.graph import END, StateGraph, START
 from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
-from tradingagents.agents.utils.agent_states import AgentState
+from tradingagents.agents.utils.agent_states import AgentState, AnalystState
+from tradingagents.agents.utils.agent_utils import agent_node
 
 from .conditional_logic import ConditionalLogic
 
+# State key each analyst writes its report to
+ANALYST_REPORT_KEYS = {
+    "market": "market_report",
+    "social": "sentiment_report",
+    "news": "news_report",
+    "fundamentals": "fundamentals_report",
+}
+
+# Order in which a parallel risk-debate round is appended to the transcript
+RISK_DEBATORS = ["Aggressive", "Conservative", "Neutral"]
+
 
 class GraphSetup:
     """Handles the setup and configuration of the agent graph."""
@@ -38,7 +50,10 @@ class GraphSetup:
         self.conditional_logic = conditional_logic
 
     def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
+        self,
+        selected_analysts=["market", "social", "news", "fundamentals"],
+        parallel_analysts=False,
+        parallel_risk_debate=False,
     ):
         """Set up and compile the agent workflow graph.
 
@@ -48,6 +63,14 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            parallel_analysts (bool): Run the analysts concurrently, each in its
+                own subgraph with a private message channel, joining before the
+                Bull Researcher. By default they run one after another on the
+                shared ``messages`` channel.
+            parallel_risk_debate (bool): Let the three risk analysts argue each
+                round concurrently against the previous round's transcript, a
+                merge node appending their arguments in a fixed order. By
+                default they speak one after another.
         """
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
@@ -108,6 +131,60 @@ class GraphSetup:
         # Create workflow
         workflow = StateGraph(AgentState)
 
+        # Add other nodes
+        workflow.add_node("Bull Researcher", bull_researcher_node)
+        workflow.add_node("Bear Researcher", bear_researcher_node)
+        workflow.add_node("Research Manager", research_manager_node)
+        workflow.add_node("Trader", trader_node)
+        workflow.add_node("Risk Judge", risk_manager_node)
+
+        # Add the analysts, feeding the Bull Researcher
+        if parallel_analysts:
+            self._add_parallel_analysts(workflow, selected_analysts, analyst_nodes, tool_nodes)
+        else:
+            self._add_sequential_analysts(
+                workflow, selected_analysts, analyst_nodes, delete_nodes, tool_nodes
+            )
+
+        # Add remaining edges
+        workflow.add_conditional_edges(
+            "Bull Researcher",
+            self.conditional_logic.should_continue_debate,
+            {
+                "Bear Researcher": "Bear Researcher",
+                "Research Manager": "Research Manager",
+            },
+        )
+        workflow.add_conditional_edges(
+            "Bear Researcher",
+            self.conditional_logic.should_continue_debate,
+            {
+                "Bull Researcher": "Bull Researcher",
+                "Research Manager": "Research Manager",
+            },
+        )
+        workflow.add_edge("Research Manager", "Trader")
+
+        # Add the risk debate, feeding the Risk Judge
+        risk_debators = {
+            "Aggressive": aggressive_analyst,
+            "Conservative": conservative_analyst,
+            "Neutral": neutral_analyst,
+        }
+        if parallel_risk_debate:
+            self._add_parallel_risk_debate(workflow, risk_debators)
+        else:
+            self._add_sequential_risk_debate(workflow, risk_debators)
+
+        workflow.add_edge("Risk Judge", END)
+
+        # Compile and return
+        return workflow.compile()
+
+    def _add_sequential_analysts(
+        self, workflow, selected_analysts, analyst_nodes, delete_nodes, tool_nodes
+    ):
+        """Chain the analysts on the shared ``messages`` channel."""
         # Add analyst nodes to the graph
         for analyst_type, node in analyst_nodes.items():
             workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
@@ -116,16 +193,6 @@ class GraphSetup:
             )
             workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
 
-        # Add other nodes
-        workflow.add_node("Bull Researcher", bull_researcher_node)
-        workflow.add_node("Bear Researcher", bear_researcher_node)
-        workflow.add_node("Research Manager", research_manager_node)
-        workflow.add_node("Trader", trader_node)
-        workflow.add_node("Aggressive Analyst", aggressive_analyst)
-        workflow.add_node("Neutral Analyst", neutral_analyst)
-        workflow.add_node("Conservative Analyst", conservative_analyst)
-        workflow.add_node("Risk Judge", risk_manager_node)
-
         # Define edges
         # Start with the first analyst
         first_analyst = selected_analysts[0]
@@ -152,24 +219,63 @@ class GraphSetup:
             else:
                 workflow.add_edge(current_clear, "Bull Researcher")
 
-        # Add remaining edges
-        workflow.add_conditional_edges(
-            "Bull Researcher",
-            self.conditional_logic.should_continue_debate,
-            {
-                "Bear Researcher": "Bear Researcher",
-                "Research Manager": "Research Manager",
-            },
-        )
-        workflow.add_conditional_edges(
-            "Bear Researcher",
-            self.conditional_logic.should_continue_debate,
-            {
-                "Bull Researcher": "Bull Researcher",
-                "Research Manager": "Research Manager",
-            },
+    def _add_parallel_analysts(self, workflow, selected_analysts, analyst_nodes, tool_nodes):
+        """Start every analyst from START and join them before the Bull Researcher."""
+        analyst_names = []
+        for analyst_type in selected_analysts:
+            name = f"{analyst_type.capitalize()} Analyst"
+            subgraph = self._build_analyst_subgraph(
+                analyst_type, analyst_nodes[analyst_type], tool_nodes[analyst_type]
+            )
+            workflow.add_node(name, self._run_analyst_subgraph(analyst_type, subgraph))
+            workflow.add_edge(START, name)
+            analyst_names.append(name)
+
+        # Join barrier: the Bull Researcher runs once every analyst has reported
+        workflow.add_edge(analyst_names, "Bull Researcher")
+
+    def _build_analyst_subgraph(self, analyst_type, analyst_node, tool_node):
+        """Compile one analyst's tool-calling loop over its own message channel."""
+        analyst_name = f"{analyst_type.capitalize()} Analyst"
+        tools_name = f"tools_{analyst_type}"
+
+        subgraph = StateGraph(AnalystState)
+        subgraph.add_node(analyst_name, analyst_node)
+        subgraph.add_node(tools_name, tool_node)
+        subgraph.add_edge(START, analyst_name)
+        subgraph.add_conditional_edges(
+            analyst_name,
+            getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+            {tools_name: tools_name, f"Msg Clear {analyst_type.capitalize()}": END},
         )
-        workflow.add_edge("Research Manager", "Trader")
+        subgraph.add_edge(tools_name, analyst_name)
+        return subgraph.compile()
+
+    @staticmethod
+    def _run_analyst_subgraph(analyst_type, subgraph):
+        report_key = ANALYST_REPORT_KEYS[analyst_type]
+
+        def run_analyst(state):
+            # The subgraph runs with invoke or ainvoke, matching the outer graph
+            result = yield subgraph, {
+                "messages": [("human", state["company_of_interest"])],
+                "company_of_interest": state["company_of_interest"],
+                "trade_date": state["trade_date"],
+            }
+            # Only the report (and the analyst's final message) reach the
+            # shared state; the tool-calling conversation stays private
+            return {
+                "messages": [result["messages"][-1]],
+                report_key: result.get(report_key, ""),
+            }
+
+        return agent_node(run_analyst)
+
+    def _add_sequential_risk_debate(self, workflow, risk_debators):
+        """Let the risk analysts speak in turn: Aggressive, Conservative, Neutral."""
+        for speaker, node in risk_debators.items():
+            workflow.add_node(f"{speaker} Analyst", node)
+
         workflow.add_edge("Trader", "Aggressive Analyst")
         workflow.add_conditional_edges(
             "Aggressive Analyst",
@@ -196,7 +302,52 @@ class GraphSetup:
             },
         )
 
-        workflow.add_edge("Risk Judge", END)
+    def _add_parallel_risk_debate(self, workflow, risk_debators):
+        """Run each risk-debate round as a fan-out to all three analysts plus a merge."""
+        debator_names = []
+        for speaker, node in risk_debators.items():
+            name = f"{speaker} Analyst"
+            workflow.add_node(name, self._run_risk_debator(speaker, node))
+            workflow.add_edge("Trader", name)
+            debator_names.append(name)
+        workflow.add_node("Risk Round Merge", self._merge_risk_round)
 
-        # Compile and return
-        return workflow.compile()
+        # Join barrier: the round is merged once every analyst has argued
+        workflow.add_edge(debator_names, "Risk Round Merge")
+        workflow.add_conditional_edges(
+            "Risk Round Merge",
+            self.conditional_logic.should_continue_risk_round,
+            debator_names + ["Risk Judge"],
+        )
+
+    @staticmethod
+    def _run_risk_debator(speaker, debator_node):
+        response_key = f"current_{speaker.lower()}_response"
+
+        def run_debator(state):
+            # The debater reads the previous round from risk_debate_state; its
+            # argument goes to the round channel instead, since the three
+            # concurrent updates of risk_debate_state would conflict
+            update = yield debator_node, state
+            argument = update["risk_debate_state"][response_key]
+            return {"risk_round_responses": {speaker: argument}}
+
+        return agent_node(run_debator)
+
+    @staticmethod
+    def _merge_risk_round(state):
+        """Append the round's arguments to the debate in ``RISK_DEBATORS`` order."""
+        risk_debate_state = dict(state["risk_debate_state"])
+        responses = state["risk_round_responses"]
+        for speaker in RISK_DEBATORS:
+            argument = responses[speaker]
+            key = speaker.lower()
+            risk_debate_state["history"] = risk_debate_state.get("history", "") + "\n" + argument
+            risk_debate_state[f"{key}_history"] = (
+                risk_debate_state.get(f"{key}_history", "") + "\n" + argument
+            )
+            risk_debate_state[f"current_{key}_response"] = argument
+        risk_debate_state["latest_speaker"] = RISK_DEBATORS[-1]
+        risk_debate_state["count"] = risk_debate_state["count"] + len(RISK_DEBATORS)
+
+        return {"risk_debate_state": risk_debate_state, "risk_round_responses": None}
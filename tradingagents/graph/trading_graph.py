@@ -1,10 +1,14 @@
 # TradingAgents/graph/trading_graph.py
 
+import asyncio
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import json
 from datetime import date
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Tuple, List, Optional, Iterable, Iterator, AsyncIterator
 
 from langgraph.prebuilt import ToolNode
 
@@ -18,12 +22,14 @@ from tradingagents.agents.utils.agent_states import (
     InvestDebateState,
     RiskDebateState,
 )
-from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows import http_transport
+from tradingagents.dataflows.config import set_config, use_config
 
 # Import the new abstract tool methods from agent_utils
 from tradingagents.agents.utils.agent_utils import (
     get_stock_data,
     get_indicators,
+    get_indicators_batch,
     get_fundamentals,
     get_balance_sheet,
     get_cashflow,
@@ -62,7 +68,9 @@ class TradingAgentsGraph:
         self.config = config or DEFAULT_CONFIG
         self.callbacks = callbacks or []
 
-        # Update the interface's config
+        # Update the interface's default config (used when the compiled graph
+        # is driven directly, e.g. by the CLI); propagate() additionally pins
+        # this instance's config for the duration of each run
         set_config(self.config)
 
         # Create necessary directories
@@ -105,8 +113,32 @@ class TradingAgentsGraph:
         self.tool_nodes = self._create_tool_nodes()
 
         # Initialize components
-        self.conditional_logic = ConditionalLogic()
-        self.graph_setup = GraphSetup(
+        self.selected_analysts = list(selected_analysts)
+        self.conditional_logic = ConditionalLogic(
+            max_debate_rounds=self.config["max_debate_rounds"],
+            max_risk_discuss_rounds=self.config["max_risk_discuss_rounds"],
+        )
+        self.graph_setup = self._create_graph_setup(self.conditional_logic)
+
+        self.propagator = Propagator(self.config["max_recur_limit"])
+        self.reflector = Reflector(self.quick_thinking_llm)
+        self.signal_processor = SignalProcessor(self.quick_thinking_llm)
+
+        # Per-call state lives in the calls themselves; this only remembers
+        # the last final state of each thread for reflect_and_remember
+        self._local = threading.local()
+        self._log_lock = threading.Lock()
+
+        # Compiled graphs by (selected_analysts, max_debate_rounds,
+        # max_risk_discuss_rounds); compiled once, shared by all calls
+        self._graphs = {}
+        self._graphs_lock = threading.Lock()
+
+        # Set up the graph
+        self.graph = self.get_graph()
+
+    def _create_graph_setup(self, conditional_logic: ConditionalLogic) -> GraphSetup:
+        return GraphSetup(
             self.quick_thinking_llm,
             self.deep_thinking_llm,
             self.tool_nodes,
@@ -115,20 +147,46 @@ class TradingAgentsGraph:
             self.trader_memory,
             self.invest_judge_memory,
             self.risk_manager_memory,
-            self.conditional_logic,
+            conditional_logic,
         )
 
-        self.propagator = Propagator()
-        self.reflector = Reflector(self.quick_thinking_llm)
-        self.signal_processor = SignalProcessor(self.quick_thinking_llm)
-
-        # State tracking
-        self.curr_state = None
-        self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
+    def get_graph(
+        self,
+        selected_analysts: Optional[List[str]] = None,
+        max_debate_rounds: Optional[int] = None,
+        max_risk_discuss_rounds: Optional[int] = None,
+    ):
+        """Return the compiled graph for these settings, compiling it on first use.
 
-        # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        Unset arguments fall back to the instance's analysts and config.
+        """
+        if selected_analysts is None:
+            selected_analysts = self.selected_analysts
+        if max_debate_rounds is None:
+            max_debate_rounds = self.config["max_debate_rounds"]
+        if max_risk_discuss_rounds is None:
+            max_risk_discuss_rounds = self.config["max_risk_discuss_rounds"]
+        key = (tuple(selected_analysts), max_debate_rounds, max_risk_discuss_rounds)
+        with self._graphs_lock:
+            graph = self._graphs.get(key)
+            if graph is None:
+                analysts, debate_rounds, risk_rounds = key
+                if (debate_rounds, risk_rounds) == (
+                    self.conditional_logic.max_debate_rounds,
+                    self.conditional_logic.max_risk_discuss_rounds,
+                ):
+                    graph_setup = self.graph_setup
+                else:
+                    graph_setup = self._create_graph_setup(
+                        ConditionalLogic(debate_rounds, risk_rounds)
+                    )
+                graph = graph_setup.setup_graph(
+                    list(analysts),
+                    parallel_analysts=self.config.get("parallel_analysts", False),
+                    parallel_risk_debate=self.config.get("parallel_risk_debate", False),
+                )
+                self._graphs[key] = graph
+        return graph
 
     def _get_provider_kwargs(self) -> Dict[str, Any]:
         """Get provider-specific kwargs for LLM client creation."""
@@ -156,6 +214,7 @@ class TradingAgentsGraph:
                     get_stock_data,
                     # Technical indicators
                     get_indicators,
+                    get_indicators_batch,
                 ]
             ),
             "social": ToolNode(
@@ -183,11 +242,20 @@ class TradingAgentsGraph:
             ),
         }
 
-    def propagate(self, company_name, trade_date):
-        """Run the trading agents graph for a company on a specific date."""
+    def propagate(self, company_name, trade_date, **graph_options):
+        """Run the trading agents graph for a company on a specific date.
+
+        Safe to call concurrently on one instance. ``graph_options``
+        (``selected_analysts``, ``max_debate_rounds``,
+        ``max_risk_discuss_rounds``) override the instance's defaults for
+        this call; see ``get_graph``.
+        """
 
-        self.ticker = company_name
+        # Tools read this run's config, whatever the process-wide default is
+        with use_config(self.config):
+            return self._propagate(company_name, trade_date, self.get_graph(**graph_options))
 
+    def _propagate(self, company_name, trade_date, graph):
         # Initialize state
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
@@ -197,7 +265,7 @@ class TradingAgentsGraph:
         if self.debug:
             # Debug mode with tracing
             trace = []
-            for chunk in self.graph.stream(init_agent_state, **args):
+            for chunk in graph.stream(init_agent_state, **args):
                 if len(chunk["messages"]) == 0:
                     pass
                 else:
@@ -207,10 +275,10 @@ class TradingAgentsGraph:
             final_state = trace[-1]
         else:
             # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+            final_state = graph.invoke(init_agent_state, **args)
 
         # Store current state for reflection
-        self.curr_state = final_state
+        self._local.curr_state = final_state
 
         # Log state
         self._log_state(trade_date, final_state)
@@ -218,9 +286,118 @@ class TradingAgentsGraph:
         # Return decision and processed signal
         return final_state, self.process_signal(final_state["final_trade_decision"])
 
+    async def apropagate(self, company_name, trade_date, **graph_options):
+        """Async ``propagate``: LLM calls, tools and data fetches run on the event loop.
+
+        Many runs can share one event loop (and one instance), e.g. with
+        ``asyncio.gather``.
+        """
+        with use_config(self.config):
+            async with http_transport.client_scope():
+                return await self._apropagate(
+                    company_name, trade_date, self.get_graph(**graph_options)
+                )
+
+    async def _apropagate(self, company_name, trade_date, graph):
+        # Initialize state
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        args = self.propagator.get_graph_args()
+
+        if self.debug:
+            # Debug mode with tracing
+            trace = []
+            async for chunk in graph.astream(init_agent_state, **args):
+                if len(chunk["messages"]) == 0:
+                    pass
+                else:
+                    chunk["messages"][-1].pretty_print()
+                    trace.append(chunk)
+
+            final_state = trace[-1]
+        else:
+            # Standard mode without tracing
+            final_state = await graph.ainvoke(init_agent_state, **args)
+
+        # Store current state for reflection
+        self._local.curr_state = final_state
+
+        # Log state (file I/O off the event loop)
+        await asyncio.to_thread(self._log_state, trade_date, final_state)
+
+        # Return decision and processed signal
+        return final_state, await self.aprocess_signal(final_state["final_trade_decision"])
+
+    def propagate_many(
+        self, jobs: Iterable[Tuple[str, str]], max_concurrency: int = 3, **graph_options
+    ) -> Iterator[Dict[str, Any]]:
+        """Run many ``(ticker, trade_date)`` jobs on this instance concurrently.
+
+        All jobs share the LLM clients, the compiled graph and the data
+        caches. Results are yielded as the jobs complete, one dict per job
+        (see ``_job_result``); a failing job is reported, not raised.
+
+        Args:
+            jobs: ``(ticker, trade_date)`` pairs
+            max_concurrency: Maximum number of jobs running at once
+            graph_options: Passed to ``propagate`` for every job
+        """
+        with ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="propagate"
+        ) as executor:
+            futures = [
+                executor.submit(self._run_job, ticker, trade_date, graph_options)
+                for ticker, trade_date in jobs
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    async def apropagate_many(
+        self, jobs: Iterable[Tuple[str, str]], max_concurrency: int = 10, **graph_options
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async ``propagate_many``: the jobs share one event loop."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_job(ticker, trade_date):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    final_state, decision = await self.apropagate(
+                        ticker, trade_date, **graph_options
+                    )
+                except Exception as e:
+                    return self._job_result(ticker, trade_date, start, error=e)
+                return self._job_result(ticker, trade_date, start, final_state, decision)
+
+        # One set of HTTP clients for the whole batch, closed once it is done
+        async with http_transport.client_scope():
+            for job in asyncio.as_completed([run_job(*job) for job in jobs]):
+                yield await job
+
+    def _run_job(self, ticker, trade_date, graph_options):
+        start = time.perf_counter()
+        try:
+            final_state, decision = self.propagate(ticker, trade_date, **graph_options)
+        except Exception as e:
+            return self._job_result(ticker, trade_date, start, error=e)
+        return self._job_result(ticker, trade_date, start, final_state, decision)
+
+    @staticmethod
+    def _job_result(ticker, trade_date, start, final_state=None, decision=None, error=None):
+        return {
+            "ticker": ticker,
+            "trade_date": trade_date,
+            "final_state": final_state,
+            "decision": decision,
+            "error": error,
+            "seconds": time.perf_counter() - start,
+        }
+
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        ticker = final_state["company_of_interest"]
+        state_log = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -251,33 +428,48 @@ class TradingAgentsGraph:
         }
 
         # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
+        directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
         directory.mkdir(parents=True, exist_ok=True)
 
-        with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
-            "w",
-        ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+        with self._log_lock:
+            with open(
+                f"eval_results/{ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
+                "w",
+            ) as f:
+                json.dump({str(trade_date): state_log}, f, indent=4)
+
+    @property
+    def curr_state(self):
+        """Final state of the last ``propagate`` call made from this thread."""
+        return getattr(self._local, "curr_state", None)
 
-    def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
+    def reflect_and_remember(self, returns_losses, final_state=None):
+        """Reflect on decisions and update memory based on returns.
+
+        ``final_state`` defaults to ``curr_state``; pass it explicitly for
+        runs made concurrently on one thread (``apropagate``).
+        """
+        final_state = final_state or self.curr_state
         self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
+            final_state, returns_losses, self.bull_memory
         )
         self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
+            final_state, returns_losses, self.bear_memory
         )
         self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
+            final_state, returns_losses, self.trader_memory
         )
         self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
+            final_state, returns_losses, self.invest_judge_memory
         )
         self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+            final_state, returns_losses, self.risk_manager_memory
         )
 
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
         return self.signal_processor.process_signal(full_signal)
+
+    async def aprocess_signal(self, full_signal):
+        """Async version of ``process_signal``."""
+        return await self.signal_processor.aprocess_signal(full_signal)